@@ -1,7 +1,20 @@
 import streamlit as st
-import pandas as pd
-from datetime import datetime, timedelta
-from supabase import create_client
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from applicants import STATUS_LIST, LIST_COLUMNS, PAGE_SIZE, fetch_site_settings, save_site_settings
+from export import FORMATS as EXPORT_FORMATS, all_rows, filtered_rows, rows_by_id, export_file
+from search import search_ids
+from records import Applicant, EXP_TYPES, EQUIPMENT, parse_ts
+from aggregates import TABS, build_frame, summarize, tab_members, fetch_status_counts
+from analytics import FREQS, fetch_rollups, summary, intake, funnel, cohort_table, by_state
+from events import Compactor, current_state, fetch_events, transition_stats
+from geo import STATES, county_index, covering
+from query import RegistryQuery, SORTS
+from store import ApplicantStore
+from feed import make_feed
+from outbox import Outbox, OUTBOX_PATH
+from db import connect, is_open, health_check
+from metrics import HOST as METRICS_HOST, TRACER, span, timed, serve as serve_metrics
 
 # ── Config ──
 st.set_page_config(page_title="Vergecom | Master Control", page_icon="🏢", layout="wide")
@@ -38,480 +51,851 @@ if not st.session_state.authenticated:
                 st.error("Wrong password.")
     st.stop()
 
-supabase = create_client(st.secrets["SUPABASE_URL"], st.secrets["SUPABASE_KEY"])
-
-# ── Styles ──
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=IBM+Plex+Mono:wght@400;500;600&display=swap');
-
-    :root {
-        --bg: #F8FAFC;
-        --white: #FFFFFF;
-        --border: #E2E8F0;
-        --border-light: #F1F5F9;
-        --accent: #1E40AF;
-        --accent-light: #DBEAFE;
-        --text-1: #0F172A;
-        --text-2: #475569;
-        --text-3: #94A3B8;
-        --green: #059669;
-        --green-bg: #ECFDF5;
-        --amber: #D97706;
-        --amber-bg: #FFFBEB;
-        --red: #DC2626;
-        --red-bg: #FEF2F2;
-        --blue: #2563EB;
-        --blue-bg: #EFF6FF;
-        --purple: #7C3AED;
-        --purple-bg: #F5F3FF;
-        --cyan: #0891B2;
-        --cyan-bg: #ECFEFF;
-    }
-
-    .stApp { background: var(--bg) !important; font-family: 'DM Sans', sans-serif !important; }
-    .block-container { padding: 0 2rem 4rem !important; max-width: 1300px !important; }
-
-    /* Header */
-    .mc-header {
-        background: linear-gradient(135deg, #1E3A5F 0%, #0F172A 100%);
-        color: white;
-        padding: 1rem 1.75rem;
-        border-radius: 0 0 12px 12px;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin: -1rem -2rem 1.5rem;
-        padding-left: 2rem;
-        padding-right: 2rem;
-    }
-    .mc-brand {
-        font-size: 1.2rem;
-        font-weight: 700;
-        letter-spacing: -0.01em;
-    }
-    .mc-brand span { color: #60A5FA; }
-    .mc-status {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        font-size: 0.75rem;
-        color: #94A3B8;
-    }
-    .mc-dot {
-        width: 8px;
-        height: 8px;
-        background: #34D399;
-        border-radius: 50%;
-        animation: blink 2s ease-in-out infinite;
-    }
-    @keyframes blink { 0%,100% { opacity:1; } 50% { opacity:0.3; } }
-
-    /* KPI */
-    .kpi-row { display: grid; grid-template-columns: repeat(6, 1fr); gap: 0.6rem; margin-bottom: 1.25rem; }
-    .kpi-card {
-        background: var(--white);
-        border: 1px solid var(--border);
-        border-radius: 10px;
-        padding: 0.9rem 0.8rem;
-        text-align: center;
-    }
-    .kpi-label {
-        font-family: 'IBM Plex Mono', monospace;
-        font-size: 0.55rem;
-        font-weight: 500;
-        color: var(--text-3);
-        text-transform: uppercase;
-        letter-spacing: 0.06em;
-        margin-bottom: 0.25rem;
-    }
-    .kpi-num { font-size: 1.5rem; font-weight: 700; color: var(--text-1); line-height: 1; }
-    .kpi-sub { font-size: 0.6rem; font-weight: 500; margin-top: 0.15rem; }
-    .kpi-sub.green { color: var(--green); }
-    .kpi-sub.muted { color: var(--text-3); }
-
-    /* Cards */
-    .card {
-        background: var(--white);
-        border: 1px solid var(--border);
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-    }
-    .card-title {
-        font-size: 1rem;
-        font-weight: 700;
-        color: var(--text-1);
-        margin-bottom: 0.25rem;
-    }
-    .card-sub {
-        font-size: 0.78rem;
-        color: var(--text-3);
-        margin-bottom: 1rem;
-    }
-    .sec-label {
-        font-family: 'IBM Plex Mono', monospace;
-        font-size: 0.6rem;
-        font-weight: 600;
-        color: var(--text-3);
-        text-transform: uppercase;
-        letter-spacing: 0.06em;
-        margin-bottom: 0.5rem;
-    }
-
-    /* Applicant row */
-    .ap-card {
-        background: var(--white);
-        border: 1px solid var(--border);
-        border-radius: 10px;
-        padding: 0.85rem 1.1rem;
-        margin-bottom: 0.4rem;
-        display: grid;
-        grid-template-columns: 2fr 1fr 1.2fr 1.4fr 1fr 0.8fr;
-        align-items: center;
-        gap: 0.6rem;
-        transition: border-color 0.15s;
-    }
-    .ap-card:hover { border-color: var(--blue); }
-    .ap-name { font-size: 0.85rem; font-weight: 600; color: var(--text-1); }
-    .ap-sub { font-size: 0.7rem; color: var(--text-3); margin-top: 0.05rem; }
-    .ap-cell { font-size: 0.78rem; color: var(--text-2); }
-    .ap-mono { font-family: 'IBM Plex Mono', monospace; font-size: 0.72rem; color: var(--text-3); }
-    .ap-tag {
-        font-size: 0.58rem; font-weight: 600; padding: 0.15rem 0.4rem; border-radius: 4px;
-        display: inline-block; margin: 0.1rem 0.1rem 0.1rem 0;
-    }
-    .ap-tag.blue { background: var(--blue-bg); color: var(--blue); }
-    .s-badge {
-        font-family: 'IBM Plex Mono', monospace; font-size: 0.58rem; font-weight: 600;
-        padding: 0.2rem 0.5rem; border-radius: 5px; display: inline-block;
-    }
-    .eq-pill { font-size: 0.62rem; font-weight: 500; padding: 0.15rem 0.35rem; border-radius: 4px; display: inline-block; margin-right: 0.15rem; }
-    .eq-y { background: var(--green-bg); color: var(--green); }
-    .eq-n { background: var(--red-bg); color: var(--red); }
-
-    .list-hdr {
-        display: grid;
-        grid-template-columns: 2fr 1fr 1.2fr 1.4fr 1fr 0.8fr;
-        gap: 0.6rem;
-        padding: 0.5rem 1.1rem;
-        margin-bottom: 0.25rem;
-    }
-    .list-hdr-cell {
-        font-family: 'IBM Plex Mono', monospace;
-        font-size: 0.55rem; font-weight: 600; color: var(--text-3);
-        text-transform: uppercase; letter-spacing: 0.06em;
-    }
-
-    .empty-box {
-        background: var(--white); border: 1px dashed var(--border); border-radius: 10px;
-        text-align: center; padding: 2.5rem; color: var(--text-3); font-size: 0.85rem;
-    }
-
-    /* Detail */
-    .detail-name { font-size: 1.4rem; font-weight: 700; color: var(--text-1); }
-    .detail-date { font-size: 0.75rem; color: var(--text-3); margin-top: 0.2rem; }
-    .info-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 0.75rem; margin-bottom: 1rem; }
-    .info-box { background: var(--bg); border: 1px solid var(--border-light); border-radius: 10px; padding: 1rem; }
-    .info-box-title { font-family: 'IBM Plex Mono', monospace; font-size: 0.55rem; font-weight: 600; color: var(--blue); text-transform: uppercase; letter-spacing: 0.08em; margin-bottom: 0.6rem; }
-    .info-row { margin-bottom: 0.4rem; }
-    .info-label { font-size: 0.65rem; color: var(--text-3); }
-    .info-val { font-size: 0.85rem; color: var(--text-1); font-weight: 500; }
-
-    /* Overrides */
-    .stSelectbox div[data-baseweb="select"] > div { background: var(--white) !important; border: 1px solid var(--border) !important; border-radius: 8px !important; font-size: 0.82rem !important; }
-    .stTextInput input, .stTextArea textarea { background: var(--white) !important; border: 1px solid var(--border) !important; border-radius: 8px !important; font-size: 0.85rem !important; }
-    label { font-family: 'DM Sans', sans-serif !important; font-size: 0.78rem !important; color: var(--text-2) !important; }
-    .stMultiSelect div[data-baseweb="select"] > div { background: var(--white) !important; border: 1px solid var(--border) !important; border-radius: 8px !important; }
-    div.stButton > button { font-family: 'DM Sans', sans-serif !important; font-weight: 600 !important; border-radius: 8px !important; }
-    .stDownloadButton > button { background: var(--white) !important; color: var(--text-2) !important; border: 1px solid var(--border) !important; border-radius: 8px !important; font-size: 0.78rem !important; }
-    .stTabs [data-baseweb="tab-list"] { gap: 0; background: var(--white); border: 1px solid var(--border); border-radius: 10px; padding: 0.2rem; }
-    .stTabs [data-baseweb="tab"] { font-family: 'DM Sans', sans-serif; font-size: 0.78rem; font-weight: 500; color: var(--text-3); border-radius: 8px; padding: 0.45rem 0.9rem; }
-    .stTabs [aria-selected="true"] { background: var(--accent) !important; color: white !important; }
-    .stTabs [data-baseweb="tab-highlight"] { display: none; }
-    .stTabs [data-baseweb="tab-border"] { display: none; }
-    #MainMenu {visibility: hidden;} footer {visibility: hidden;} header {visibility: hidden;} .stDeployButton {display: none;}
-</style>
-""", unsafe_allow_html=True)
-
-# ── Header ──
-st.markdown(f"""
-<div class="mc-header">
-    <div class="mc-brand">Verge<span>com</span> &nbsp;Master Console</div>
-    <div class="mc-status"><div class="mc-dot"></div>SYSTEM ACTIVE &middot; {datetime.now().strftime("%b %d, %Y %I:%M %p")}</div>
-</div>
-""", unsafe_allow_html=True)
-
-# ── Data ──
-@st.cache_data(ttl=30)
-def load_applicants():
-    res = supabase.table("applicants").select("*").order("created_at", desc=True).execute()
-    return res.data or []
-
-@st.cache_data(ttl=60)
-def load_site_settings():
-    try:
-        res = supabase.table("site_settings").select("*").eq("id", 1).execute()
-        if res.data and len(res.data) > 0:
-            return res.data[0]
-        return None
-    except Exception as e:
-        return None
-
-def update_status(aid, s):
-    supabase.table("applicants").update({"status": s}).eq("id", aid).execute()
-def update_notes(aid, n):
-    supabase.table("applicants").update({"notes": n}).eq("id", aid).execute()
-def delete_applicant(aid):
-    supabase.table("applicants").delete().eq("id", aid).execute()
-
-if "view_id" not in st.session_state:
-    st.session_state.view_id = None
-
-data = load_applicants()
-
-# ── Helpers ──
-STATUS_LIST = ["NEW", "REVIEWED", "CONTACTED", "INTERVIEW", "HIRED", "REJECTED"]
-STATUS_BG = {"NEW":"blue","REVIEWED":"purple","CONTACTED":"amber","INTERVIEW":"cyan","HIRED":"green","REJECTED":"red"}
-
-def badge(s):
-    bg = STATUS_BG.get(s, "blue")
-    return f'<span class="s-badge" style="background:var(--{bg}-bg);color:var(--{bg});">{s}</span>'
-
-def fmt_d(iso):
-    try: return datetime.fromisoformat(iso.replace("Z","+00:00")).strftime("%b %d")
-    except: return "—"
-
-def fmt_full(iso):
-    try: return datetime.fromisoformat(iso.replace("Z","+00:00")).strftime("%b %d, %Y %I:%M %p")
-    except: return "—"
-
-def exp_tags(s):
-    if not s or s == "None selected": return ""
-    return "".join(f'<span class="ap-tag blue">{t.strip()}</span>' for t in s.split(",")[:4])
-
-def eq(r):
-    out = ""
-    for k, l in [("vehicle","Veh"),("ladder","Ldr"),("insurance","Ins")]:
-        v = r.get(k,"No")
-        c = "eq-y" if v=="Yes" else "eq-n"
-        out += f'<span class="eq-pill {c}">{"✓" if v=="Yes" else "✗"} {l}</span>'
-    return out
-
-
-# ═══════════════════════════════════════════
-#  TABS
-# ═══════════════════════════════════════════
-main_tab1, main_tab2 = st.tabs(["👥 Applicant Registry", "🛠️ Website Maintenance"])
-
-
-# ═══════════════ TAB 1: REGISTRY ═══════════════
-with main_tab1:
-
-    # ── DETAIL VIEW ──
-    if st.session_state.view_id is not None:
-        rec = next((r for r in data if str(r["id"]) == str(st.session_state.view_id)), None)
-
-        if st.button("← Back to registry"):
-            st.session_state.view_id = None
-            st.rerun()
-
-        if not rec:
-            st.error("Applicant not found.")
-            st.stop()
-
-        s = rec.get("status", "NEW")
-        exp_t = rec.get("exp_types", "")
-        et_html = " ".join(f'<span class="ap-tag blue" style="font-size:0.7rem;padding:0.2rem 0.5rem;">{t.strip()}</span>' for t in exp_t.split(",")) if exp_t and exp_t != "None selected" else '<span style="color:var(--text-3);">None</span>'
-
-        st.markdown(f"""
-        <div class="card">
-            <div style="display:flex;justify-content:space-between;align-items:flex-start;margin-bottom:1.25rem;padding-bottom:1rem;border-bottom:1px solid var(--border-light);">
-                <div>
-                    <div class="detail-name">{rec.get("name","—")}</div>
-                    <div class="detail-date">Applied {fmt_full(rec.get("created_at",""))}</div>
-                </div>
-                <div>{badge(s)}</div>
-            </div>
-            <div class="info-grid">
-                <div class="info-box">
-                    <div class="info-box-title">Contact</div>
-                    <div class="info-row"><div class="info-label">Phone</div><div class="info-val">{rec.get("phone","—")}</div></div>
-                    <div class="info-row"><div class="info-label">Email</div><div class="info-val">{rec.get("email") or "—"}</div></div>
-                </div>
-                <div class="info-box">
-                    <div class="info-box-title">Service Area</div>
-                    <div class="info-row"><div class="info-label">State</div><div class="info-val">{rec.get("state","—")}</div></div>
-                    <div class="info-row"><div class="info-label">Counties</div><div class="info-val">{rec.get("counties","—")}</div></div>
-                    <div class="info-row"><div class="info-label">Travel Radius</div><div class="info-val">{rec.get("radius","—")}</div></div>
-                </div>
-            </div>
-            <div class="info-grid">
-                <div class="info-box">
-                    <div class="info-box-title">Experience</div>
-                    <div class="info-row"><div class="info-label">Years</div><div class="info-val">{rec.get("experience","—")}</div></div>
-                    <div class="info-row"><div class="info-label">Types</div><div style="margin-top:0.2rem;">{et_html}</div></div>
-                </div>
-                <div class="info-box">
-                    <div class="info-box-title">Equipment</div>
-                    <div style="display:flex;gap:0.4rem;flex-wrap:wrap;margin-top:0.3rem;">{eq(rec)}</div>
+@st.cache_resource(validate=is_open)
+def supabase_client():
+    # One pooled client per process, shared by every session and rerun; DB_BACKEND = "sqlite"
+    # swaps in the embedded engine (localdb.py) over a local replica.
+    return connect(st.secrets)
+
+supabase = supabase_client()
+
+@st.cache_resource
+def metrics_endpoint():
+    # Prometheus scrape target at METRICS_HOST:METRICS_PORT/metrics (and /metrics.json) when configured.
+    port = st.secrets.get("METRICS_PORT")
+    return serve_metrics(int(port), host=st.secrets.get("METRICS_HOST", METRICS_HOST)) if port else None
+
+metrics_endpoint()
+# Each rerun is one span, also when st.stop() / st.rerun() cut it short. Named up front:
+# session state is off limits once st.stop() has been called.
+with span("rerun.admin." + ("list" if st.session_state.get("view_id", st.query_params.get("id")) is None else "detail")):
+
+    # ── Styles ──
+    st.markdown("""
+    <style>
+        @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=IBM+Plex+Mono:wght@400;500;600&display=swap');
+
+        :root {
+            --bg: #F8FAFC;
+            --white: #FFFFFF;
+            --border: #E2E8F0;
+            --border-light: #F1F5F9;
+            --accent: #1E40AF;
+            --accent-light: #DBEAFE;
+            --text-1: #0F172A;
+            --text-2: #475569;
+            --text-3: #94A3B8;
+            --green: #059669;
+            --green-bg: #ECFDF5;
+            --amber: #D97706;
+            --amber-bg: #FFFBEB;
+            --red: #DC2626;
+            --red-bg: #FEF2F2;
+            --blue: #2563EB;
+            --blue-bg: #EFF6FF;
+            --purple: #7C3AED;
+            --purple-bg: #F5F3FF;
+            --cyan: #0891B2;
+            --cyan-bg: #ECFEFF;
+        }
+
+        .stApp { background: var(--bg) !important; font-family: 'DM Sans', sans-serif !important; }
+        .block-container { padding: 0 2rem 4rem !important; max-width: 1300px !important; }
+
+        /* Header */
+        .mc-header {
+            background: linear-gradient(135deg, #1E3A5F 0%, #0F172A 100%);
+            color: white;
+            padding: 1rem 1.75rem;
+            border-radius: 0 0 12px 12px;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin: -1rem -2rem 1.5rem;
+            padding-left: 2rem;
+            padding-right: 2rem;
+        }
+        .mc-brand {
+            font-size: 1.2rem;
+            font-weight: 700;
+            letter-spacing: -0.01em;
+        }
+        .mc-brand span { color: #60A5FA; }
+        .mc-status {
+            display: flex;
+            align-items: center;
+            gap: 0.5rem;
+            font-size: 0.75rem;
+            color: #94A3B8;
+        }
+        .mc-dot {
+            width: 8px;
+            height: 8px;
+            background: #34D399;
+            border-radius: 50%;
+            animation: blink 2s ease-in-out infinite;
+        }
+        @keyframes blink { 0%,100% { opacity:1; } 50% { opacity:0.3; } }
+
+        /* KPI */
+        .kpi-row { display: grid; grid-template-columns: repeat(6, 1fr); gap: 0.6rem; margin-bottom: 1.25rem; }
+        .kpi-card {
+            background: var(--white);
+            border: 1px solid var(--border);
+            border-radius: 10px;
+            padding: 0.9rem 0.8rem;
+            text-align: center;
+        }
+        .kpi-label {
+            font-family: 'IBM Plex Mono', monospace;
+            font-size: 0.55rem;
+            font-weight: 500;
+            color: var(--text-3);
+            text-transform: uppercase;
+            letter-spacing: 0.06em;
+            margin-bottom: 0.25rem;
+        }
+        .kpi-num { font-size: 1.5rem; font-weight: 700; color: var(--text-1); line-height: 1; }
+        .kpi-sub { font-size: 0.6rem; font-weight: 500; margin-top: 0.15rem; }
+        .kpi-sub.green { color: var(--green); }
+        .kpi-sub.muted { color: var(--text-3); }
+
+        /* Cards */
+        .card {
+            background: var(--white);
+            border: 1px solid var(--border);
+            border-radius: 12px;
+            padding: 1.5rem;
+            margin-bottom: 1rem;
+        }
+        .card-title {
+            font-size: 1rem;
+            font-weight: 700;
+            color: var(--text-1);
+            margin-bottom: 0.25rem;
+        }
+        .card-sub {
+            font-size: 0.78rem;
+            color: var(--text-3);
+            margin-bottom: 1rem;
+        }
+        .sec-label {
+            font-family: 'IBM Plex Mono', monospace;
+            font-size: 0.6rem;
+            font-weight: 600;
+            color: var(--text-3);
+            text-transform: uppercase;
+            letter-spacing: 0.06em;
+            margin-bottom: 0.5rem;
+        }
+
+        /* Applicant row */
+        .ap-card {
+            background: var(--white);
+            border: 1px solid var(--border);
+            border-radius: 10px;
+            padding: 0.85rem 1.1rem;
+            margin-bottom: 0.4rem;
+            display: grid;
+            grid-template-columns: 2fr 1fr 1.2fr 1.4fr 1fr 0.8fr;
+            align-items: center;
+            gap: 0.6rem;
+            transition: border-color 0.15s;
+        }
+        .ap-card:hover { border-color: var(--blue); }
+        .ap-who { display: flex; align-items: center; gap: 0.6rem; min-width: 0; }
+        .ap-thumb { width: 36px; height: 36px; border-radius: 6px; object-fit: cover; flex-shrink: 0; background: var(--border); }
+        .ap-name { font-size: 0.85rem; font-weight: 600; color: var(--text-1); }
+        .ap-sub { font-size: 0.7rem; color: var(--text-3); margin-top: 0.05rem; }
+        .ap-cell { font-size: 0.78rem; color: var(--text-2); }
+        .ap-mono { font-family: 'IBM Plex Mono', monospace; font-size: 0.72rem; color: var(--text-3); }
+        .ap-tag {
+            font-size: 0.58rem; font-weight: 600; padding: 0.15rem 0.4rem; border-radius: 4px;
+            display: inline-block; margin: 0.1rem 0.1rem 0.1rem 0;
+        }
+        .ap-tag.blue { background: var(--blue-bg); color: var(--blue); }
+        .s-badge {
+            font-family: 'IBM Plex Mono', monospace; font-size: 0.58rem; font-weight: 600;
+            padding: 0.2rem 0.5rem; border-radius: 5px; display: inline-block;
+        }
+        .eq-pill { font-size: 0.62rem; font-weight: 500; padding: 0.15rem 0.35rem; border-radius: 4px; display: inline-block; margin-right: 0.15rem; }
+        .eq-y { background: var(--green-bg); color: var(--green); }
+        .eq-n { background: var(--red-bg); color: var(--red); }
+
+        .list-hdr {
+            display: grid;
+            grid-template-columns: 2fr 1fr 1.2fr 1.4fr 1fr 0.8fr;
+            gap: 0.6rem;
+            padding: 0.5rem 1.1rem;
+            margin-bottom: 0.25rem;
+        }
+        .list-hdr-cell {
+            font-family: 'IBM Plex Mono', monospace;
+            font-size: 0.55rem; font-weight: 600; color: var(--text-3);
+            text-transform: uppercase; letter-spacing: 0.06em;
+        }
+
+        .empty-box {
+            background: var(--white); border: 1px dashed var(--border); border-radius: 10px;
+            text-align: center; padding: 2.5rem; color: var(--text-3); font-size: 0.85rem;
+        }
+
+        /* Detail */
+        .detail-name { font-size: 1.4rem; font-weight: 700; color: var(--text-1); }
+        .detail-date { font-size: 0.75rem; color: var(--text-3); margin-top: 0.2rem; }
+        .info-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 0.75rem; margin-bottom: 1rem; }
+        .info-box { background: var(--bg); border: 1px solid var(--border-light); border-radius: 10px; padding: 1rem; }
+        .info-box-title { font-family: 'IBM Plex Mono', monospace; font-size: 0.55rem; font-weight: 600; color: var(--blue); text-transform: uppercase; letter-spacing: 0.08em; margin-bottom: 0.6rem; }
+        .info-row { margin-bottom: 0.4rem; }
+        .info-label { font-size: 0.65rem; color: var(--text-3); }
+        .info-val { font-size: 0.85rem; color: var(--text-1); font-weight: 500; }
+
+        /* Overrides */
+        .stSelectbox div[data-baseweb="select"] > div { background: var(--white) !important; border: 1px solid var(--border) !important; border-radius: 8px !important; font-size: 0.82rem !important; }
+        .stTextInput input, .stTextArea textarea { background: var(--white) !important; border: 1px solid var(--border) !important; border-radius: 8px !important; font-size: 0.85rem !important; }
+        label { font-family: 'DM Sans', sans-serif !important; font-size: 0.78rem !important; color: var(--text-2) !important; }
+        .stMultiSelect div[data-baseweb="select"] > div { background: var(--white) !important; border: 1px solid var(--border) !important; border-radius: 8px !important; }
+        div.stButton > button { font-family: 'DM Sans', sans-serif !important; font-weight: 600 !important; border-radius: 8px !important; }
+        .stDownloadButton > button { background: var(--white) !important; color: var(--text-2) !important; border: 1px solid var(--border) !important; border-radius: 8px !important; font-size: 0.78rem !important; }
+        .stTabs [data-baseweb="tab-list"] { gap: 0; background: var(--white); border: 1px solid var(--border); border-radius: 10px; padding: 0.2rem; }
+        .stTabs [data-baseweb="tab"] { font-family: 'DM Sans', sans-serif; font-size: 0.78rem; font-weight: 500; color: var(--text-3); border-radius: 8px; padding: 0.45rem 0.9rem; }
+        .stTabs [aria-selected="true"] { background: var(--accent) !important; color: white !important; }
+        .stTabs [data-baseweb="tab-highlight"] { display: none; }
+        .stTabs [data-baseweb="tab-border"] { display: none; }
+        .stRadio [role="radiogroup"] { gap: 0.3rem; background: var(--white); border: 1px solid var(--border); border-radius: 10px; padding: 0.35rem 0.6rem; }
+        .stRadio [role="radiogroup"] label { font-size: 0.78rem !important; font-weight: 500; margin-right: 0.6rem; }
+        #MainMenu {visibility: hidden;} footer {visibility: hidden;} header {visibility: hidden;} .stDeployButton {display: none;}
+    </style>
+    """, unsafe_allow_html=True)
+
+    # ── Header ──
+    st.markdown(f"""
+    <div class="mc-header">
+        <div class="mc-brand">Verge<span>com</span> &nbsp;Master Console</div>
+        <div class="mc-status"><div class="mc-dot"></div>SYSTEM ACTIVE &middot; {datetime.now().strftime("%b %d, %Y %I:%M %p")}</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # ── Data ──
+    PAGE_SIZE = int(st.secrets.get("REGISTRY_PAGE_SIZE", PAGE_SIZE))
+
+    SYNC_INTERVAL = 30
+    # "realtime" pushes row changes over Supabase Realtime; "local" is the in-process stand-in; "off" polls.
+    # A local SQLite replica has no Realtime; it polls unless told otherwise.
+    BACKEND = st.secrets.get("DB_BACKEND", "supabase")
+    FEED = st.secrets.get("REGISTRY_FEED", "realtime" if BACKEND == "supabase" else "off")
+    LIVE_CHECK = 1.0
+    # "replica" filters the synced store in memory; "server" pushes filters, sorting and counts to PostgREST.
+    SOURCE = st.secrets.get("REGISTRY_SOURCE", "replica")
+    AGG_MODE = st.secrets.get("REGISTRY_AGGREGATES", "server" if SOURCE == "server" else "local")
+    SEARCH_MODE = st.secrets.get("REGISTRY_SEARCH", "server" if SOURCE == "server" else "local")
+
+    @st.cache_resource
+    def change_feed():
+        feed = make_feed(FEED, st.secrets["SUPABASE_URL"], st.secrets["SUPABASE_KEY"])
+        return feed.start() if feed else None
+
+    @st.cache_resource
+    def applicant_store():
+        store = ApplicantStore(supabase)
+        if change_feed():
+            store.attach(change_feed())
+        return store
+
+    @st.fragment(run_every=LIVE_CHECK)
+    def live_watch():
+        # Checks an in-memory counter only; the page reruns when the feed has delivered changes.
+        feed = change_feed()
+        seen = st.session_state.setdefault("feed_seen", feed.version)
+        if feed.version != seen:
+            st.session_state.feed_seen = feed.version
+            if SOURCE == "server" or AGG_MODE == "server":
+                clear_server_caches()
+            st.rerun(scope="app")
+
+    @timed("store.load_applicants")
+    def load_applicants():
+        store = applicant_store()
+        store.refresh(max_age=SYNC_INTERVAL)
+        return store.ordered()
+
+    @timed("store.load_frame")
+    def load_frame():
+        store = applicant_store()
+        return store.derived("frame", lambda: build_frame(store.ordered()))
+
+    @timed("cache.load_server_counts")
+    @st.cache_data(ttl=30)
+    def load_server_counts():
+        return fetch_status_counts(supabase)
+
+    @timed("store.load_counts")
+    def load_counts():
+        if AGG_MODE == "server":
+            return load_server_counts()
+        hour = datetime.now().strftime("%Y%m%d%H")
+        return applicant_store().derived("kpis", lambda: summarize(load_frame()), tag=hour)
+
+    @timed("cache.load_server_search")
+    @st.cache_data(ttl=30)
+    def load_server_search(q):
+        return search_ids(supabase, q)
+
+    def find_ids(q):
+        if SEARCH_MODE == "server":
+            return load_server_search(q)
+        return applicant_store().search_index.search(q)
+
+    @timed("store.load_view")
+    def load_view(rq):
+        # Rows and tab memberships from one store version, so member indices always point into these rows.
+        store = applicant_store()
+        with store.pinned():
+            return store.ordered(), load_members(rq)
+
+    @timed("store.load_members")
+    def load_members(rq):
+        frame = load_frame()
+        def build():
+            mask = rq.mask(frame)
+            if rq.search:
+                mask &= frame["id"].isin(find_ids(rq.search)).to_numpy()
+            return tab_members(frame, mask, rq.order(frame))
+        return applicant_store().derived("members", build, tag=rq)
+
+    @timed("cache.load_query_counts")
+    @st.cache_data(ttl=30)
+    def load_query_counts(rq):
+        return {s: rq.count(supabase, s) for _, s in TABS}
+
+    @timed("cache.load_query_page")
+    @st.cache_data(ttl=30)
+    def load_query_page(rq, status, cursor):
+        return rq.fetch(supabase, LIST_COLUMNS, status, cursor, PAGE_SIZE)
+
+    HISTORY_LIMIT = 50
+
+    @timed("cache.load_history")
+    @st.cache_data(ttl=30)
+    def load_history(aid):
+        # Newest first; without the event log (sql/024) the section is simply hidden.
+        try:
+            return fetch_events(supabase, aid, limit=HISTORY_LIMIT, newest=True)
+        except Exception:
+            return []
+
+    @timed("cache.load_stage")
+    @st.cache_data(ttl=30)
+    def load_stage(aid):
+        # Compacted snapshot + tail of the event log; None without sql/024.
+        try:
+            return current_state(supabase, aid)
+        except Exception:
+            return None
+
+    @timed("cache.load_transition")
+    @st.cache_data(ttl=60)
+    def load_transition(frm, to, since):
+        return transition_stats(supabase, frm, to, datetime.combine(since, datetime.min.time(), timezone.utc) if since else None)
+
+    @timed("cache.load_coverage")
+    @st.cache_data(ttl=60)
+    def load_coverage(fips, lat, lon, statuses):
+        return covering(supabase, fips, lat, lon, statuses)
+
+    @timed("cache.load_rollups")
+    @st.cache_data(ttl=60)
+    def load_rollups(since):
+        return fetch_rollups(supabase, since)
+
+    def clear_row_caches(ids):
+        # Per-applicant entries only; everyone else's history stays cached.
+        for aid in ids:
+            load_history.clear(aid)
+            load_stage.clear(aid)
+
+    def clear_status_caches(ids):
+        # What a status change or delete moves: tab counts, server pages, funnel rollups and stage timings.
+        clear_row_caches(ids)
+        load_server_counts.clear()
+        load_query_counts.clear()
+        load_query_page.clear()
+        load_rollups.clear()
+        load_transition.clear()
+
+    def clear_server_caches():
+        load_history.clear()
+        load_stage.clear()
+        load_transition.clear()
+        load_coverage.clear()
+        load_rollups.clear()
+        load_server_counts.clear()
+        load_query_counts.clear()
+        load_query_page.clear()
+
+    @timed("store.load_applicant")
+    def load_applicant(aid):
+        return applicant_store().get(aid)
+
+    @timed("cache.load_health")
+    @st.cache_data(ttl=30)
+    def load_health():
+        return health_check(supabase)
+
+    @st.cache_resource
+    def event_compactor():
+        # One per process; folds the event log into snapshots so detail-view replays stay short.
+        worker = Compactor(supabase)
+        worker.start()
+        return worker
+
+    event_compactor()
+
+    @st.cache_resource
+    def submission_outbox():
+        # Same journal the public form writes to; only visible when both apps share a disk.
+        path = Path(st.secrets.get("OUTBOX_PATH", OUTBOX_PATH))
+        return Outbox(path) if path.exists() else None
+
+    @timed("cache.load_site_settings")
+    @st.cache_data(ttl=60)
+    def load_site_settings():
+        try:
+            return fetch_site_settings(supabase)
+        except Exception:
+            return None
+
+    def update_status(aid, s):
+        applicant_store().update(aid, {"status": s})
+        clear_status_caches([aid])
+    def update_notes(aid, n):
+        # Notes aren't in LIST_COLUMNS, counts or rollups; only this row's history and stage change.
+        applicant_store().update(aid, {"notes": n})
+        clear_row_caches([aid])
+    def delete_applicant(aid):
+        applicant_store().delete(aid)
+        clear_status_caches([aid])
+        load_coverage.clear()
+    def bulk_status(ids, s):
+        applicant_store().update_many(ids, {"status": s})
+        clear_status_caches(ids)
+    def bulk_delete(ids):
+        applicant_store().delete_many(ids)
+        clear_status_caches(ids)
+        load_coverage.clear()
+
+    if "view_id" not in st.session_state:
+        st.session_state.view_id = st.query_params.get("id")
+    if "reg_page" not in st.session_state:
+        st.session_state.reg_page = 0
+
+    # ── Helpers ──
+    STATUS_BG = {"NEW":"blue","REVIEWED":"purple","CONTACTED":"amber","INTERVIEW":"cyan","HIRED":"green","REJECTED":"red"}
+
+    def badge(s):
+        bg = STATUS_BG.get(s, "blue")
+        return f'<span class="s-badge" style="background:var(--{bg}-bg);color:var(--{bg});">{s}</span>'
+
+    def fmt_full(iso):
+        try: return datetime.fromisoformat(iso.replace("Z","+00:00")).strftime("%b %d, %Y %I:%M %p")
+        except: return "—"
+
+    def fmt_hours(h):
+        if h is None: return "—"
+        return f"{h:.1f} h" if h < 48 else f"{h / 24:.1f} d"
+
+    def event_line(e):
+        k = e["kind"]
+        if k == "status":
+            took = ""
+            if e.get("entered_at"):
+                took = f' after {fmt_hours((parse_ts(e["at"]) - parse_ts(e["entered_at"])).total_seconds() / 3600)}'
+            return f'{badge(e["from_status"])} → {badge(e["to_status"])}{took}'
+        if k == "notes":
+            return "Notes edited"
+        if k == "created":
+            return f'Applied {badge(e["to_status"])}'
+        if k == "imported":
+            return f'History starts {badge(e["to_status"])}'
+        return "Deleted"
+
+    def dup_tag(a):
+        if a.duplicate_of:
+            return f'<span class="ap-tag">dup of #{a.duplicate_of}</span>'
+        if a.submission_count > 1:
+            return f'<span class="ap-tag">applied ×{a.submission_count}</span>'
+        return ""
+
+    def exp_tags(exp):
+        return "".join(f'<span class="ap-tag blue">{t}</span>' for t in exp[:4])
+
+    def eq(a):
+        out = ""
+        for v, l in [(a.vehicle,"Veh"),(a.ladder,"Ldr"),(a.insurance,"Ins")]:
+            c = "eq-y" if v else "eq-n"
+            out += f'<span class="eq-pill {c}">{"✓" if v else "✗"} {l}</span>'
+        return out
+
+
+    # ═══════════════════════════════════════════
+    #  TABS
+    # ═══════════════════════════════════════════
+    # Diagnostics stays hidden unless the console is opened with ?diag=1.
+    DIAG = st.query_params.get("diag") == "1"
+    main_tabs = st.tabs(["👥 Applicant Registry", "🛠️ Website Maintenance", "📊 Funnel Analytics", "📍 Dispatch"]
+                        + (["📈 Diagnostics"] if DIAG else []))
+    main_tab1, main_tab2, main_tab3, main_tab4 = main_tabs[:4]
+
+
+    # ═══════════════ TAB 1: REGISTRY ═══════════════
+    with main_tab1:
+
+        # ── DETAIL VIEW ──
+        if st.session_state.view_id is not None:
+            with span("render.detail"):
+                try:
+                    rec = load_applicant(int(st.session_state.view_id))
+                except (TypeError, ValueError):
+                    rec = None  # a hand-edited ?id= link
+
+                if st.button("← Back to registry"):
+                    st.session_state.view_id = None
+                    st.query_params.pop("id", None)
+                    st.rerun()
+
+                if not rec:
+                    st.error("Applicant not found.")
+                    st.stop()
+
+                s = rec.status
+                et_html = " ".join(f'<span class="ap-tag blue" style="font-size:0.7rem;padding:0.2rem 0.5rem;">{t}</span>' for t in rec.exp) if rec.exp else '<span style="color:var(--text-3);">None</span>'
+
+                st.markdown(f"""
+                <div class="card">
+                    <div style="display:flex;justify-content:space-between;align-items:flex-start;margin-bottom:1.25rem;padding-bottom:1rem;border-bottom:1px solid var(--border-light);">
+                        <div>
+                            <div class="detail-name">{rec.name}</div>
+                            <div class="detail-date">Applied {rec.date_full}</div>
+                        </div>
+                        <div>{badge(s)} {dup_tag(rec)}</div>
+                    </div>
+                    <div class="info-grid">
+                        <div class="info-box">
+                            <div class="info-box-title">Contact</div>
+                            <div class="info-row"><div class="info-label">Phone</div><div class="info-val">{rec.phone}</div></div>
+                            <div class="info-row"><div class="info-label">Email</div><div class="info-val">{rec.email or "—"}</div></div>
+                        </div>
+                        <div class="info-box">
+                            <div class="info-box-title">Service Area</div>
+                            <div class="info-row"><div class="info-label">State</div><div class="info-val">{rec.state or "—"}</div></div>
+                            <div class="info-row"><div class="info-label">Counties</div><div class="info-val">{rec.counties}</div></div>
+                            <div class="info-row"><div class="info-label">Travel Radius</div><div class="info-val">{rec.radius or "—"}</div></div>
+                        </div>
+                    </div>
+                    <div class="info-grid">
+                        <div class="info-box">
+                            <div class="info-box-title">Experience</div>
+                            <div class="info-row"><div class="info-label">Years</div><div class="info-val">{rec.experience}</div></div>
+                            <div class="info-row"><div class="info-label">Types</div><div style="margin-top:0.2rem;">{et_html}</div></div>
+                        </div>
+                        <div class="info-box">
+                            <div class="info-box-title">Equipment</div>
+                            <div style="display:flex;gap:0.4rem;flex-wrap:wrap;margin-top:0.3rem;">{eq(rec)}</div>
+                        </div>
+                    </div>
                 </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+                """, unsafe_allow_html=True)
 
-        # Photos
-        p1 = rec.get("photo1_url","")
-        p2 = rec.get("photo2_url","")
-        if p1 or p2:
-            st.markdown('<div class="sec-label">Install Photos</div>', unsafe_allow_html=True)
-            c1, c2 = st.columns(2)
-            if p1:
-                with c1: st.image(p1, use_container_width=True)
-            if p2:
-                with c2: st.image(p2, use_container_width=True)
-
-        # Actions
-        st.markdown('<div class="sec-label" style="margin-top:1rem;">Actions</div>', unsafe_allow_html=True)
-        ac1, ac2 = st.columns([1, 2])
-        with ac1:
-            ci = STATUS_LIST.index(s) if s in STATUS_LIST else 0
-            ns = st.selectbox("Status", STATUS_LIST, index=ci, key="ds")
-            if st.button("Save Status", type="primary", use_container_width=True):
-                update_status(rec["id"], ns)
-                st.cache_data.clear()
-                st.success(f"→ {ns}")
-                st.rerun()
-        with ac2:
-            cn = rec.get("notes","") or ""
-            notes = st.text_area("Hiring Notes", value=cn, height=105, key="dn", placeholder="Private notes...")
-            if st.button("Save Notes", use_container_width=True):
-                update_notes(rec["id"], notes)
-                st.cache_data.clear()
-                st.success("Saved")
-                st.rerun()
+                # Photos: medium variants by default; originals only when asked for.
+                photos = [(rec.photo1_url, rec.photo1_medium_url), (rec.photo2_url, rec.photo2_medium_url)]
+                if any(orig for orig, _ in photos):
+                    st.markdown('<div class="sec-label">Install Photos</div>', unsafe_allow_html=True)
+                    full = st.toggle("Full resolution", key="dfull")
+                    for col, (orig, medium) in zip(st.columns(2), photos):
+                        if orig:
+                            with col:
+                                st.image(orig if full else medium or orig, use_container_width=True)
+                                st.markdown(f'<a class="ap-sub" href="{orig}" target="_blank">Open original ↗</a>', unsafe_allow_html=True)
 
-        st.markdown("---")
-        _, _, dc = st.columns([3, 3, 1])
-        with dc:
-            if st.button("🗑 Delete", use_container_width=True):
-                delete_applicant(rec["id"])
-                st.cache_data.clear()
-                st.session_state.view_id = None
-                st.rerun()
+                # Actions
+                st.markdown('<div class="sec-label" style="margin-top:1rem;">Actions</div>', unsafe_allow_html=True)
+                ac1, ac2 = st.columns([1, 2])
+                with ac1:
+                    ci = STATUS_LIST.index(s) if s in STATUS_LIST else 0
+                    ns = st.selectbox("Status", STATUS_LIST, index=ci, key="ds")
+                    if st.button("Save Status", type="primary", use_container_width=True):
+                        update_status(rec.id, ns)
+                        st.success(f"→ {ns}")
+                        st.rerun()
+                with ac2:
+                    cn = rec.notes
+                    notes = st.text_area("Hiring Notes", value=cn, height=105, key="dn", placeholder="Private notes...")
+                    if st.button("Save Notes", use_container_width=True):
+                        update_notes(rec.id, notes)
+                        st.success("Saved")
+                        st.rerun()
+
+                # History from the append-only event log, newest first.
+                history = load_history(rec.id)
+                if history:
+                    st.markdown('<div class="sec-label" style="margin-top:1rem;">History</div>', unsafe_allow_html=True)
+                    stage = load_stage(rec.id)
+                    if stage and stage.get("status_since") and not stage.get("deleted"):
+                        hours = (datetime.now(timezone.utc) - parse_ts(stage["status_since"])).total_seconds() / 3600
+                        moves = stage.get("moves", 0)
+                        st.markdown(f'<div class="ap-sub" style="margin-bottom:0.6rem;">In {badge(stage["status"])} since {fmt_full(stage["status_since"])} '
+                                    f'({fmt_hours(hours)}) &middot; {moves} stage move{"" if moves == 1 else "s"}</div>', unsafe_allow_html=True)
+                    st.markdown("".join(f'<div class="ap-sub" style="margin-bottom:0.35rem;">{fmt_full(e["at"])} &middot; {event_line(e)}</div>'
+                                        for e in history), unsafe_allow_html=True)
 
-    # ── LIST VIEW ──
-    else:
-        # KPIs
-        total = len(data)
-        new_ct = sum(1 for d in data if d.get("status") == "NEW")
-        cont_ct = sum(1 for d in data if d.get("status") == "CONTACTED")
-        int_ct = sum(1 for d in data if d.get("status") == "INTERVIEW")
-        hire_ct = sum(1 for d in data if d.get("status") == "HIRED")
-        rej_ct = sum(1 for d in data if d.get("status") == "REJECTED")
-        week_ct = 0
-        for d in data:
+                st.markdown("---")
+                _, _, dc = st.columns([3, 3, 1])
+                with dc:
+                    if st.button("🗑 Delete", use_container_width=True):
+                        delete_applicant(rec.id)
+                        st.session_state.view_id = None
+                        st.query_params.pop("id", None)
+                        st.rerun()
+
+        # ── LIST VIEW ──
+        else:
             try:
-                dt = datetime.fromisoformat(d.get("created_at","").replace("Z","+00:00"))
-                if dt > datetime.now(dt.tzinfo) - timedelta(days=7): week_ct += 1
-            except: pass
-
-        st.markdown(f"""
-        <div class="kpi-row">
-            <div class="kpi-card"><div class="kpi-label">Total</div><div class="kpi-num">{total}</div><div class="kpi-sub muted">all time</div></div>
-            <div class="kpi-card"><div class="kpi-label">New</div><div class="kpi-num">{new_ct}</div><div class="kpi-sub green">+{week_ct} this week</div></div>
-            <div class="kpi-card"><div class="kpi-label">Contacted</div><div class="kpi-num">{cont_ct}</div><div class="kpi-sub muted">pipeline</div></div>
-            <div class="kpi-card"><div class="kpi-label">Interview</div><div class="kpi-num">{int_ct}</div><div class="kpi-sub muted">scheduled</div></div>
-            <div class="kpi-card"><div class="kpi-label">Hired</div><div class="kpi-num">{hire_ct}</div><div class="kpi-sub green">onboarded</div></div>
-            <div class="kpi-card"><div class="kpi-label">Rejected</div><div class="kpi-num">{rej_ct}</div><div class="kpi-sub muted">declined</div></div>
-        </div>
-        """, unsafe_allow_html=True)
+                data = load_applicants() if SOURCE == "replica" else None
+            except Exception as e:
+                st.warning(f"⚠️ Applicant sync failed ({e}). Run the migrations below in Supabase SQL Editor, in order:")
+                for f in sorted((Path(__file__).parent / "sql").glob("*.sql")):
+                    st.code(f.read_text(), language="sql")
+                st.stop()
+
+            if change_feed():
+                live_watch()
+
+            # KPIs
+            with span("render.kpis"):
+                counts = load_counts()
+                total = counts["total"]
+                new_ct, cont_ct, int_ct = counts["NEW"], counts["CONTACTED"], counts["INTERVIEW"]
+                hire_ct, rej_ct, week_ct = counts["HIRED"], counts["REJECTED"], counts["week"]
 
-        # Filters
-        f1, f2, f3, f4 = st.columns([2, 1.3, 1.3, 0.8])
-        with f1: search = st.text_input("Search", key="s", label_visibility="collapsed", placeholder="Search name or phone...")
-        with f2: sf = st.multiselect("Status", STATUS_LIST, default=[], key="sf", placeholder="All statuses")
-        with f3: ef = st.multiselect("Exp", ["Starlink","DirecTV","Dish Network","HughesNet","Low Voltage","TV Mounting","Cable Installation","Other"], default=[], key="ef", placeholder="All experience")
-        with f4:
-            if data:
-                csv = pd.DataFrame(data).to_csv(index=False).encode("utf-8")
-                st.download_button("Export CSV", csv, "applicants.csv", "text/csv", use_container_width=True)
-
-        filtered = data
-        if search:
-            q = search.lower()
-            filtered = [d for d in filtered if q in d.get("name","").lower() or q in d.get("phone","").lower()]
-        if sf: filtered = [d for d in filtered if d.get("status") in sf]
-        if ef: filtered = [d for d in filtered if any(e in d.get("exp_types","") for e in ef)]
-
-        # Tabs
-        tabs = st.tabs([
-            f"All  {len(filtered)}",
-            f"New  {sum(1 for d in filtered if d.get('status')=='NEW')}",
-            f"Contacted  {sum(1 for d in filtered if d.get('status')=='CONTACTED')}",
-            f"Interview  {sum(1 for d in filtered if d.get('status')=='INTERVIEW')}",
-            f"Hired  {sum(1 for d in filtered if d.get('status')=='HIRED')}",
-            f"Rejected  {sum(1 for d in filtered if d.get('status')=='REJECTED')}",
-        ])
-
-        def render(apps, kp):
-            if not apps:
-                st.markdown('<div class="empty-box">No applicants here yet.</div>', unsafe_allow_html=True)
-                return
-            st.markdown("""<div class="list-hdr">
-                <div class="list-hdr-cell">Applicant</div>
-                <div class="list-hdr-cell">Phone</div>
-                <div class="list-hdr-cell">Location</div>
-                <div class="list-hdr-cell">Experience</div>
-                <div class="list-hdr-cell">Equipment</div>
-                <div class="list-hdr-cell">Date</div>
-            </div>""", unsafe_allow_html=True)
-
-            for a in apps:
-                loc = f"{a.get('counties','—')}, {a.get('state','')}" if a.get('state') else a.get('counties','—')
                 st.markdown(f"""
-                <div class="ap-card">
-                    <div><div class="ap-name">{a.get("name","—")}</div><div class="ap-sub">{a.get("email") or "—"} &nbsp;{badge(a.get("status","NEW"))}</div></div>
-                    <div class="ap-mono">{a.get("phone","—")}</div>
-                    <div><div class="ap-cell">{loc}</div><div class="ap-sub">{a.get("radius","")}</div></div>
-                    <div><div class="ap-cell">{a.get("experience","—")}</div><div class="ap-sub" style="margin-top:0.15rem;">{exp_tags(a.get("exp_types",""))}</div></div>
-                    <div>{eq(a)}</div>
-                    <div class="ap-mono">{fmt_d(a.get("created_at",""))}</div>
+                <div class="kpi-row">
+                    <div class="kpi-card"><div class="kpi-label">Total</div><div class="kpi-num">{total}</div><div class="kpi-sub muted">all time</div></div>
+                    <div class="kpi-card"><div class="kpi-label">New</div><div class="kpi-num">{new_ct}</div><div class="kpi-sub green">+{week_ct} this week</div></div>
+                    <div class="kpi-card"><div class="kpi-label">Contacted</div><div class="kpi-num">{cont_ct}</div><div class="kpi-sub muted">pipeline</div></div>
+                    <div class="kpi-card"><div class="kpi-label">Interview</div><div class="kpi-num">{int_ct}</div><div class="kpi-sub muted">scheduled</div></div>
+                    <div class="kpi-card"><div class="kpi-label">Hired</div><div class="kpi-num">{hire_ct}</div><div class="kpi-sub green">onboarded</div></div>
+                    <div class="kpi-card"><div class="kpi-label">Rejected</div><div class="kpi-num">{rej_ct}</div><div class="kpi-sub muted">declined</div></div>
                 </div>
                 """, unsafe_allow_html=True)
-                if st.button(f"View {a.get('name','—')}", key=f"{kp}_{a['id']}", use_container_width=True):
-                    st.session_state.view_id = a["id"]
+
+            # Filters
+            f1, f2, f3, f5, f4 = st.columns([2, 1.2, 1.2, 1.1, 0.8])
+            with f1: search = st.text_input("Search", key="s", label_visibility="collapsed", placeholder="Search name, phone, email or county...")
+            with f2: sf = st.multiselect("Status", STATUS_LIST, default=[], key="sf", placeholder="All statuses")
+            with f3: ef = st.multiselect("Exp", EXP_TYPES, default=[], key="ef", placeholder="All experience")
+            with f5: qf = st.multiselect("Equipment", [k for k, _ in EQUIPMENT], default=[], key="qf", format_func=dict(EQUIPMENT).get, placeholder="Any equipment")
+            g1, g2, _ = st.columns([1.4, 1, 2.6])
+            with g1: dr = st.date_input("Applied between", value=(), key="dr", label_visibility="collapsed", format="MM/DD/YYYY")
+            with g2: sort = st.selectbox("Sort", list(SORTS), key="sort", label_visibility="collapsed", format_func=lambda k: f"Sort: {k}")
+            rq = RegistryQuery(search.strip(), tuple(sf), tuple(ef), tuple(qf),
+                               dr[0] if len(dr) > 0 else None, dr[1] if len(dr) > 1 else None, sort)
+            if SOURCE == "server":
+                tab_counts = load_query_counts(rq)
+            else:
+                data, members = load_view(rq)
+                tab_counts = {s: len(ix) for s, ix in members.items()}
+
+            # Export — rows are streamed page by page only when Download is clicked
+            with f4:
+                with st.popover("Export", use_container_width=True):
+                    fmt = st.selectbox("Format", list(EXPORT_FORMATS), key="xf")
+                    if not st.checkbox("Current filter only", key="xo"):
+                        source = lambda: all_rows(supabase)
+                    elif SOURCE == "server":
+                        source = lambda: filtered_rows(supabase, rq)
+                    else:
+                        source = lambda: rows_by_id(supabase, [data[j].id for j in members[None]])
+                    fname, mime = EXPORT_FORMATS[fmt]
+                    st.download_button("Download", lambda: timed(f"export.{fmt}")(export_file)(source(), fmt), fname, mime,
+                                       on_click="ignore", use_container_width=True)
+
+            # Tabs — only the selected one is built, one page at a time
+            tab_i = st.radio("Registry view", range(len(TABS)), key="reg_tab", horizontal=True, label_visibility="collapsed",
+                             format_func=lambda i: f"{TABS[i][0]}  {tab_counts[TABS[i][1]]}")
+            tab_status = TABS[tab_i][1]
+            n_rows = tab_counts[tab_status]
+            n_pages = max(1, -(-n_rows // PAGE_SIZE))
+            view_sig = (rq, tab_i)
+            if st.session_state.get("reg_sig") != view_sig:
+                st.session_state.reg_sig = view_sig
+                st.session_state.reg_page = 0
+                # Server pages are fetched by keyset: reg_cursors[p] starts page p.
+                st.session_state.reg_cursors = [None]
+                for k in [k for k in st.session_state if str(k).startswith("bulk_all_")]:
+                    del st.session_state[k]
+            page = min(st.session_state.reg_page, n_pages - 1)
+            if SOURCE == "server":
+                page = min(page, len(st.session_state.reg_cursors) - 1)
+            # A pending bulk confirmation only stands for the tab, page and filter it was asked on.
+            if (st.session_state.get("bulk_confirm") or {}).get("view") != (view_sig, page):
+                st.session_state.pop("bulk_confirm", None)
+
+            def thumb(a):
+                # Thumbnails only; the browser fetches them as rows scroll into view.
+                if not a.photo1_thumb_url:
+                    return ""
+                return f'<img class="ap-thumb" src="{a.photo1_thumb_url}" loading="lazy" decoding="async" alt="">'
+
+            def card(a):
+                return (f'<div class="ap-card">'
+                        f'<div class="ap-who">{thumb(a)}<div><div class="ap-name">{a.name}</div><div class="ap-sub">{a.email or "—"} &nbsp;{badge(a.status)} {dup_tag(a)}</div></div></div>'
+                        f'<div class="ap-mono">{a.phone}</div>'
+                        f'<div><div class="ap-cell">{a.location}</div><div class="ap-sub">{a.radius}</div></div>'
+                        f'<div><div class="ap-cell">{a.experience}</div><div class="ap-sub" style="margin-top:0.15rem;">{exp_tags(a.exp)}</div></div>'
+                        f'<div>{eq(a)}</div>'
+                        f'<div class="ap-mono">{a.date_short}</div>'
+                        f'</div>')
+
+            @timed("render.list")
+            def render(apps):
+                if not apps:
+                    st.markdown('<div class="empty-box">No applicants here yet.</div>', unsafe_allow_html=True)
+                    return
+                st.markdown("""<div class="list-hdr">
+                    <div class="list-hdr-cell">Applicant</div>
+                    <div class="list-hdr-cell">Phone</div>
+                    <div class="list-hdr-cell">Location</div>
+                    <div class="list-hdr-cell">Experience</div>
+                    <div class="list-hdr-cell">Equipment</div>
+                    <div class="list-hdr-cell">Date</div>
+                </div>""", unsafe_allow_html=True)
+                st.markdown("".join(card(a) for a in apps), unsafe_allow_html=True)
+
+                by_id = {a.id: a for a in apps}
+                pick = st.selectbox("Open applicant", list(by_id), index=None, key=f"open_{tab_i}_{page}",
+                                    format_func=lambda i: f"{by_id[i].name} · {by_id[i].phone}", placeholder="Open applicant...")
+                if pick is not None:
+                    st.session_state.view_id = pick
+                    st.query_params["id"] = str(pick)
                     st.rerun()
 
-        tab_filters = [
-            lambda d: True,
-            lambda d: d.get("status") == "NEW",
-            lambda d: d.get("status") == "CONTACTED",
-            lambda d: d.get("status") == "INTERVIEW",
-            lambda d: d.get("status") == "HIRED",
-            lambda d: d.get("status") == "REJECTED",
-        ]
-        tab_keys = ["all","new","cont","int","hire","rej"]
-        for i, tab in enumerate(tabs):
-            with tab:
-                render([d for d in filtered if tab_filters[i](d)], tab_keys[i])
+                # Bulk actions: one chunked in_() write per batch, caches patched once.
+                sel_key, all_key = f"bulk_{tab_i}_{page}", f"bulk_all_{tab_i}"
+                def clear_bulk():
+                    for k in ("bulk_confirm", sel_key, all_key):
+                        st.session_state.pop(k, None)
+                b1, b2, b3, b4 = st.columns([3, 1.3, 1.3, 1])
+                with b1:
+                    picked = st.multiselect("Select applicants", list(by_id), key=sel_key, placeholder="Select applicants...",
+                                            format_func=lambda i: f"{by_id[i].name} · {by_id[i].phone}", label_visibility="collapsed")
+                    whole_tab = st.checkbox(f"All {n_rows} in this tab", key=all_key)
+                # The whole tab's ids are only walked once an action is asked for, not to label buttons.
+                n_sel = n_rows if whole_tab else len(picked)
+                with b2:
+                    bs = st.selectbox("Set status", STATUS_LIST, key="bulk_status", label_visibility="collapsed")
+                with b3:
+                    if st.button(f"Set status ({n_sel})", use_container_width=True, disabled=not n_sel):
+                        if whole_tab:
+                            # Whole-tab edits are confirmed like deletes; a picked handful goes straight through.
+                            st.session_state.bulk_confirm = {"action": "status", "status": bs, "ids": tab_ids(),
+                                                             "view": (view_sig, page)}
+                        else:
+                            bulk_status(picked, bs)
+                            clear_bulk()
+                            st.rerun()
+                with b4:
+                    if st.button(f"🗑 Delete ({n_sel})", use_container_width=True, disabled=not n_sel):
+                        st.session_state.bulk_confirm = {"action": "delete", "ids": tab_ids() if whole_tab else list(picked),
+                                                         "view": (view_sig, page)}
+                pending = st.session_state.get("bulk_confirm")
+                if pending:
+                    n = len(pending["ids"])
+                    who = f"{n} applicant{'s' if n != 1 else ''}"
+                    deleting = pending["action"] == "delete"
+                    st.warning(f"Delete {who}? This cannot be undone." if deleting else f"Set {who} to {pending['status']}?")
+                    c1, c2, _ = st.columns([1, 1, 4])
+                    if c1.button("Delete" if deleting else "Set status", key="bulk_ok", type="primary", use_container_width=True):
+                        if deleting:
+                            bulk_delete(pending["ids"])
+                        else:
+                            bulk_status(pending["ids"], pending["status"])
+                        clear_bulk()
+                        st.rerun()
+                    if c2.button("Cancel", key="bulk_cancel", use_container_width=True):
+                        del st.session_state["bulk_confirm"]
+                        st.rerun()
 
+            def tab_ids():
+                if SOURCE != "server":
+                    return [data[j].id for j in members[tab_status]]
+                ids, cursor = [], None
+                while True:
+                    rows, cursor = rq.fetch(supabase, ("id",), tab_status, cursor, 1000)
+                    ids += [r["id"] for r in rows]
+                    if cursor is None:
+                        return ids
 
-# ═══════════════ TAB 2: WEBSITE MAINTENANCE ═══════════════
-with main_tab2:
+            if SOURCE == "server":
+                rows, nxt = load_query_page(rq, tab_status, st.session_state.reg_cursors[page])
+                if nxt and len(st.session_state.reg_cursors) == page + 1:
+                    st.session_state.reg_cursors.append(nxt)
+                render([Applicant.from_row(r) for r in rows])
+            else:
+                render([data[j] for j in members[tab_status][page * PAGE_SIZE:(page + 1) * PAGE_SIZE]])
+
+            if n_pages > 1:
+                pg1, pg2, pg3 = st.columns([1, 4, 1])
+                with pg1:
+                    if st.button("← Prev", use_container_width=True, disabled=page == 0):
+                        st.session_state.reg_page = page - 1
+                        st.rerun()
+                with pg2:
+                    st.markdown(f'<div style="font-size:0.72rem;color:var(--text-3);text-align:center;margin-top:0.6rem;">Page {page + 1} of {n_pages} &middot; {n_rows} applicants</div>', unsafe_allow_html=True)
+                with pg3:
+                    if st.button("Next →", use_container_width=True, disabled=page >= n_pages - 1):
+                        st.session_state.reg_page = page + 1
+                        st.rerun()
+
+            ok, ms, err = load_health()
+            health = f'{"Supabase" if BACKEND == "supabase" else "Local replica"} {"reachable" if ok else "unreachable: " + err} &middot; {ms:.0f} ms'
+            if change_feed():
+                health += f' &middot; live feed {"connected" if change_feed().live else "reconnecting (polling)"}, {change_feed().events} events'
+            box = submission_outbox()
+            if box is not None:
+                ob = box.stats()
+                lat = f'{ob["p50_ms"]:.0f} / {ob["p95_ms"]:.0f} ms p50/p95' if ob["flushes"] else "no flushes yet"
+                health += f' &middot; outbox {ob["depth"]} pending (oldest {ob["oldest_s"]:.0f}s, {ob["retrying"]} retrying) &middot; flush latency {lat}'
+                if ob["last_error"]:
+                    health += f' &middot; last error: {ob["last_error"][:120]}'
+            st.markdown(f'<div style="font-size:0.72rem;color:var(--text-3);margin-top:0.6rem;">{health}</div>', unsafe_allow_html=True)
+
+            if SOURCE == "replica":
+                store = applicant_store()
+                sc1, sc2 = st.columns([5, 1])
+                with sc1:
+                    st.markdown(f'<div style="font-size:0.72rem;color:var(--text-3);margin-top:0.6rem;">Synced {len(store)} rows &middot; high-water mark {fmt_full(store.hwm or "")} &middot; {store.stats["delta"]} delta / {store.stats["full"]} full syncs &middot; row cache {store.stats["hits"]} hits / {store.stats["misses"]} misses / {store.stats["writes"]} writes</div>', unsafe_allow_html=True)
+                with sc2:
+                    if st.button("Full resync", use_container_width=True):
+                        store.resync()
+                        clear_server_caches()
+                        st.rerun()
 
-    st.markdown("""
-    <div class="card">
-        <div class="card-title">Website Content Editor</div>
-        <div class="card-sub">Edit the live job listing text that applicants see on the public site. Changes go live immediately.</div>
-    </div>
-    """, unsafe_allow_html=True)
 
-    curr = load_site_settings()
+    # ═══════════════ TAB 2: WEBSITE MAINTENANCE ═══════════════
+    with main_tab2:
 
-    if curr is None:
-        st.warning("⚠️ No `site_settings` table found. Run this SQL in Supabase SQL Editor to create it:")
-        st.code("""CREATE TABLE site_settings (
+        st.markdown("""
+        <div class="card">
+            <div class="card-title">Website Content Editor</div>
+            <div class="card-sub">Edit the live job listing text that applicants see on the public site. Changes go live immediately.</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        curr = load_site_settings()
+
+        if curr is None:
+            st.warning("⚠️ No `site_settings` table found. Run this SQL in Supabase SQL Editor to create it:")
+            st.code("""CREATE TABLE site_settings (
     id          INTEGER PRIMARY KEY DEFAULT 1,
     hero_title  TEXT DEFAULT 'Starlink Technician',
     hero_subtitle TEXT DEFAULT 'Greater metro area · Flexible schedule · Performance-based pay',
@@ -533,49 +917,188 @@ ON site_settings FOR ALL TO anon
 USING (true) WITH CHECK (true);
 
 ALTER TABLE site_settings ENABLE ROW LEVEL SECURITY;""", language="sql")
-        st.info("After running the SQL above, refresh this page.")
-    else:
-        with st.form("site_editor"):
-            st.markdown('<div class="sec-label">Hero Section</div>', unsafe_allow_html=True)
-            new_title = st.text_input("Job Title", value=curr.get("hero_title", ""))
-            new_subtitle = st.text_input("Subtitle Line", value=curr.get("hero_subtitle", ""))
-
-            st.markdown('<div class="sec-label" style="margin-top:1rem;">Pay & Schedule</div>', unsafe_allow_html=True)
-            pc1, pc2, pc3 = st.columns(3)
-            with pc1: earn_min = st.text_input("Earning Min", value=curr.get("earning_min", "$1,200"))
-            with pc2: earn_max = st.text_input("Earning Max", value=curr.get("earning_max", "$1,800"))
-            with pc3: daily = st.text_input("Daily Installs", value=curr.get("daily_installs", "3 – 5"))
-
-            st.markdown('<div class="sec-label" style="margin-top:1rem;">Job Description</div>', unsafe_allow_html=True)
-            new_desc = st.text_area("Description paragraph", value=curr.get("job_desc", ""), height=150)
-
-            st.markdown('<div class="sec-label" style="margin-top:1rem;">What You\'ll Do (comma separated)</div>', unsafe_allow_html=True)
-            new_duties = st.text_area("Duties list", value=curr.get("duties", ""), height=100,
-                                      placeholder="Residential Starlink installations, Roof mounting & cable routing, ...")
-
-            st.markdown('<div class="sec-label" style="margin-top:1rem;">What You Need (comma separated)</div>', unsafe_allow_html=True)
-            new_reqs = st.text_area("Requirements list", value=curr.get("requirements", ""), height=100,
-                                    placeholder="Reliable truck/van/SUV, 24ft+ fiberglass ladder, ...")
-
-            if st.form_submit_button("🚀 Publish Updates to Live Site", type="primary", use_container_width=True):
+            st.info("After running the SQL above, refresh this page.")
+        else:
+            with st.form("site_editor"):
+                st.markdown('<div class="sec-label">Hero Section</div>', unsafe_allow_html=True)
+                new_title = st.text_input("Job Title", value=curr.get("hero_title", ""))
+                new_subtitle = st.text_input("Subtitle Line", value=curr.get("hero_subtitle", ""))
+
+                st.markdown('<div class="sec-label" style="margin-top:1rem;">Pay & Schedule</div>', unsafe_allow_html=True)
+                pc1, pc2, pc3 = st.columns(3)
+                with pc1: earn_min = st.text_input("Earning Min", value=curr.get("earning_min", "$1,200"))
+                with pc2: earn_max = st.text_input("Earning Max", value=curr.get("earning_max", "$1,800"))
+                with pc3: daily = st.text_input("Daily Installs", value=curr.get("daily_installs", "3 – 5"))
+
+                st.markdown('<div class="sec-label" style="margin-top:1rem;">Job Description</div>', unsafe_allow_html=True)
+                new_desc = st.text_area("Description paragraph", value=curr.get("job_desc", ""), height=150)
+
+                st.markdown('<div class="sec-label" style="margin-top:1rem;">What You\'ll Do (comma separated)</div>', unsafe_allow_html=True)
+                new_duties = st.text_area("Duties list", value=curr.get("duties", ""), height=100,
+                                          placeholder="Residential Starlink installations, Roof mounting & cable routing, ...")
+
+                st.markdown('<div class="sec-label" style="margin-top:1rem;">What You Need (comma separated)</div>', unsafe_allow_html=True)
+                new_reqs = st.text_area("Requirements list", value=curr.get("requirements", ""), height=100,
+                                        placeholder="Reliable truck/van/SUV, 24ft+ fiberglass ladder, ...")
+
+                if st.form_submit_button("🚀 Publish Updates to Live Site", type="primary", use_container_width=True):
+                    try:
+                        save_site_settings(supabase, {
+                            "hero_title": new_title,
+                            "hero_subtitle": new_subtitle,
+                            "earning_min": earn_min,
+                            "earning_max": earn_max,
+                            "daily_installs": daily,
+                            "job_desc": new_desc,
+                            "duties": new_duties,
+                            "requirements": new_reqs,
+                        })
+                        load_site_settings.clear()
+                        st.success("✅ Website content updated. Changes are live.")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Failed to update: {e}")
+
+            if curr.get("last_updated"):
+                st.markdown(f'<div style="font-size:0.72rem;color:var(--text-3);margin-top:0.5rem;">Last updated: {fmt_full(curr["last_updated"])}</div>', unsafe_allow_html=True)
+
+
+    # ═══════════════ TAB 3: FUNNEL ANALYTICS ═══════════════
+    WINDOWS = {"Last 30 days": 30, "Last 90 days": 90, "Last 12 months": 365, "All time": None}
+    PCT = st.column_config.NumberColumn(format="percent")
+    HOURS = st.column_config.NumberColumn(format="%.1f h")
+
+    with main_tab3:
+        st.markdown('<div class="card"><div class="card-title">Recruiting Funnel</div><div class="card-sub">Intake, stage conversion and time to contact, grouped by application date. Read from rollups the database keeps current on every insert and status change.</div></div>', unsafe_allow_html=True)
+        a1, a2, _ = st.columns([1.2, 1.6, 3])
+        with a1: window = st.selectbox("Applied", list(WINDOWS), index=1, key="an_window")
+        with a2: grain = st.radio("Group by", list(FREQS), index=1, key="an_grain", horizontal=True)
+        days = WINDOWS[window]
+        since = (datetime.now(timezone.utc) - timedelta(days=days)).date() if days else None
+        try:
+            cohorts, stages = load_rollups(since)
+        except Exception as e:
+            st.warning(f"⚠️ Funnel rollups unavailable ({e}). Run sql/023_funnel_rollups.sql in Supabase SQL Editor.")
+            cohorts = None
+
+        if cohorts is not None and cohorts.empty:
+            st.info("No applicants in this window.")
+        elif cohorts is not None:
+            sm = summary(cohorts, stages)
+            conv = lambda n: f"{n / sm['applicants']:.0%}" if sm["applicants"] else "—"
+            st.markdown(f"""
+            <div class="kpi-row">
+                <div class="kpi-card"><div class="kpi-label">Applied</div><div class="kpi-num">{sm["applicants"]}</div><div class="kpi-sub muted">{window.lower()}</div></div>
+                <div class="kpi-card"><div class="kpi-label">Contacted</div><div class="kpi-num">{sm["contacted"]}</div><div class="kpi-sub green">{conv(sm["contacted"])} of applicants</div></div>
+                <div class="kpi-card"><div class="kpi-label">Hired</div><div class="kpi-num">{sm["hired"]}</div><div class="kpi-sub green">{conv(sm["hired"])} of applicants</div></div>
+                <div class="kpi-card"><div class="kpi-label">Time to contact</div><div class="kpi-num">{fmt_hours(sm["hours_to_contact"])}</div><div class="kpi-sub muted">mean, from applying</div></div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.markdown(f'<div class="sec-label">Applicants per {grain.lower()}, by current status</div>', unsafe_allow_html=True)
+            st.bar_chart(intake(cohorts, grain), stack=True, height=260)
+
+            fc1, fc2 = st.columns([1, 2])
+            with fc1:
+                st.markdown('<div class="sec-label">Funnel</div>', unsafe_allow_html=True)
+                st.dataframe(funnel(stages), use_container_width=True, column_config={
+                    "reached": st.column_config.NumberColumn("Reached"),
+                    "conversion": st.column_config.ProgressColumn("Of applicants", min_value=0, max_value=1, format="percent"),
+                })
+            with fc2:
+                st.markdown('<div class="sec-label">By state</div>', unsafe_allow_html=True)
+                st.dataframe(by_state(cohorts, stages), use_container_width=True, column_config={
+                    "contacted": PCT, "hired": PCT, "hours to contact": HOURS,
+                })
+
+            st.markdown(f'<div class="sec-label">Cohorts by {grain.lower()} applied</div>', unsafe_allow_html=True)
+            cohort = cohort_table(stages, grain)
+            cohort.index = cohort.index.strftime("%b %d, %Y")
+            st.dataframe(cohort, use_container_width=True, column_config={
+                **{s.title(): PCT for s in STATUS_LIST[1:]}, "Hours to contact": HOURS,
+            })
+
+            # Direct moves between two stages, timed from the event log.
+            st.markdown('<div class="sec-label">Time between stages</div>', unsafe_allow_html=True)
+            t1, t2, _ = st.columns([1, 1, 3])
+            with t1: frm = st.selectbox("From", STATUS_LIST, index=STATUS_LIST.index("INTERVIEW"), key="an_from")
+            with t2: to = st.selectbox("To", STATUS_LIST, index=STATUS_LIST.index("HIRED"), key="an_to")
+            try:
+                tr = load_transition(frm, to, since)
+            except Exception as e:
+                st.warning(f"⚠️ Stage timings unavailable ({e}). Run sql/024_applicant_events.sql in Supabase SQL Editor.")
+            else:
+                st.markdown(f"""
+                <div class="kpi-row">
+                    <div class="kpi-card"><div class="kpi-label">Moves</div><div class="kpi-num">{tr["n"]}</div><div class="kpi-sub muted">{frm.title()} → {to.title()}</div></div>
+                    <div class="kpi-card"><div class="kpi-label">Median</div><div class="kpi-num">{fmt_hours(tr["p50_hours"])}</div><div class="kpi-sub muted">in {frm.title()}</div></div>
+                    <div class="kpi-card"><div class="kpi-label">Mean</div><div class="kpi-num">{fmt_hours(tr["mean_hours"])}</div><div class="kpi-sub muted">in {frm.title()}</div></div>
+                    <div class="kpi-card"><div class="kpi-label">90th pct</div><div class="kpi-num">{fmt_hours(tr["p90_hours"])}</div><div class="kpi-sub muted">slowest tenth</div></div>
+                </div>
+                """, unsafe_allow_html=True)
+
+
+    # ═══════════════ TAB 4: DISPATCH ═══════════════
+    ACTIVE = ["NEW", "REVIEWED", "CONTACTED", "INTERVIEW"]
+
+    with main_tab4:
+        st.markdown('<div class="card"><div class="card-title">Dispatch</div><div class="card-sub">Technicians whose listed counties and travel radius reach a job, nearest first. Distances run from the closest county they listed.</div></div>', unsafe_allow_html=True)
+        counties = county_index()
+        if counties is None:
+            st.info("County data not found at data/counties.txt. Run `python geo.py fetch`, then `python geo.py index` to resolve existing applicants.")
+        else:
+            g1, g2, g3 = st.columns([1, 2.2, 2.4])
+            with g1: find_by = st.radio("Find by", ["County", "Coordinates"], key="dp_by", horizontal=True)
+            target, lat, lon = None, None, None
+            if find_by == "County":
+                states = [n for n, c in STATES.items() if counties.by_state.get(c)]
+                with g2:
+                    sc1, sc2 = st.columns(2)
+                    with sc1: state = st.selectbox("State", states, key="dp_state")
+                    opts = sorted(counties.by_state[STATES[state]], key=lambda c: c.name)
+                    with sc2: target = st.selectbox("County", opts, format_func=lambda c: c.name, key="dp_county")
+            else:
+                with g2: spot = st.text_input("Job location (lat, lon)", placeholder="28.54, -81.38", key="dp_point")
                 try:
-                    supabase.table("site_settings").upsert({
-                        "id": 1,
-                        "hero_title": new_title,
-                        "hero_subtitle": new_subtitle,
-                        "earning_min": earn_min,
-                        "earning_max": earn_max,
-                        "daily_installs": daily,
-                        "job_desc": new_desc,
-                        "duties": new_duties,
-                        "requirements": new_reqs,
-                        "last_updated": datetime.now().isoformat(),
-                    }).execute()
-                    st.cache_data.clear()
-                    st.success("✅ Website content updated. Changes are live.")
-                    st.rerun()
+                    lat, lon = (float(v) for v in spot.split(","))
+                    target = counties.nearest(lat, lon)
+                except ValueError:
+                    if spot.strip():
+                        st.error("Enter the location as latitude, longitude.")
+            with g3: statuses = st.multiselect("Status", STATUS_LIST, default=ACTIVE, key="dp_status")
+
+            if target is not None:
+                try:
+                    rows = load_coverage(target.fips, lat, lon, tuple(statuses))
                 except Exception as e:
-                    st.error(f"Failed to update: {e}")
+                    st.warning(f"⚠️ Service areas unavailable ({e}). Run sql/025_service_areas.sql in Supabase SQL Editor, then `python geo.py index`.")
+                    rows = None
+                if rows is not None:
+                    st.markdown(f'<div class="sec-label">{len(rows)} covering {target.name}, {target.state} &middot; FIPS {target.fips}</div>', unsafe_allow_html=True)
+                    if rows:
+                        st.dataframe([{"Name": r["name"], "Phone": r["phone"], "Status": r["status"], "Miles": r["miles"],
+                                       "Counties": r["counties"], "Radius": r["radius"], "Experience": r["experience"],
+                                       "Vehicle": r["vehicle"], "Ladder": r["ladder"], "Insurance": r["insurance"]} for r in rows],
+                                     use_container_width=True, hide_index=True,
+                                     column_config={"Miles": st.column_config.NumberColumn(format="%.0f mi")})
+                    else:
+                        st.info("Nobody has listed this county or one within their travel radius.")
+
 
-        if curr.get("last_updated"):
-            st.markdown(f'<div style="font-size:0.72rem;color:var(--text-3);margin-top:0.5rem;">Last updated: {fmt_full(curr["last_updated"])}</div>', unsafe_allow_html=True)
+    # ═══════════════ DIAGNOSTICS (?diag=1) ═══════════════
+    if DIAG:
+        with main_tabs[4]:
+            snap = TRACER.snapshot()
+            st.markdown(f'<div class="card"><div class="card-title">Performance spans</div><div class="card-sub">Rolling p50/p95/p99 over the last {TRACER.window} samples per span, in milliseconds, for this server process since {datetime.fromtimestamp(TRACER.started):%b %d %I:%M %p}.</div></div>', unsafe_allow_html=True)
+            if snap:
+                st.dataframe([{"span": k, **v} for k, v in snap.items()], use_container_width=True, hide_index=True)
+            else:
+                st.info("No spans recorded yet.")
+            d1, d2, d3, _ = st.columns([1, 1, 1, 3])
+            d1.download_button("Prometheus", TRACER.to_prometheus(), "metrics.txt", "text/plain", use_container_width=True)
+            d2.download_button("JSON", TRACER.to_json(), "metrics.json", "application/json", use_container_width=True)
+            if d3.button("Reset", use_container_width=True):
+                TRACER.reset()
+                st.rerun()
+            if SOURCE == "replica":
+                st.json(applicant_store().stats)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from applicants import STATUS_LIST
+from records import to_columns, exp_mask, equip_mask
+
+# Registry tabs in display order; None is the unfiltered "All" tab.
+TABS = [("All", None), ("New", "NEW"), ("Contacted", "CONTACTED"),
+        ("Interview", "INTERVIEW"), ("Hired", "HIRED"), ("Rejected", "REJECTED")]
+WEEK = pd.Timedelta(days=7)
+
+
+# ── Columnar frame ──
+# Row i of the frame is record i of the store's ordered list, so index arrays
+# computed here can be used to pick records for rendering.
+def build_frame(records):
+    df = pd.DataFrame(to_columns(records))
+    for c in ("name", "phone", "email", "state", "counties"):
+        df[c] = df[c].astype(str)
+    df["status"] = pd.Categorical(df["status"], categories=STATUS_LIST)
+    df["created"] = pd.to_datetime(df["created"], utc=True)
+    df["exp_mask"] = df["exp_mask"].astype(np.int64)
+    df["equip_mask"] = df["equip_mask"].astype(np.int64)
+    return df
+
+
+# ── Vectorized filters ──
+def filter_mask(df, statuses=(), exp=(), equipment=()):
+    mask = np.ones(len(df), dtype=bool)
+    if statuses:
+        codes = [STATUS_LIST.index(s) for s in statuses]
+        mask &= np.isin(df["status"].cat.codes.to_numpy(), codes)
+    if exp:
+        # Any selected experience type matches, as before.
+        mask &= (df["exp_mask"].to_numpy() & exp_mask(exp)) != 0
+    if equipment:
+        need = equip_mask(equipment)
+        mask &= (df["equip_mask"].to_numpy() & need) == need
+    return mask
+
+
+# ── Single-pass aggregates ──
+def summarize(df, now=None):
+    now = now or pd.Timestamp.now(tz="UTC")
+    codes = df["status"].cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(STATUS_LIST))
+    out = {"total": len(df), "week": int((df["created"] > now - WEEK).sum())}
+    out.update(zip(STATUS_LIST, counts.tolist()))
+    return out
+
+def tab_members(df, mask=None, order=None):
+    idx = np.arange(len(df)) if order is None else np.asarray(order)
+    if mask is not None:
+        idx = idx[mask[idx]]
+    codes = df["status"].cat.codes.to_numpy()[idx]
+    # A stable sort groups rows by status while keeping the requested order inside each group.
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(STATUS_LIST) + 1))
+    groups = {s: idx[order[bounds[i]:bounds[i + 1]]] for i, s in enumerate(STATUS_LIST)}
+    return {s: (idx if s is None else groups[s]) for _, s in TABS}
+
+
+# ── Server-side group-by ──
+def fetch_status_counts(sb):
+    rows = sb.rpc("applicant_status_counts").execute().data or []
+    out = {"total": 0, "week": 0, **{s: 0 for s in STATUS_LIST}}
+    for r in rows:
+        out["total"] += r["total"]
+        out["week"] += r["recent"]
+        if r["status"] in out:
+            out[r["status"]] = r["total"]
+    return out
@@ -0,0 +1,91 @@
+import pandas as pd
+
+from applicants import STATUS_LIST
+
+# Rollup rows per request; PostgREST caps a response at 1000 rows by default.
+ROLLUP_PAGE = 1000
+FREQS = {"Day": "D", "Week": "W-MON", "Month": "MS"}
+COHORT_COLUMNS = ["day", "state", "status", "n"]
+STAGE_COLUMNS = ["day", "state", "stage", "n", "timed", "hours"]
+
+
+# ── Rollup reads (sql/023_funnel_rollups.sql) ──
+# Both tables hold one row per (intake day, state, status/stage), so a read costs
+# the same however many applicants sit behind it.
+def _fetch_all(sb, table, columns, key, since=None):
+    out, off = [], 0
+    while True:
+        q = sb.table(table).select(",".join(columns))
+        if since:
+            q = q.gte("day", since.isoformat())
+        rows = q.order("day").order("state").order(key).range(off, off + ROLLUP_PAGE - 1).execute().data or []
+        out += rows
+        if len(rows) < ROLLUP_PAGE:
+            return out
+        off += ROLLUP_PAGE
+
+def _frame(rows, columns):
+    df = pd.DataFrame(rows, columns=columns)
+    df["day"] = pd.to_datetime(df["day"])
+    return df[df["n"] != 0]
+
+def fetch_rollups(sb, since=None):
+    # (cohorts, stages) for applicants who came in on or after `since`.
+    cohorts = _frame(_fetch_all(sb, "applicant_cohorts", COHORT_COLUMNS, "status", since), COHORT_COLUMNS)
+    stages = _frame(_fetch_all(sb, "applicant_stage_counts", STAGE_COLUMNS, "stage", since), STAGE_COLUMNS)
+    return cohorts, stages
+
+
+# ── Shapes for the Analytics tab ──
+def _period(freq):
+    # Periods are labelled by their first day; weeks start on Monday.
+    return pd.Grouper(key="day", freq=FREQS[freq], label="left", closed="left")
+
+def _reached(stages, by):
+    # Applicants per group that ever reached each stage, stages as columns in pipeline order.
+    out = stages.pivot_table(index=by, columns="stage", values="n", aggfunc="sum", fill_value=0)
+    return out.reindex(columns=STATUS_LIST, fill_value=0)
+
+def _hours_to_contact(stages, by):
+    c = stages[stages["stage"] == "CONTACTED"].groupby(by)[["timed", "hours"]].sum()
+    return (c["hours"] / c["timed"].where(c["timed"] > 0)).rename("hours_to_contact")
+
+def intake(cohorts, freq="Week"):
+    # New applicants per period, split by their current status.
+    by = _period(freq)
+    out = cohorts.pivot_table(index=by, columns="status", values="n", aggfunc="sum", fill_value=0)
+    return out.reindex(columns=STATUS_LIST, fill_value=0)
+
+def funnel(stages):
+    reached = _reached(stages.assign(all=0), "all").sum()
+    top = reached.get("NEW", 0)
+    return pd.DataFrame({"reached": reached, "conversion": reached / top if top else 0.0})
+
+def summary(cohorts, stages):
+    f = funnel(stages)["reached"]
+    c = stages[stages["stage"] == "CONTACTED"]
+    timed = c["timed"].sum()
+    return {"applicants": int(cohorts["n"].sum()), "contacted": int(f["CONTACTED"]), "hired": int(f["HIRED"]),
+            "hours_to_contact": float(c["hours"].sum() / timed) if timed else None}
+
+def cohort_table(stages, freq="Week"):
+    # One row per intake period: size, share that reached each later stage, mean hours to contact.
+    by = _period(freq)
+    reached = _reached(stages, by)
+    reached = reached[reached["NEW"] > 0]
+    out = pd.DataFrame({"applicants": reached["NEW"]})
+    for s in STATUS_LIST[1:]:
+        out[s.title()] = reached[s] / reached["NEW"]
+    out["Hours to contact"] = _hours_to_contact(stages, by)
+    return out.sort_index(ascending=False)
+
+def by_state(cohorts, stages):
+    reached = _reached(stages, "state")
+    backlog = cohorts[cohorts["status"] == "NEW"].groupby("state")["n"].sum()
+    out = pd.DataFrame({"applicants": reached["NEW"], "awaiting review": backlog,
+                        "contacted": reached["CONTACTED"] / reached["NEW"],
+                        "hired": reached["HIRED"] / reached["NEW"],
+                        "hours to contact": _hours_to_contact(stages, "state")})
+    out["awaiting review"] = out["awaiting review"].fillna(0).astype(int)
+    out.index = out.index.where(out.index != "", "(none)")
+    return out[out["applicants"] > 0].sort_values("applicants", ascending=False)
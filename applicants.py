@@ -0,0 +1,124 @@
+from datetime import datetime, timezone
+
+# ── Columns ──
+# Registry cards only draw these; photos and notes are fetched per-record in the detail view.
+LIST_COLUMNS = (
+    "id", "created_at", "name", "email", "phone", "state", "counties", "radius",
+    "experience", "exp_types", "exp_mask", "vehicle", "ladder", "insurance", "status",
+    "photo1_thumb_url", "duplicate_of", "submission_count",
+)
+PAGE_SIZE = 200
+# Ids per in_() filter; keeps bulk request URLs well under proxy limits.
+BULK_CHUNK = 300
+STATUS_LIST = ["NEW", "REVIEWED", "CONTACTED", "INTERVIEW", "HIRED", "REJECTED"]
+# Bit i of stages_reached is STATUS_LIST[i]; entering a status marks it and the pipeline
+# stages before it (REJECTED only marks itself). Matches stage_bits() in sql/023.
+STAGE_BIT = {s: 1 << i for i, s in enumerate(STATUS_LIST)}
+STAGE_BITS = {s: (1 << (i + 1)) - 1 for i, s in enumerate(STATUS_LIST[:-1])} | {"REJECTED": STAGE_BIT["REJECTED"] | 1}
+# site_settings holds a single row, the public page's editable copy.
+SETTINGS_ID = 1
+
+
+# ── Keyset pagination ──
+# Rows are ordered newest first on (created_at, id); a cursor is the (created_at, id)
+# of the last row on the previous page, so page N costs the same as page 1.
+def _after(q, cursor, col="created_at", op="lt"):
+    if not cursor:
+        return q
+    ts, aid = cursor
+    return q.or_(f'{col}.{op}."{ts}",and({col}.eq."{ts}",id.{op}.{aid})')
+
+def fetch_page(sb, cursor=None, limit=PAGE_SIZE, columns=LIST_COLUMNS, where=None):
+    q = sb.table("applicants").select(",".join(columns))
+    if where:
+        q = where(q)
+    q = q.order("created_at", desc=True).order("id", desc=True).limit(limit)
+    rows = _after(q, cursor).execute().data or []
+    nxt = (rows[-1]["created_at"], rows[-1]["id"]) if len(rows) == limit else None
+    return rows, nxt
+
+def iter_pages(sb, limit=PAGE_SIZE, columns=LIST_COLUMNS, where=None):
+    cursor = None
+    while True:
+        rows, cursor = fetch_page(sb, cursor, limit, columns, where)
+        if rows:
+            yield rows
+        if cursor is None:
+            return
+
+def iter_changes(sb, since, limit=PAGE_SIZE, columns=LIST_COLUMNS):
+    cols = ",".join(dict.fromkeys(columns + ("updated_at",)))
+    cursor = None
+    while True:
+        q = (sb.table("applicants").select(cols).gte("updated_at", since)
+             .order("updated_at").order("id").limit(limit))
+        rows = _after(q, cursor, "updated_at", "gt").execute().data or []
+        if rows:
+            yield rows
+        if len(rows) < limit:
+            return
+        cursor = (rows[-1]["updated_at"], rows[-1]["id"])
+
+def fetch_tombstones(sb, since=None):
+    q = sb.table("applicant_tombstones").select("id,deleted_at").order("deleted_at")
+    if since:
+        q = q.gte("deleted_at", since)
+    return q.execute().data or []
+
+def iter_by_ids(sb, ids, limit=PAGE_SIZE, columns=("*",), chunk=BULK_CHUNK):
+    # Full rows for a known id list, in that order: one in_() query per `chunk` ids,
+    # handed out in pages of `limit` rows.
+    page = []
+    for part in _chunks(ids, chunk):
+        got = {r["id"]: r for r in sb.table("applicants").select(",".join(columns)).in_("id", part).execute().data or []}
+        page += [got[a] for a in part if a in got]
+        while len(page) >= limit:
+            yield page[:limit]
+            page = page[limit:]
+    if page:
+        yield page
+
+def fetch_applicant(sb, aid):
+    res = sb.table("applicants").select("*").eq("id", aid).limit(1).execute()
+    return res.data[0] if res.data else None
+
+def update_applicant(sb, aid, fields):
+    res = sb.table("applicants").update(fields).eq("id", aid).execute()
+    return res.data[0] if res.data else None
+
+def delete_applicant(sb, aid):
+    sb.table("applicants").delete().eq("id", aid).execute()
+
+def _chunks(ids, size):
+    ids = list(ids)
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+def update_many(sb, ids, fields, chunk=BULK_CHUNK):
+    # One update per chunk of ids; returns the updated rows.
+    rows = []
+    for part in _chunks(ids, chunk):
+        rows += sb.table("applicants").update(fields).in_("id", part).execute().data or []
+    return rows
+
+def delete_many(sb, ids, chunk=BULK_CHUNK):
+    for part in _chunks(ids, chunk):
+        sb.table("applicants").delete().in_("id", part).execute()
+
+
+# ── Site settings ──
+def fetch_site_settings(sb):
+    rows = sb.table("site_settings").select("*").eq("id", SETTINGS_ID).limit(1).execute().data
+    return rows[0] if rows else None
+
+def save_site_settings(sb, fields):
+    sb.table("site_settings").upsert({**fields, "id": SETTINGS_ID,
+                                      "last_updated": datetime.now(timezone.utc).isoformat()}).execute()
+
+
+# ── Counts ──
+def _count(q):
+    return q.execute().count or 0
+
+def count_total(sb):
+    return _count(sb.table("applicants").select("id", count="exact", head=True))
@@ -0,0 +1 @@
+"""Benchmarks over synthetic applicants and an in-memory Supabase stand-in; see `python -m bench --help`."""
@@ -0,0 +1,179 @@
+"""Run the benchmarks and write timings and peak memory as JSON.
+
+    python -m bench --sizes 1000 50000 500000 --out bench.json
+    python -m bench --backend sqlite     # same runs against the embedded engine (localdb.py)
+"""
+import argparse
+import gc
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aggregates import build_frame, summarize, tab_members
+from bench.data import applicant_rows, submission
+from bench.fake_supabase import FakeSupabase
+from export import FORMATS, all_rows, export_file
+from localdb import LocalClient
+from outbox import Outbox, flush_once
+from query import RegistryQuery
+from store import ApplicantStore
+
+ROOT = Path(__file__).resolve().parent.parent
+SUBMISSIONS = 500
+
+
+# ── Benchmarks ──
+# Each takes the shared context dict and may return extra fields for its result.
+def bench_load(ctx):
+    ctx["store"] = store = ApplicantStore(ctx["sb"])
+    store.resync()
+    return {"rows": len(store), "requests": sum(ctx["sb"].calls.values())}
+
+def bench_kpis(ctx):
+    ctx["frame"] = frame = build_frame(ctx["store"].ordered())
+    return summarize(frame)
+
+def bench_filter(ctx):
+    frame = ctx["frame"]
+    rq = RegistryQuery(exp=("Starlink",), equipment=("vehicle",), sort="Experience")
+    members = tab_members(frame, rq.mask(frame), rq.order(frame))
+    index = ctx["store"].search_index
+    hits = index.search("garcia")
+    phone = index.search(next(iter(ctx["store"].rows.values())).phone[:9])
+    return {"matches": len(members[None]), "search_hits": len(hits), "phone_hits": len(phone)}
+
+def bench_render(ctx):
+    # Cold then warm rerun of the admin script against the fake client.
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+    import db
+    db.make_client = lambda *a, **k: ctx["sb"]
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    at = AppTest.from_file(str(ROOT / "admin.py"), default_timeout=600)
+    at.secrets.update({"SUPABASE_URL": "http://fake", "SUPABASE_KEY": "fake", "REGISTRY_FEED": "off"})
+    at.session_state["authenticated"] = True
+    t0 = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    t0 = time.perf_counter()
+    at.run()
+    return {"cold_s": round(cold, 4), "warm_s": round(time.perf_counter() - t0, 4)}
+
+def bench_export(ctx):
+    out = {}
+    for fmt in FORMATS:
+        t0 = time.perf_counter()
+        data = export_file(all_rows(ctx["sb"]), fmt)
+        out[fmt] = {"seconds": round(time.perf_counter() - t0, 4), "bytes": len(data)}
+    return out
+
+def bench_submit(ctx):
+    # Enqueue a burst of public-form submissions, then drain the outbox into the fake.
+    with tempfile.TemporaryDirectory() as tmp:
+        box = Outbox(Path(tmp) / "outbox.db")
+        t0 = time.perf_counter()
+        for i in range(SUBMISSIONS):
+            box.enqueue(submission(seed=ctx["size"] + i))
+        enqueue = time.perf_counter() - t0
+        while flush_once(box, ctx["sb"]):
+            pass
+        stats = box.stats()
+        box._db.close()
+    return {"submissions": SUBMISSIONS, "enqueue_per_s": round(SUBMISSIONS / enqueue), "left": stats["depth"]}
+
+def bench_photo(ctx):
+    from PIL import Image
+    from photos import upload_photo
+    buf = io.BytesIO()
+    Image.effect_noise((3000, 2000), 64).convert("RGB").save(buf, "JPEG", quality=90)
+    size = buf.tell()
+    urls = upload_photo(ctx["sb"], buf, "install.jpg")
+    return {"input_bytes": size, "variants": len(urls)}
+
+BENCHES = {
+    "load": bench_load, "kpis": bench_kpis, "filter": bench_filter, "render": bench_render,
+    "export": bench_export, "submit": bench_submit, "photo": bench_photo,
+}
+# Set-up run (untimed) before a benchmark that reads what these build.
+NEEDS = {"kpis": ("load",), "filter": ("load", "kpis")}
+
+
+# ── Runner ──
+def _measure(fn, ctx, memory):
+    gc.collect()
+    if memory:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    extra = fn(ctx)
+    seconds = time.perf_counter() - t0
+    peak = None
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    return seconds, peak, extra
+
+def _client(backend, rows):
+    if backend == "sqlite":
+        sb = LocalClient(":memory:", tempfile.mkdtemp(prefix="bench-storage-"))
+        sb.load(dict(r) for r in rows)
+        return sb
+    return FakeSupabase([dict(r) for r in rows])
+
+def _context(size, rows, name, backend):
+    # Fresh data per benchmark so writes from one never skew the next.
+    ctx = {"size": size, "sb": _client(backend, rows)}
+    for dep in NEEDS.get(name, ()):
+        BENCHES[dep](ctx)
+    return ctx
+
+def run(sizes, names, memory=True, seed=0, log=print, backend="fake"):
+    results = []
+    for size in sizes:
+        rows = applicant_rows(size, seed)
+        for name in names:
+            seconds, _, extra = _measure(BENCHES[name], _context(size, rows, name, backend), False)
+            peak = _measure(BENCHES[name], _context(size, rows, name, backend), True)[1] if memory else None
+            results.append({"bench": name, "size": size, "backend": backend, "seconds": round(seconds, 4),
+                            "peak_mb": None if peak is None else round(peak, 2), **({"detail": extra} if extra else {})})
+            log(f"{name:>7} {size:>8}  {seconds:9.3f}s" + (f"  {peak:8.1f} MB" if peak is not None else ""))
+    return results
+
+def _meta():
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        rev = None
+    return {"timestamp": datetime.now(timezone.utc).isoformat(), "git": rev or None,
+            "python": sys.version.split()[0], "platform": platform.platform()}
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m bench", description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 50000])
+    ap.add_argument("--only", nargs="+", choices=list(BENCHES), default=list(BENCHES))
+    ap.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--backend", choices=["fake", "sqlite"], default="fake",
+                    help="in-memory Supabase stand-in, or the embedded SQLite engine")
+    ap.add_argument("--out", help="write JSON here instead of stdout")
+    args = ap.parse_args(argv)
+    log = lambda s: print(s, file=sys.stderr)
+    report = {"meta": _meta(), "results": run(args.sizes, args.only, not args.no_memory, args.seed, log, args.backend)}
+    text = json.dumps(report, indent=2, default=str)
+    if args.out:
+        Path(args.out).write_text(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from applicants import STATUS_LIST
+from records import EXP_TYPES, EXPERIENCE_LEVELS, exp_mask
+
+# Rough shape of a live hiring pipeline: most rows are untouched or rejected.
+STATUS_WEIGHTS = [35, 20, 14, 8, 5, 18]
+# Satellite work dominates; "Other" and cable are rare.
+EXP_WEIGHTS = [40, 22, 18, 10, 14, 16, 6, 4]
+EXPERIENCE_WEIGHTS = [15, 30, 30, 17, 8]
+RADII = ["Up to 25 miles", "Up to 50 miles", "Up to 75 miles", "Up to 100 miles", "100+ miles"]
+COUNTIES = {
+    "Florida": ["Orange", "Seminole", "Osceola", "Lake", "Volusia", "Brevard", "Polk", "Hillsborough", "Pinellas", "Duval"],
+    "Texas": ["Harris", "Dallas", "Tarrant", "Bexar", "Travis", "Collin", "Denton", "El Paso"],
+    "Georgia": ["Fulton", "Gwinnett", "Cobb", "DeKalb", "Chatham"],
+    "California": ["Los Angeles", "San Diego", "Orange", "Riverside", "San Bernardino", "Sacramento", "Fresno"],
+    "Arizona": ["Maricopa", "Pima", "Pinal", "Yavapai"],
+    "North Carolina": ["Mecklenburg", "Wake", "Guilford", "Forsyth", "Durham"],
+    "Ohio": ["Franklin", "Cuyahoga", "Hamilton", "Summit"],
+    "Colorado": ["Denver", "El Paso", "Arapahoe", "Jefferson", "Adams"],
+}
+STATE_WEIGHTS = [30, 20, 10, 12, 8, 8, 6, 6]
+FIRST = ["James", "Maria", "Robert", "Ana", "Michael", "Luis", "David", "Jose", "Chris", "Kevin", "Daniel", "Carlos",
+         "Brian", "Jason", "Tyler", "Marcus", "Andre", "Eric", "Sofia", "Tanya"]
+LAST = ["Smith", "Garcia", "Johnson", "Rodriguez", "Williams", "Martinez", "Brown", "Lopez", "Davis", "Hernandez",
+        "Miller", "Gonzalez", "Wilson", "Perez", "Moore", "Taylor", "Thomas", "Jackson", "White", "Clark"]
+DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "icloud.com", "hotmail.com"]
+# Share of rows that are a repeat application from an earlier applicant.
+REPEAT_RATE = 0.02
+
+
+def _phone(rng):
+    a, b, c = rng.randint(201, 989), rng.randint(200, 999), rng.randint(0, 9999)
+    return rng.choice([f"({a}) {b}-{c:04d}", f"{a}-{b}-{c:04d}", f"{a}{b}{c:04d}", f"+1 {a} {b} {c:04d}"])
+
+
+def applicant_rows(n, seed=0, now=None, days=540):
+    """`n` realistic applicants rows, oldest first, ids 1..n.
+
+    Timestamps are skewed towards the recent past like a growing campaign.
+    """
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    states = list(COUNTIES)
+    offsets = sorted((rng.random() ** 1.6 * days * 86400 for _ in range(n)), reverse=True)
+    rows = []
+    for i, off in enumerate(offsets, 1):
+        created = now - timedelta(seconds=off)
+        if rows and rng.random() < REPEAT_RATE:
+            prev = rng.choice(rows)
+            name, phone, email = prev["name"], prev["phone"], prev["email"].upper()
+        else:
+            first, last = rng.choice(FIRST), rng.choice(LAST)
+            name, phone = f"{first} {last}", _phone(rng)
+            email = f"{first.lower()}.{last.lower()}{rng.randint(1, 999)}@{rng.choice(DOMAINS)}"
+        state = rng.choices(states, STATE_WEIGHTS)[0]
+        exp = sorted(set(rng.choices(EXP_TYPES, EXP_WEIGHTS, k=rng.choice([0, 1, 1, 2, 2, 3, 4]))), key=EXP_TYPES.index)
+        rows.append({
+            "id": i,
+            "created_at": created.isoformat(),
+            "updated_at": min(now, created + timedelta(seconds=rng.randint(0, 3 * 86400))).isoformat(),
+            "name": name, "phone": phone, "email": email, "state": state,
+            "counties": ", ".join(rng.sample(COUNTIES[state], rng.randint(1, 3))),
+            "radius": rng.choice(RADII),
+            "experience": rng.choices(EXPERIENCE_LEVELS, EXPERIENCE_WEIGHTS)[0],
+            "exp_types": ", ".join(exp) if exp else "None selected",
+            "exp_mask": exp_mask(exp),
+            "vehicle": "Yes" if rng.random() < 0.85 else "No",
+            "ladder": "Yes" if rng.random() < 0.7 else "No",
+            "insurance": "Yes" if rng.random() < 0.4 else "No",
+            "photo1_url": f"https://example.invalid/applicant-photos/installs/{i}_1.webp",
+            "photo2_url": f"https://example.invalid/applicant-photos/installs/{i}_2.webp",
+            "photo1_thumb_url": f"https://example.invalid/applicant-photos/installs/{i}_1.thumb.webp",
+            "status": rng.choices(STATUS_LIST, STATUS_WEIGHTS)[0],
+            "notes": "",
+        })
+    return rows
+
+
+def submission(seed=0):
+    # One public-form payload, as save_applicant enqueues it.
+    row = applicant_rows(1, seed)[0]
+    for k in ("id", "created_at", "updated_at", "notes"):
+        del row[k]
+    row["status"] = "NEW"
+    return row
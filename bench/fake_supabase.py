@@ -0,0 +1,324 @@
+import bisect
+import itertools
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from dedup import identity_key
+from records import EXPERIENCE_RANK
+from search import digits
+
+# `_after` keyset cursor on the default registry order; answered with a bisect instead of a scan.
+_KEYSET = re.compile(r'^created_at\.lt\."([^"]+)",and\(created_at\.eq\."\1",id\.lt\.(-?\d+)\)$')
+_NEWEST_FIRST = [("created_at", True), ("id", True)]
+
+
+def _coerce(v):
+    if isinstance(v, str):
+        v = v.strip('"')
+        if re.fullmatch(r"-?\d+", v):
+            return int(v)
+    return v
+
+
+def _cmp(op, a, b):
+    if a is None:
+        return False
+    if isinstance(a, (int, float)) and isinstance(b, str):
+        try:
+            b = type(a)(b)
+        except ValueError:
+            pass
+    return {"eq": a == b, "neq": a != b, "lt": a < b, "lte": a <= b, "gt": a > b, "gte": a >= b}[op]
+
+
+def _split(s):
+    out, depth, cur = [], 0, ""
+    for ch in s:
+        depth += (ch == "(") - (ch == ")")
+        if ch == "," and depth == 0:
+            out.append(cur)
+            cur = ""
+        else:
+            cur += ch
+    return out + [cur]
+
+
+def _like(pat, flags=0):
+    return re.compile("^" + re.escape(pat.strip('"')).replace("\\*", ".*").replace("%", ".*") + "$", flags)
+
+
+def _parse(expr):
+    # PostgREST logic-tree syntax as used by or_(): col.op.value, and(...), or(...).
+    expr = expr.strip()
+    for kw in ("and", "or"):
+        if expr.startswith(kw + "("):
+            parts = [_parse(p) for p in _split(expr[len(kw) + 1:-1])]
+            join = all if kw == "and" else any
+            return lambda r: join(p(r) for p in parts)
+    col, op, val = expr.split(".", 2)
+    if op == "is":
+        return lambda r: r.get(col) is None if val == "null" else r.get(col) == val
+    if op == "in":
+        vals = [_coerce(x) for x in _split(val.strip("()"))]
+        return lambda r: r.get(col) in vals
+    if op in ("like", "ilike"):
+        pat = _like(val, re.I if op == "ilike" else 0)
+        return lambda r: bool(pat.match(str(r.get(col) or "")))
+    val = _coerce(val)
+    return lambda r: _cmp(op, r.get(col), val)
+
+
+def _created_id(r):
+    return r["created_at"], r["id"]
+
+
+def _result(data, count=None):
+    return SimpleNamespace(data=data, count=count)
+
+
+class FakeQuery:
+    def __init__(self, db, name):
+        self.db, self.name = db, name
+        self.preds, self.orders, self.before = [], [], None
+        self.mode, self.payload, self.cols = "select", None, "*"
+        self.lim, self.off, self.count, self.head = None, 0, None, False
+        self.on_conflict, self.ignore_duplicates = None, False
+
+    # ── Verbs ──
+    def select(self, *cols, count=None, head=None):
+        self.cols, self.count, self.head = ",".join(cols) or "*", count, bool(head)
+        return self
+
+    def insert(self, payload, **kw):
+        self.mode, self.payload = "insert", payload
+        return self
+
+    def upsert(self, payload, on_conflict="", ignore_duplicates=False, **kw):
+        self.mode, self.payload = "upsert", payload
+        self.on_conflict, self.ignore_duplicates = on_conflict or "id", ignore_duplicates
+        return self
+
+    def update(self, payload, **kw):
+        self.mode, self.payload = "update", payload
+        return self
+
+    def delete(self, **kw):
+        self.mode = "delete"
+        return self
+
+    # ── Filters ──
+    def _p(self, f):
+        self.preds.append(f)
+        return self
+
+    def eq(self, c, v): return self._p(lambda r: _cmp("eq", r.get(c), v))
+    def neq(self, c, v): return self._p(lambda r: _cmp("neq", r.get(c), v))
+    def lt(self, c, v): return self._p(lambda r: _cmp("lt", r.get(c), v))
+    def lte(self, c, v): return self._p(lambda r: _cmp("lte", r.get(c), v))
+    def gt(self, c, v): return self._p(lambda r: _cmp("gt", r.get(c), v))
+    def gte(self, c, v): return self._p(lambda r: _cmp("gte", r.get(c), v))
+    def like(self, c, pat): return self._p(_parse(f"{c}.like.{pat}"))
+    def ilike(self, c, pat): return self._p(_parse(f"{c}.ilike.{pat}"))
+
+    def in_(self, c, vs):
+        vs = set(vs)
+        return self._p(lambda r: r.get(c) in vs)
+
+    def is_(self, c, v):
+        return self._p(lambda r: r.get(c) is None if v in (None, "null") else r.get(c) == v)
+
+    def ov(self, c, vs):
+        vs = set(vs)
+        return self._p(lambda r: bool(vs & set(r.get(c) or ())))
+
+    def contains(self, c, vs):
+        return self._p(lambda r: set(vs) <= set(r.get(c) or ()))
+
+    def or_(self, expr):
+        m = _KEYSET.match(expr)
+        if m and self.before is None:
+            self.before = (m.group(1), int(m.group(2)))
+            return self
+        return self._p(_parse(f"or({expr})"))
+
+    # ── Modifiers ──
+    def order(self, c, desc=False, nullsfirst=None):
+        self.orders.append((c, desc))
+        return self
+
+    def limit(self, n):
+        self.lim = n
+        return self
+
+    def range(self, a, b):
+        self.off, self.lim = a, b - a + 1
+        return self
+
+    def execute(self):
+        self.db.calls[(self.name, self.mode)] += 1
+        if self.mode in ("insert", "upsert"):
+            return self._write()
+        if self.mode == "update":
+            hit = self._scan(self.db.rows(self.name))
+            for r in hit:
+                r.update(self.payload)
+                self.db.touch(self.name, r)
+            return _result([dict(r) for r in hit])
+        if self.mode == "delete":
+            return _result(self.db.remove(self.name, self._scan(self.db.rows(self.name))))
+        return self._read()
+
+    # ── Execution ──
+    def _scan(self, rows):
+        if self.before is not None:
+            rows = rows[:bisect.bisect_left(rows, self.before, key=_created_id)]
+        preds = self.preds
+        return [r for r in rows if all(p(r) for p in preds)]
+
+    def _read(self):
+        rows = self.db.rows(self.name)
+        want = None if self.lim is None else self.off + self.lim
+        if self.orders == _NEWEST_FIRST and self.name in self.db.sorted_tables and not self.count and want:
+            # Walk the table newest first from the cursor and stop once the page is full.
+            hi = len(rows) if self.before is None else bisect.bisect_left(rows, self.before, key=_created_id)
+            newest = (rows[i] for i in range(hi - 1, -1, -1))
+            hit = list(itertools.islice((r for r in newest if all(p(r) for p in self.preds)), want))
+            n = None
+        else:
+            hit = self._scan(rows)
+            for c, desc in reversed(self.orders):
+                hit.sort(key=lambda r: (r.get(c) is None, r.get(c)), reverse=desc)
+            n = len(hit)
+        hit = hit[self.off:want]
+        cols = None if "*" in self.cols else [c.strip() for c in self.cols.split(",")]
+        data = [] if self.head else [dict(r) if cols is None else {c: r.get(c) for c in cols} for r in hit]
+        return _result(data, n if self.count else None)
+
+    def _write(self):
+        items = self.payload if isinstance(self.payload, list) else [self.payload]
+        existing = {}
+        if self.mode == "upsert":
+            existing = {r.get(self.on_conflict): r for r in self.db.rows(self.name) if r.get(self.on_conflict) is not None}
+        out = []
+        for it in items:
+            it = dict(it)
+            if it.get(self.on_conflict) is not None:
+                ex = existing.get(it[self.on_conflict])
+                if ex is not None:
+                    if not self.ignore_duplicates:
+                        ex.update(it)
+                        self.db.touch(self.name, ex)
+                        out.append(dict(ex))
+                    continue
+            row = self.db.add(self.name, it)
+            if self.on_conflict and row.get(self.on_conflict) is not None:
+                existing[row[self.on_conflict]] = row
+            out.append(dict(row))
+        return _result(out)
+
+
+class FakeBucket:
+    def __init__(self, db, name):
+        self.db, self.name = db, name
+
+    def upload(self, path, data, file_options=None):
+        self.db.files[f"{self.name}/{path}"] = bytes(data)
+        return {"path": path}
+
+    def download(self, path):
+        return self.db.files[f"{self.name}/{path}"]
+
+    def get_public_url(self, path):
+        return f"https://fake.supabase.invalid/storage/v1/object/public/{self.name}/{path}"
+
+
+class FakeSupabase:
+    """In-memory stand-in for the supabase-py client surface the apps use.
+
+    Covers table() selects with filters, ordering, ranges and exact counts;
+    insert/upsert/update/delete; the applicants generated columns, updated_at
+    trigger and tombstones; the applicant_status_counts RPC; and storage
+    upload/download/get_public_url. `calls` counts executed requests.
+    """
+
+    sorted_tables = ("applicants",)
+
+    def __init__(self, applicants=()):
+        self.tables = {"applicants": [], "applicant_tombstones": [], "site_settings": []}
+        self.files = {}
+        self.calls = Counter()
+        self._ids = itertools.count(1)
+        self._last = datetime.now(timezone.utc)
+        self.storage = SimpleNamespace(from_=lambda bucket: FakeBucket(self, bucket))
+        self.rpcs = {"applicant_status_counts": _status_counts}
+        if applicants:
+            self.load(applicants)
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, fn, params=None):
+        return SimpleNamespace(execute=lambda: _result(self.rpcs[fn](self, params or {})))
+
+    # ── Storage engine ──
+    def load(self, rows):
+        t = self.tables["applicants"]
+        for r in rows:
+            self._generated(r)
+            t.append(r)
+        t.sort(key=_created_id)
+        top = max((r["id"] for r in t), default=0)
+        self._ids = itertools.count(top + 1)
+
+    def rows(self, name):
+        return self.tables.setdefault(name, [])
+
+    def now(self):
+        # Strictly increasing, so inserts always land at the newest end of the table.
+        self._last = max(datetime.now(timezone.utc), self._last + timedelta(microseconds=1))
+        return self._last.isoformat()
+
+    def add(self, name, row):
+        row.setdefault("id", next(self._ids))
+        row.setdefault("created_at", self.now())
+        rows = self.rows(name)
+        if name == "applicants":
+            row.setdefault("updated_at", row["created_at"])
+            self._generated(row)
+            bisect.insort(rows, row, key=_created_id)
+        else:
+            rows.append(row)
+        return row
+
+    def touch(self, name, row):
+        if name == "applicants":
+            row["updated_at"] = self.now()
+            self._generated(row)
+
+    def remove(self, name, hit):
+        gone = {id(r) for r in hit}
+        self.tables[name] = [r for r in self.rows(name) if id(r) not in gone]
+        if name == "applicants":
+            self.rows("applicant_tombstones").extend({"id": r["id"], "deleted_at": self.now()} for r in hit)
+        return [dict(r) for r in hit]
+
+    @staticmethod
+    def _generated(r):
+        # Mirrors the generated columns in sql/008, sql/010 and sql/017.
+        et = r.get("exp_types") or ""
+        r["exp_list"] = [] if et in ("", "None selected") else et.split(", ")
+        r["experience_rank"] = EXPERIENCE_RANK.get(r.get("experience"), -1)
+        r["phone_digits"] = digits(r.get("phone"))
+        r["identity_key"] = identity_key(r.get("phone"), r.get("email"))
+        r.setdefault("submission_count", 1)
+        r.setdefault("duplicate_of", None)
+
+
+def _status_counts(db, params):
+    since = params.get("since") or (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
+    rows = db.rows("applicants")
+    total = Counter(r.get("status") for r in rows)
+    recent = Counter(r.get("status") for r in rows if r["created_at"] >= since)
+    return [{"status": s, "total": n, "recent": recent.get(s, 0)} for s, n in total.items()]
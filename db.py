@@ -0,0 +1,62 @@
+import time
+
+import httpx
+from supabase import ClientOptions, create_client
+
+from localdb import LocalClient, LOCAL_DB_PATH
+from metrics import TracedClient
+
+# Fail fast when Supabase is unreachable; allow slow exports and uploads to finish.
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 30.0
+POOL_SIZE = 20
+KEEPALIVE_EXPIRY = 60.0
+# "supabase" is the hosted project; "sqlite" is the embedded engine in localdb.py.
+BACKENDS = ("supabase", "sqlite")
+
+
+def make_client(url, key, timeout=READ_TIMEOUT, connect_timeout=CONNECT_TIMEOUT, pool_size=POOL_SIZE):
+    """Supabase client whose PostgREST, Storage and Auth calls share one keep-alive pool.
+
+    Safe to share across sessions and threads; build it once per process.
+    Requests are traced as supabase.* spans (metrics.py).
+    """
+    http = httpx.Client(
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size,
+                            keepalive_expiry=KEEPALIVE_EXPIRY),
+        follow_redirects=True,
+        http2=True,
+    )
+    return TracedClient(create_client(url, key, options=ClientOptions(httpx_client=http)))
+
+
+def connect(settings):
+    """Client for the DB_BACKEND named in `settings` (Streamlit secrets or any mapping).
+
+    Both backends answer the same table()/rpc()/storage calls, so nothing downstream
+    needs to know which one it got.
+    """
+    backend = settings.get("DB_BACKEND", "supabase")
+    if backend not in BACKENDS:
+        raise ValueError(f"DB_BACKEND must be one of {BACKENDS}, not {backend!r}")
+    if backend == "sqlite":
+        return TracedClient(LocalClient(settings.get("LOCAL_DB_PATH", LOCAL_DB_PATH)))
+    return make_client(settings["SUPABASE_URL"], settings["SUPABASE_KEY"],
+                       timeout=float(settings.get("SUPABASE_TIMEOUT", READ_TIMEOUT)),
+                       pool_size=int(settings.get("SUPABASE_POOL_SIZE", POOL_SIZE)))
+
+
+def is_open(sb):
+    http = getattr(getattr(sb, "options", None), "httpx_client", None)
+    return http is None or not http.is_closed
+
+
+def health_check(sb, table="applicants"):
+    # One cheap round-trip over the pool: (ok, latency_ms, error).
+    t0 = time.perf_counter()
+    try:
+        sb.table(table).select("id", count="exact", head=True).limit(1).execute()
+        return True, (time.perf_counter() - t0) * 1000, None
+    except Exception as e:
+        return False, (time.perf_counter() - t0) * 1000, str(e)
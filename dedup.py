@@ -0,0 +1,106 @@
+from collections import defaultdict
+
+from search import digits
+
+# "merge" folds a repeat submission into the applicant's existing row;
+# "flag" inserts it with duplicate_of pointing at that row.
+DEDUP_MODE = "merge"
+# Fields a repeat submission may overwrite; status, notes and hiring history stay.
+MERGE_FIELDS = (
+    "name", "phone", "email", "state", "counties", "radius", "county_fips", "service_miles", "coverage_fips",
+    "experience", "exp_types", "exp_mask", "vehicle", "ladder", "insurance",
+    "photo1_url", "photo1_medium_url", "photo1_thumb_url",
+    "photo2_url", "photo2_medium_url", "photo2_thumb_url",
+)
+
+
+def identity_key(phone, email):
+    # Mirrors applicants.identity_key (sql/017_identity_key.sql); None when either part is missing.
+    p, e = digits(phone)[-10:], (email or "").strip().lower()
+    return f"{p}|{e}" if p and e else None
+
+
+def first_per_identity(batch):
+    # Keep the first outbox entry per identity; repeats wait for the next flush,
+    # when the row they duplicate already exists.
+    seen, out = set(), []
+    for entry in batch:
+        k = identity_key(entry[1].get("phone"), entry[1].get("email"))
+        if k is None or k not in seen:
+            seen.add(k)
+            out.append(entry)
+    return out
+
+
+def lookup(sb, keys):
+    # {identity_key: earliest canonical row}; one query on the identity index.
+    keys = [k for k in keys if k]
+    if not keys:
+        return {}
+    res = (sb.table("applicants").select("id, identity_key, submission_count, last_submission_key")
+           .in_("identity_key", keys).is_("duplicate_of", "null").order("created_at").execute())
+    found = {}
+    for r in res.data or []:
+        found.setdefault(r["identity_key"], r)
+    return found
+
+
+def resolve(sb, payloads, mode=DEDUP_MODE):
+    """Return the payloads that still need inserting after merging or flagging repeats."""
+    keys = [identity_key(p.get("phone"), p.get("email")) for p in payloads]
+    found = lookup(sb, keys)
+    out = []
+    for p, k in zip(payloads, keys):
+        hit = found.get(k)
+        if hit is None:
+            out.append(p)
+        elif mode == "flag":
+            out.append({**p, "duplicate_of": hit["id"]})
+        elif hit.get("last_submission_key") != p.get("submission_key"):
+            # Skipped when this submission was already merged by an earlier, partly failed flush.
+            sb.table("applicants").update({
+                **{f: p[f] for f in MERGE_FIELDS if f in p},
+                "submission_count": (hit.get("submission_count") or 1) + 1,
+                "last_submission_key": p.get("submission_key"),
+            }).eq("id", hit["id"]).execute()
+    return out
+
+
+# ── One-off pass over existing rows ──
+def clusters(sb):
+    """Groups of applicants sharing an identity key, oldest first; singletons omitted."""
+    from applicants import iter_pages
+    groups = defaultdict(list)
+    for page in iter_pages(sb, 1000, ("id", "created_at", "name", "phone", "email", "status")):
+        for r in page:
+            k = identity_key(r.get("phone"), r.get("email"))
+            if k:
+                groups[k].append(r)
+    out = [sorted(g, key=lambda r: (r["created_at"], r["id"])) for g in groups.values() if len(g) > 1]
+    return sorted(out, key=len, reverse=True)
+
+
+def flag_clusters(sb, found, chunk=200):
+    # Point every later row of a cluster at its oldest row.
+    n = 0
+    for g in found:
+        dup_ids = [r["id"] for r in g[1:]]
+        for i in range(0, len(dup_ids), chunk):
+            sb.table("applicants").update({"duplicate_of": g[0]["id"]}).in_("id", dup_ids[i:i + chunk]).execute()
+        n += len(dup_ids)
+    return n
+
+
+if __name__ == "__main__":
+    # python dedup.py [--flag]  (reads SUPABASE_URL / SUPABASE_KEY from the environment)
+    import os
+    import sys
+    from db import make_client
+    sb = make_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_KEY"])
+    found = clusters(sb)
+    for g in found:
+        print(f"{len(g)} × {identity_key(g[0]['phone'], g[0]['email'])}: "
+              + ", ".join(f"#{r['id']} {r['created_at'][:10]} {r['status']}" for r in g))
+    print(f"{len(found)} clusters, {sum(len(g) - 1 for g in found)} duplicate rows")
+    if "--flag" in sys.argv:
+        print(f"flagged {flag_clusters(sb, found)} rows")
@@ -0,0 +1,154 @@
+"""Applicant history from the append-only applicant_events log (sql/024).
+
+Current state per applicant = its compacted snapshot + the events logged after it,
+so a replay reads one snapshot row and a short tail off the (applicant_id, seq) index.
+
+The admin console runs a Compactor thread that calls `compact` every COMPACT_EVERY
+seconds; the command does the same from cron, e.g. for a first backfill after sql/024.
+
+    python events.py compact      # fold new events into applicant_snapshots
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from applicants import BULK_CHUNK
+from records import parse_ts
+
+EVENT_COLUMNS = ("seq", "applicant_id", "at", "kind", "from_status", "to_status", "entered_at", "notes")
+# Events folded per compaction round; one snapshot upsert per round.
+COMPACT_BATCH = 1000
+# Sequence values can commit out of order; events younger than this are left for the next run
+# so the watermark never jumps over one that is still in flight.
+COMPACT_LAG = timedelta(seconds=60)
+# How often Compactor folds the log, in seconds.
+COMPACT_EVERY = 15 * 60
+
+
+# ── Replay ──
+def fold(state, e):
+    """Apply one event to a snapshot dict (None before the first event). Pure."""
+    s = dict(state or {})
+    kind = e["kind"]
+    if kind in ("created", "imported"):
+        s.update(status=e["to_status"], status_since=e["at"], notes=e.get("notes") or "",
+                 entered={e["to_status"]: e["at"]}, moves=0, deleted=False)
+    elif kind == "status":
+        s["status"], s["status_since"] = e["to_status"], e["at"]
+        s["entered"] = {**s.get("entered", {})}
+        s["entered"].setdefault(e["to_status"], e["at"])
+        s["moves"] = s.get("moves", 0) + 1
+    elif kind == "notes":
+        s["notes"] = e.get("notes") or ""
+    elif kind == "deleted":
+        s["deleted"], s["deleted_at"] = True, e["at"]
+    return s
+
+def replay(events, state=None):
+    for e in events:
+        state = fold(state, e)
+    return state
+
+def fetch_snapshot(sb, aid):
+    rows = sb.table("applicant_snapshots").select("seq,snapshot").eq("applicant_id", aid).limit(1).execute().data
+    return (rows[0]["seq"], rows[0]["snapshot"]) if rows else (0, None)
+
+def fetch_events(sb, aid, after=0, limit=None, newest=False):
+    q = sb.table("applicant_events").select(",".join(EVENT_COLUMNS)).eq("applicant_id", aid).gt("seq", after)
+    q = q.order("seq", desc=newest)
+    return (q.limit(limit) if limit else q).execute().data or []
+
+def current_state(sb, aid):
+    # Snapshot + tail: cost is bounded by the events since the last compaction.
+    seq, snap = fetch_snapshot(sb, aid)
+    return replay(fetch_events(sb, aid, seq), snap)
+
+
+# ── Compaction ──
+def _watermark(sb):
+    rows = sb.table("applicant_snapshots").select("seq").order("seq", desc=True).limit(1).execute().data
+    return rows[0]["seq"] if rows else 0
+
+def compact(sb, batch=COMPACT_BATCH, log=print):
+    """Fold every event newer than the snapshots into them; returns events folded.
+
+    Each round reads `batch` events in seq order and upserts the touched snapshots in
+    one request, so a crash resumes from the highest snapshot seq. Events at or below a
+    snapshot's own seq are skipped, so overlapping runs never fold an event twice.
+    """
+    after, done = _watermark(sb), 0
+    cutoff = datetime.now(timezone.utc) - COMPACT_LAG
+    while True:
+        events = (sb.table("applicant_events").select(",".join(EVENT_COLUMNS)).gt("seq", after)
+                  .order("seq").limit(batch).execute().data or [])
+        full = len(events) == batch
+        young = next((i for i, e in enumerate(events) if parse_ts(e["at"]) >= cutoff), None)
+        if young is not None:
+            events, full = events[:young], False
+        if not events:
+            break
+        ids = list({e["applicant_id"] for e in events})
+        snaps, seqs = {}, {}
+        for i in range(0, len(ids), BULK_CHUNK):
+            part = ids[i:i + BULK_CHUNK]
+            for r in sb.table("applicant_snapshots").select("applicant_id,seq,snapshot").in_("applicant_id", part).execute().data or []:
+                snaps[r["applicant_id"]], seqs[r["applicant_id"]] = r["snapshot"], r["seq"]
+        last = {}
+        for e in events:
+            if e["seq"] > seqs.get(e["applicant_id"], 0):
+                snaps[e["applicant_id"]] = fold(snaps.get(e["applicant_id"]), e)
+                last[e["applicant_id"]] = e["seq"]
+        now = datetime.now(timezone.utc).isoformat()
+        if last:
+            sb.table("applicant_snapshots").upsert(
+                [{"applicant_id": a, "seq": last[a], "snapshot": snaps[a], "taken_at": now} for a in last],
+                on_conflict="applicant_id", returning="minimal").execute()
+        after, done = events[-1]["seq"], done + len(events)
+        log(f"compacted through seq {after} ({done} events, {len(last)} applicants this round)")
+        if not full:
+            break
+    return done
+
+
+class Compactor(threading.Thread):
+    """Daemon thread that runs `compact` on a schedule, off every request path."""
+
+    def __init__(self, sb, every=COMPACT_EVERY):
+        super().__init__(name="event-compact", daemon=True)
+        self.sb, self.every, self.next_run = sb, every, time.monotonic()
+
+    def run(self):
+        while True:
+            time.sleep(max(0.0, self.next_run - time.monotonic()))
+            self.run_once()
+
+    def run_once(self):
+        # A failed run (e.g. sql/024 not applied) just waits for the next slot.
+        self.next_run = time.monotonic() + self.every
+        try:
+            return compact(self.sb, log=lambda m: None)
+        except Exception:
+            return 0
+
+
+# ── Stage timing ──
+def transition_stats(sb, frm, to, since=None, until=None):
+    """Direct frm -> to moves made in [since, until): {n, mean_hours, p50_hours, p90_hours}."""
+    params = {"from_stage": frm, "to_stage": to}
+    if since:
+        params["since"] = since.isoformat()
+    if until:
+        params["until"] = until.isoformat()
+    rows = sb.rpc("stage_transition_stats", params).execute().data or []
+    return rows[0] if rows else {"n": 0, "mean_hours": None, "p50_hours": None, "p90_hours": None}
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    from db import connect
+
+    if sys.argv[1:2] != ["compact"]:
+        sys.exit(__doc__)
+    compact(connect(os.environ))
@@ -0,0 +1,95 @@
+import csv
+import gzip
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from applicants import iter_pages, iter_by_ids
+from records import parse_ts
+
+EXPORT_PAGE_SIZE = 1000
+
+# Parquet types per applicants column, fixed up front: a column that is all null on the
+# first page (duplicate_of, contacted_at, ...) must not pin the schema to string.
+_TS = pa.timestamp("us", tz="UTC")
+_LIST = pa.list_(pa.string())
+PARQUET_TYPES = {
+    "id": pa.int64(), "created_at": _TS, "updated_at": _TS,
+    "exp_mask": pa.int64(), "exp_list": _LIST, "experience_rank": pa.int64(),
+    "duplicate_of": pa.int64(), "submission_count": pa.int64(),
+    "stages_reached": pa.int64(), "contacted_at": _TS, "status_since": _TS,
+    "county_fips": _LIST, "service_miles": pa.int64(), "coverage_fips": _LIST,
+}
+
+FORMATS = {
+    "CSV": ("applicants.csv", "text/csv"),
+    "CSV (gzip)": ("applicants.csv.gz", "application/gzip"),
+    "Parquet": ("applicants.parquet", "application/vnd.apache.parquet"),
+}
+
+
+# ── Row sources ──
+def all_rows(sb):
+    return iter_pages(sb, EXPORT_PAGE_SIZE, ("*",))
+
+def filtered_rows(sb, rq):
+    return iter_pages(sb, EXPORT_PAGE_SIZE, ("*",), where=rq.apply)
+
+def rows_by_id(sb, ids):
+    return iter_by_ids(sb, ids, EXPORT_PAGE_SIZE)
+
+
+# ── Writers ──
+def _write_csv(pages, fh):
+    text = io.TextIOWrapper(fh, encoding="utf-8", newline="", write_through=True)
+    writer = None
+    for page in pages:
+        if writer is None:
+            writer = csv.DictWriter(text, fieldnames=list(page[0]), extrasaction="ignore")
+            writer.writeheader()
+        writer.writerows(page)
+    text.detach()
+
+def _schema(columns):
+    # Columns outside PARQUET_TYPES are written as text.
+    return pa.schema([pa.field(k, PARQUET_TYPES.get(k, pa.string())) for k in columns])
+
+def _cell(v, t):
+    if v is None:
+        return None
+    if t == _TS:
+        return parse_ts(v) if isinstance(v, str) else v
+    if t == pa.string() and not isinstance(v, str):
+        return str(v)
+    return v
+
+def _write_parquet(pages, fh):
+    schema = None
+    for page in pages:
+        if schema is None:
+            schema = _schema(page[0])
+            writer = pq.ParquetWriter(fh, schema, compression="zstd")
+        rows = [{f.name: _cell(r.get(f.name), f.type) for f in schema} for r in page]
+        writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+    if schema is None:
+        # Nothing matched: still a valid file, with the known columns and no rows.
+        schema = _schema(PARQUET_TYPES)
+        writer = pq.ParquetWriter(fh, schema, compression="zstd")
+    writer.close()
+
+
+def export_file(pages, fmt):
+    """Stream `pages` of row dicts into file bytes in the requested format.
+
+    Returns bytes: st.download_button reads a deferred result into memory either way.
+    """
+    fh = io.BytesIO()
+    if fmt == "Parquet":
+        _write_parquet(pages, fh)
+    elif fmt == "CSV (gzip)":
+        with gzip.GzipFile(fileobj=fh, mode="wb") as gz:
+            _write_csv(pages, gz)
+    else:
+        _write_csv(pages, fh)
+    return fh.getvalue()
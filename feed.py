@@ -0,0 +1,130 @@
+import asyncio
+import random
+import threading
+from typing import NamedTuple, Optional
+
+RECONNECT_MAX = 60.0
+
+
+class Change(NamedTuple):
+    kind: str                 # "INSERT", "UPDATE" or "DELETE"
+    record: Optional[dict]    # new row; None for deletes
+    old: Optional[dict]       # primary key (or full old row) for updates and deletes
+
+    @property
+    def id(self):
+        return (self.record or self.old or {}).get("id")
+
+
+class ChangeFeed:
+    """Fan-out of applicants row changes to subscribers.
+
+    `live` is True while the upstream subscription is healthy; consumers fall
+    back to delta polling when it is not. `version` counts delivered changes so
+    UI code can notice new events without touching the network.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.live = False
+        self.events = 0
+        self._handlers = []
+        self._state_handlers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, on_change, on_state=None):
+        self._handlers.append(on_change)
+        if on_state:
+            self._state_handlers.append(on_state)
+            on_state(self.live)
+
+    def emit(self, change):
+        with self._lock:
+            for fn in self._handlers:
+                fn(change)
+            self.events += 1
+            self.version += 1
+
+    def _set_live(self, live):
+        if live != self.live:
+            self.live = live
+            for fn in self._state_handlers:
+                fn(live)
+
+    def start(self):
+        return self
+
+
+class LocalFeed(ChangeFeed):
+    """In-process stand-in emitter; always live. Drives the feed without Supabase."""
+
+    def start(self):
+        self._set_live(True)
+        return self
+
+    def insert(self, record):
+        self.emit(Change("INSERT", record, None))
+
+    def update(self, record, old=None):
+        self.emit(Change("UPDATE", record, old or {"id": record["id"]}))
+
+    def delete(self, aid):
+        self.emit(Change("DELETE", None, {"id": aid}))
+
+
+class RealtimeFeed(ChangeFeed):
+    """Supabase Realtime postgres_changes on one table, on a background event loop.
+
+    Needs the table in the supabase_realtime publication (sql/019_realtime.sql).
+    """
+
+    def __init__(self, url, key, table="applicants", schema="public"):
+        super().__init__()
+        self.url = url.replace("http", "ws", 1).rstrip("/") + "/realtime/v1"
+        self.key, self.table, self.schema = key, table, schema
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=lambda: asyncio.run(self._run()), name="registry-feed", daemon=True)
+            self._thread.start()
+        return self
+
+    def _on_change(self, payload):
+        d = payload["data"]
+        kind = getattr(d["type"], "value", d["type"])
+        self.emit(Change(kind, d.get("record"), d.get("old_record")))
+
+    def _on_state(self, state, err=None):
+        self._set_live(getattr(state, "value", state) == "SUBSCRIBED")
+
+    async def _run(self):
+        from realtime import AsyncRealtimeClient
+        delay = 1.0
+        while True:
+            client = AsyncRealtimeClient(self.url, self.key)
+            try:
+                await client.connect()
+                ch = client.channel(f"registry:{self.table}")
+                ch.on_postgres_changes("*", self._on_change, table=self.table, schema=self.schema)
+                await ch.subscribe(self._on_state)
+                delay = 1.0
+                while client.is_connected:
+                    await asyncio.sleep(5)
+            except Exception:
+                pass
+            self._set_live(False)
+            try:
+                await client.close()
+            except Exception:
+                pass
+            await asyncio.sleep(delay * (0.5 + random.random()))
+            delay = min(RECONNECT_MAX, delay * 2)
+
+
+def make_feed(kind, url=None, key=None):
+    if kind == "realtime":
+        return RealtimeFeed(url, key)
+    if kind == "local":
+        return LocalFeed()
+    return None
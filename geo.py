@@ -0,0 +1,325 @@
+"""County resolution and service-area coverage for dispatch (sql/025).
+
+Free-text `counties` are resolved against the county file in data/ (FIPS code and a
+point per county), then each applicant's `radius` expands their counties
+to every county whose point lies within reach. That set is stored on the row as
+`coverage_fips` behind a GIN index, so "who covers Volusia County, FL" is one indexed
+lookup instead of someone reading every row.
+
+data/counties.txt ships with the app in the Gazetteer's tab layout: 50 states, DC and
+Puerto Rico from the Census 2016 cartographic county boundaries, each point being the
+centroid of the county's largest polygon. `fetch` swaps in the 2020 Gazetteer file.
+
+    python geo.py fetch           # replace COUNTY_DATA with the 2020 Gazetteer file
+    python geo.py index [--all]   # resolve rows not indexed yet (or every row, after a data update)
+"""
+import functools
+import io
+import json
+import math
+import re
+import zipfile
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import NamedTuple
+from urllib.request import urlopen
+
+from applicants import BULK_CHUNK
+
+COUNTY_DATA = str(Path(__file__).parent / "data" / "counties.txt")
+# 2020 still lists Connecticut's eight counties; later files carry its planning regions instead.
+GAZETTEER_URL = ("https://www2.census.gov/geo/docs/maps-data/data/gazetteer/"
+                 "2020_Gazetteer/2020_Gaz_counties_national.zip")
+# The form's travel radius options; "100+" is read as a generous but finite reach.
+RADIUS_MILES = {"Up to 25 miles": 25, "Up to 50 miles": 50, "Up to 75 miles": 75,
+                "Up to 100 miles": 100, "100+ miles": 150}
+# Centroid grid cell, in degrees; a 150-mile reach touches at most a handful of cells per axis.
+CELL = 1.0
+EARTH_MILES = 3958.8
+# Rows resolved per page by `python geo.py index`.
+INDEX_BATCH = 1000
+DISPATCH_LIMIT = 200
+# Dispatch widens around the job through these reaches (miles from a listed county), so the
+# nearest technicians come back even when more than DISPATCH_LIMIT cover the county.
+RINGS = (0, 25, 50, 100)
+DISPATCH_COLUMNS = ("id", "name", "phone", "email", "state", "counties", "radius", "status",
+                    "experience", "vehicle", "ladder", "insurance", "county_fips", "service_miles")
+
+STATES = {
+    "Alabama": "AL", "Alaska": "AK", "Arizona": "AZ", "Arkansas": "AR", "California": "CA", "Colorado": "CO",
+    "Connecticut": "CT", "Delaware": "DE", "District of Columbia": "DC", "Florida": "FL", "Georgia": "GA",
+    "Hawaii": "HI", "Idaho": "ID", "Illinois": "IL", "Indiana": "IN", "Iowa": "IA", "Kansas": "KS",
+    "Kentucky": "KY", "Louisiana": "LA", "Maine": "ME", "Maryland": "MD", "Massachusetts": "MA",
+    "Michigan": "MI", "Minnesota": "MN", "Mississippi": "MS", "Missouri": "MO", "Montana": "MT",
+    "Nebraska": "NE", "Nevada": "NV", "New Hampshire": "NH", "New Jersey": "NJ", "New Mexico": "NM",
+    "New York": "NY", "North Carolina": "NC", "North Dakota": "ND", "Ohio": "OH", "Oklahoma": "OK",
+    "Oregon": "OR", "Pennsylvania": "PA", "Puerto Rico": "PR", "Rhode Island": "RI", "South Carolina": "SC",
+    "South Dakota": "SD", "Tennessee": "TN", "Texas": "TX", "Utah": "UT", "Vermont": "VT", "Virginia": "VA",
+    "Washington": "WA", "West Virginia": "WV", "Wisconsin": "WI", "Wyoming": "WY",
+}
+STATE_NAMES = {v: k for k, v in STATES.items()}
+
+# "Orange, Seminole / Osceola; Lake" -> one token per county.
+_SEP = re.compile(r"[,;/&+\n|]+")
+# Plurals too: "Orange and Seminole counties" splits into two keys that each end in the suffix.
+_SUFFIX = re.compile(r"\b(count(?:y|ies)|cnty|cos?|parish(?:es)?|boroughs?|census areas?|city and borough"
+                     r"|municipality|municipalities|municipios?)$")
+_ANYWHERE = {"all", "any", "anywhere", "statewide", "all counties", "any county", "entire state", "whole state"}
+
+
+class County(NamedTuple):
+    fips: str
+    state: str
+    name: str
+    lat: float
+    lon: float
+
+    @property
+    def label(self):
+        return f"{self.name}, {self.state}"
+
+
+def county_key(s):
+    # "St. Johns County" / "Saint Johns" / "st johns co" -> "stjohns".
+    s = re.sub(r"[.'’]", "", (s or "").lower())
+    s = re.sub(r"[^a-z0-9]+", " ", s).strip()
+    s = _SUFFIX.sub("", s).strip()
+    s = re.sub(r"^saint\b", "st", re.sub(r"^sainte\b", "ste", s))
+    return s.replace(" ", "")
+
+def miles(lat1, lon1, lat2, lon2):
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((p2 - p1) / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_MILES * math.asin(min(1.0, math.sqrt(a)))
+
+def radius_miles(radius):
+    # Blank or unknown radius: the listed counties only.
+    return RADIUS_MILES.get((radius or "").strip(), 0)
+
+def state_code(state):
+    state = (state or "").strip()
+    return STATES.get(state) or (state.upper() if state.upper() in STATE_NAMES else "")
+
+
+class CountyIndex:
+    """Counties by FIPS, by (state, name key) and on a lat/lon grid of their internal points."""
+
+    def __init__(self, counties=()):
+        self.by_fips = {}
+        self.by_name = {}
+        self.by_state = defaultdict(list)
+        self.names = defaultdict(list)
+        self.grid = defaultdict(list)
+        for c in counties:
+            self.add(c)
+
+    def add(self, c):
+        self.by_fips[c.fips] = c
+        self.by_state[c.state].append(c)
+        key = county_key(c.name)
+        self.by_name[(c.state, key)] = c
+        self.names[key].append(c)
+        self.grid[self._cell(c.lat, c.lon)].append(c)
+
+    @staticmethod
+    def _cell(lat, lon):
+        return int(math.floor(lat / CELL)), int(math.floor(lon / CELL))
+
+    @classmethod
+    def load(cls, path=COUNTY_DATA):
+        # Gazetteer layout: tab-separated USPS, GEOID, NAME, ..., INTPTLAT, INTPTLONG (extra columns ignored).
+        with open(path, encoding="utf-8-sig") as f:
+            head = [h.strip() for h in f.readline().split("\t")]
+            col = {h: i for i, h in enumerate(head)}
+            out = []
+            for line in f:
+                p = line.rstrip("\n").split("\t")
+                if len(p) < len(head):
+                    continue
+                out.append(County(p[col["GEOID"]].strip(), p[col["USPS"]].strip(), p[col["NAME"]].strip(),
+                                  float(p[col["INTPTLAT"]]), float(p[col["INTPTLONG"]])))
+        return cls(out)
+
+    # ── Resolution ──
+    def find(self, state, name):
+        key = county_key(name)
+        if not key:
+            return None
+        if state:
+            # Virginia's independent cities are "<name> city"; a bare name prefers the county.
+            return self.by_name.get((state, key)) or self.by_name.get((state, key + "city"))
+        hits = self.names.get(key, ())
+        return hits[0] if len(hits) == 1 else None
+
+    def resolve(self, state, text):
+        """(FIPS codes in the order written, tokens that matched nothing) for one applicant."""
+        st = state_code(state)
+        found, missed = [], []
+        for tok in _SEP.split(text or ""):
+            tok = tok.strip()
+            if not tok:
+                continue
+            # "Florida" from a Florida applicant is noise, but "New York" in NY is also a county.
+            named = state_code(tok.title())
+            if named and named == (st or named) and not self.find(st, tok):
+                continue
+            if tok.lower() in _ANYWHERE and st:
+                found += [c.fips for c in self.by_state[st]]
+                continue
+            words = tok.split()
+            if st and len(words) > 1 and words[-1].upper() == st:
+                tok = " ".join(words[:-1])
+            c = self.find(st, tok)
+            if c:
+                found.append(c.fips)
+                continue
+            # "Orange and Seminole" splits only when the whole token fails ("Lewis and Clark" is one county).
+            parts = [self.find(st, p) for p in re.split(r"\s+(?:and|or)\s+", tok, flags=re.I)]
+            if len(parts) > 1 and all(parts):
+                found += [p.fips for p in parts]
+            else:
+                missed.append(tok)
+        return list(dict.fromkeys(found)), missed
+
+    # ── Geometry ──
+    def near(self, lat, lon, reach):
+        """(county, miles) for every county whose point is within `reach` miles."""
+        dlat = reach / 69.0
+        dlon = reach / max(1.0, 69.17 * math.cos(math.radians(lat)))
+        (r0, c0), (r1, c1) = self._cell(lat - dlat, lon - dlon), self._cell(lat + dlat, lon + dlon)
+        out = []
+        for r in range(r0, r1 + 1):
+            for c in range(c0, c1 + 1):
+                for cty in self.grid.get((r, c), ()):
+                    d = miles(lat, lon, cty.lat, cty.lon)
+                    if d <= reach:
+                        out.append((cty, d))
+        return out
+
+    def nearest(self, lat, lon):
+        # Closest internal point stands in for the containing county; good enough to pick a dispatch area.
+        reach = 25
+        while reach <= 3200:
+            hits = self.near(lat, lon, reach)
+            if hits:
+                return min(hits, key=lambda h: h[1])[0]
+            reach *= 2
+        return None
+
+    def coverage(self, fips, reach):
+        # Listed counties plus everything within `reach` of any of them.
+        out = set(fips)
+        for f in fips:
+            c = self.by_fips[f]
+            out.update(o.fips for o, _ in self.near(c.lat, c.lon, reach))
+        return sorted(out)
+
+    def service_area(self, state, counties, radius):
+        """The sql/025 columns for one applicants row, plus the tokens that did not resolve."""
+        fips, missed = self.resolve(state, counties)
+        reach = radius_miles(radius)
+        return {"county_fips": fips, "service_miles": reach, "coverage_fips": self.coverage(fips, reach)}, missed
+
+    def distance(self, fips, lat, lon):
+        # Miles from the nearest of an applicant's listed counties to a job.
+        return min((miles(c.lat, c.lon, lat, lon) for c in map(self.by_fips.get, fips or ()) if c), default=None)
+
+
+@functools.lru_cache(maxsize=1)
+def county_index(path=COUNTY_DATA):
+    # None if the data file has been removed from the deploy.
+    return CountyIndex.load(path) if Path(path).exists() else None
+
+def service_area(state, counties, radius):
+    # Columns to store with a new submission; empty without county data, so the row is indexed later.
+    idx = county_index()
+    return idx.service_area(state, counties, radius)[0] if idx else {}
+
+
+# ── Dispatch ──
+def covering(sb, fips, lat=None, lon=None, statuses=None, limit=DISPATCH_LIMIT):
+    """Up to `limit` applicants whose service area includes county `fips`, nearest first.
+
+    Distance is from each applicant's closest listed county to the job (`lat`/`lon`,
+    or the county's internal point). Each ring that comes back short of `limit` is
+    complete, so only the outermost ring fetched can be cut off.
+    """
+    idx = county_index()
+    if lat is None:
+        c = idx.by_fips[fips]
+        lat, lon = c.lat, c.lon
+    found = {}
+    for reach in RINGS + (None,):
+        q = (sb.table("applicants").select(",".join(DISPATCH_COLUMNS))
+             .contains("coverage_fips", [fips]).is_("duplicate_of", "null"))
+        if statuses:
+            q = q.in_("status", list(statuses))
+        if reach is not None:
+            q = q.ov("county_fips", sorted({fips} | {c.fips for c, _ in idx.near(lat, lon, reach)}))
+        for r in q.limit(limit).execute().data or []:
+            found.setdefault(r["id"], r)
+        if len(found) >= limit:
+            break
+    for r in found.values():
+        r["miles"] = idx.distance(r.get("county_fips"), lat, lon)
+    return sorted(found.values(), key=lambda r: (r["miles"] is None, r["miles"] or 0))[:limit]
+
+
+# ── Ingest ──
+def index_applicants(sb, everything=False, batch=INDEX_BATCH, log=print):
+    """Resolve and store service areas, id-keyset paged; returns (rows indexed, unmatched tokens).
+
+    Rows with the same resolved area are written with one update, so a backfill costs
+    roughly one request per distinct (counties, radius) answer rather than one per row.
+    """
+    idx = county_index()
+    if idx is None:
+        raise FileNotFoundError(f"{COUNTY_DATA} not found; run `python geo.py fetch` first")
+    after, done, unmatched = 0, 0, Counter()
+    while True:
+        q = sb.table("applicants").select("id,state,counties,radius").gt("id", after)
+        if not everything:
+            q = q.is_("coverage_fips", "null")
+        rows = q.order("id").limit(batch).execute().data or []
+        if not rows:
+            break
+        groups = defaultdict(list)
+        for r in rows:
+            area, missed = idx.service_area(r.get("state"), r.get("counties"), r.get("radius"))
+            unmatched.update(f"{t} ({state_code(r.get('state')) or '?'})" for t in missed)
+            groups[json.dumps(area, sort_keys=True)].append(r["id"])
+        for area, ids in groups.items():
+            for i in range(0, len(ids), BULK_CHUNK):
+                sb.table("applicants").update(json.loads(area)).in_("id", ids[i:i + BULK_CHUNK]).execute()
+        after, done = rows[-1]["id"], done + len(rows)
+        log(f"indexed through id {after} ({done} rows, {len(groups)} distinct areas this page)")
+        if len(rows) < batch:
+            break
+    return done, unmatched
+
+
+def fetch(path=COUNTY_DATA, url=GAZETTEER_URL):
+    with urlopen(url) as r:
+        z = zipfile.ZipFile(io.BytesIO(r.read()))
+    name = next(n for n in z.namelist() if n.endswith(".txt"))
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_bytes(z.read(name))
+    return len(CountyIndex.load(path).by_fips)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    from db import connect
+
+    cmd = sys.argv[1:2]
+    if cmd == ["fetch"]:
+        print(f"{fetch()} counties written to {COUNTY_DATA}")
+    elif cmd == ["index"]:
+        n, unmatched = index_applicants(connect(os.environ), everything="--all" in sys.argv)
+        print(f"{n} rows indexed; {sum(unmatched.values())} county entries unmatched")
+        for tok, k in unmatched.most_common(20):
+            print(f"  {k:5d}  {tok}")
+    else:
+        sys.exit(__doc__)
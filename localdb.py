@@ -0,0 +1,830 @@
+"""Embedded SQLite backend behind the same client surface as supabase-py.
+
+applicants.py, query.py, search.py, aggregates.py, dedup.py and outbox.py only
+ever speak `sb.table(...)...execute()`, `sb.rpc(...)` and `sb.storage`; LocalClient
+answers those from one SQLite file, so either app can run against a local replica
+(DB_BACKEND = "sqlite") for offline work, heavy analysis or scale testing.
+
+    python localdb.py pull [path]    # full copy, then deltas, from SUPABASE_URL / SUPABASE_KEY
+"""
+import json
+import re
+import sqlite3
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from applicants import STAGE_BIT, STAGE_BITS
+from dedup import identity_key
+from records import EXPERIENCE_RANK, exp_mask
+from search import digits
+
+LOCAL_DB_PATH = ".local/registry.db"
+# Photos uploaded while running locally land here instead of Supabase Storage.
+LOCAL_STORAGE_PATH = ".local/storage"
+# Rows per executemany() when loading a replica.
+LOAD_BATCH = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applicants (
+    id                  INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at          TEXT NOT NULL,
+    updated_at          TEXT NOT NULL,
+    name TEXT, email TEXT, phone TEXT, state TEXT, counties TEXT, radius TEXT,
+    experience TEXT, exp_types TEXT,
+    exp_mask            INTEGER NOT NULL DEFAULT 0,
+    vehicle TEXT, ladder TEXT, insurance TEXT,
+    photo1_url TEXT, photo2_url TEXT, photo1_medium_url TEXT, photo2_medium_url TEXT,
+    photo1_thumb_url TEXT, photo2_thumb_url TEXT,
+    status              TEXT NOT NULL DEFAULT 'NEW',
+    notes               TEXT,
+    submission_key      TEXT UNIQUE,
+    duplicate_of        INTEGER,
+    submission_count    INTEGER NOT NULL DEFAULT 1,
+    last_submission_key TEXT,
+    stages_reached      INTEGER NOT NULL DEFAULT 0,
+    contacted_at        TEXT,
+    -- Generated in Postgres (sql/008, 010, 017); derived in Python here, see _derive().
+    exp_list TEXT, experience_rank INTEGER, phone_digits TEXT, identity_key TEXT
+);
+CREATE INDEX IF NOT EXISTS applicants_created_id_idx     ON applicants (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS applicants_status_created_idx ON applicants (status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS applicants_updated_at_idx     ON applicants (updated_at, id);
+CREATE INDEX IF NOT EXISTS applicants_phone_digits_idx   ON applicants (phone_digits);
+CREATE INDEX IF NOT EXISTS applicants_state_created_idx  ON applicants (state, created_at DESC);
+CREATE INDEX IF NOT EXISTS applicants_exp_rank_created_idx ON applicants (experience_rank DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS applicants_identity_key_idx
+    ON applicants (identity_key, created_at) WHERE duplicate_of IS NULL;
+CREATE INDEX IF NOT EXISTS applicants_duplicate_of_idx   ON applicants (duplicate_of) WHERE duplicate_of IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS applicant_tombstones (
+    id         INTEGER PRIMARY KEY,
+    deleted_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS applicant_tombstones_deleted_at_idx ON applicant_tombstones (deleted_at);
+
+CREATE TABLE IF NOT EXISTS site_settings (
+    id             INTEGER PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    hero_title     TEXT DEFAULT 'Starlink Technician',
+    hero_subtitle  TEXT DEFAULT 'Greater metro area · Flexible schedule · Performance-based pay',
+    job_desc       TEXT DEFAULT 'We are hiring experienced technicians to install Starlink satellite internet systems across the greater metro area.',
+    earning_min    TEXT DEFAULT '$1,200',
+    earning_max    TEXT DEFAULT '$1,800',
+    daily_installs TEXT DEFAULT '3 – 5',
+    requirements   TEXT DEFAULT 'Reliable truck/van/SUV, 24ft+ fiberglass ladder, Basic tools & power drill, Smartphone w/ data plan',
+    duties         TEXT DEFAULT 'Residential Starlink installations, Roof mounting & cable routing, Signal optimization & testing, Customer walkthroughs',
+    last_updated   TEXT
+);
+INSERT OR IGNORE INTO site_settings (id) VALUES (1);
+
+-- pull() bookkeeping. pulled_through is the newest remote updated_at / deleted_at copied in;
+-- local writes stamp their own clock and never move it.
+CREATE TABLE IF NOT EXISTS replica_meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Funnel rollups from sql/023, kept current by SQLite triggers instead of plpgsql.
+ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS applicant_stages (stage TEXT PRIMARY KEY, bit INTEGER NOT NULL);
+INSERT OR IGNORE INTO applicant_stages VALUES
+    ('NEW', 1), ('REVIEWED', 2), ('CONTACTED', 4), ('INTERVIEW', 8), ('HIRED', 16), ('REJECTED', 32);
+CREATE TABLE IF NOT EXISTS applicant_cohorts (
+    day TEXT NOT NULL, state TEXT NOT NULL, status TEXT NOT NULL, n INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, state, status)
+);
+CREATE TABLE IF NOT EXISTS applicant_stage_counts (
+    day TEXT NOT NULL, state TEXT NOT NULL, stage TEXT NOT NULL, n INTEGER NOT NULL DEFAULT 0,
+    timed INTEGER NOT NULL DEFAULT 0, hours REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, state, stage)
+);
+CREATE TRIGGER IF NOT EXISTS applicants_rollup_ins AFTER INSERT ON applicants BEGIN {new} END;
+CREATE TRIGGER IF NOT EXISTS applicants_rollup_del AFTER DELETE ON applicants BEGIN {old} END;
+CREATE TRIGGER IF NOT EXISTS applicants_rollup_upd
+AFTER UPDATE OF status, state, created_at, stages_reached, contacted_at ON applicants BEGIN {old} {new} END;
+"""
+
+
+def _roll(r, sign):
+    day, st = f"substr({r}.created_at, 1, 10)", f"coalesce({r}.state, '')"
+    timed = f"s.stage = 'CONTACTED' AND {r}.contacted_at IS NOT NULL"
+    return f"""
+    INSERT INTO applicant_cohorts (day, state, status, n) VALUES ({day}, {st}, {r}.status, {sign})
+    ON CONFLICT (day, state, status) DO UPDATE SET n = n + excluded.n;
+    INSERT INTO applicant_stage_counts (day, state, stage, n, timed, hours)
+    SELECT {day}, {st}, s.stage, {sign}, CASE WHEN {timed} THEN {sign} ELSE 0 END,
+           CASE WHEN {timed} THEN {sign} * (julianday({r}.contacted_at) - julianday({r}.created_at)) * 24 ELSE 0 END
+    FROM applicant_stages s WHERE {r}.stages_reached & s.bit <> 0
+    ON CONFLICT (day, state, stage) DO UPDATE
+        SET n = n + excluded.n, timed = timed + excluded.timed, hours = hours + excluded.hours;"""
+
+
+# Event log and snapshots from sql/024. Rows copied in by load() already carry their
+# history, so the event triggers stand down while a replica_load row exists. Pulled events
+# take a local seq like any other and keep Supabase's in source_seq, which is what pull()
+# resumes from; local writes can run ahead of the remote log without colliding.
+_NOW = "strftime('%Y-%m-%dT%H:%M:%f000+00:00', 'now')"
+_LIVE = "NOT EXISTS (SELECT 1 FROM replica_load)"
+EVENT_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS replica_load (active INTEGER);
+CREATE TABLE IF NOT EXISTS applicant_events (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    applicant_id INTEGER NOT NULL,
+    at           TEXT    NOT NULL DEFAULT ({_NOW}),
+    kind         TEXT    NOT NULL CHECK (kind IN ('imported', 'created', 'status', 'notes', 'deleted')),
+    from_status TEXT, to_status TEXT, entered_at TEXT, notes TEXT,
+    source_seq   INTEGER
+);
+CREATE UNIQUE INDEX IF NOT EXISTS applicant_events_source_seq_idx ON applicant_events (source_seq);
+CREATE INDEX IF NOT EXISTS applicant_events_applicant_seq_idx ON applicant_events (applicant_id, seq);
+CREATE INDEX IF NOT EXISTS applicant_events_transition_idx
+    ON applicant_events (from_status, to_status, at) WHERE kind = 'status';
+CREATE TABLE IF NOT EXISTS applicant_snapshots (
+    applicant_id INTEGER PRIMARY KEY,
+    seq          INTEGER NOT NULL,
+    snapshot     TEXT    NOT NULL,
+    taken_at     TEXT    NOT NULL DEFAULT ({_NOW})
+);
+CREATE INDEX IF NOT EXISTS applicant_snapshots_seq_idx ON applicant_snapshots (seq);
+
+CREATE TRIGGER IF NOT EXISTS applicant_events_no_update BEFORE UPDATE ON applicant_events
+BEGIN SELECT RAISE(ABORT, 'applicant_events is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS applicant_events_no_delete BEFORE DELETE ON applicant_events
+BEGIN SELECT RAISE(ABORT, 'applicant_events is append-only'); END;
+
+CREATE TRIGGER IF NOT EXISTS applicants_status_since_ins AFTER INSERT ON applicants WHEN NEW.status_since IS NULL
+BEGIN UPDATE applicants SET status_since = NEW.created_at WHERE id = NEW.id; END;
+CREATE TRIGGER IF NOT EXISTS applicants_status_since_upd AFTER UPDATE OF status ON applicants
+WHEN OLD.status IS NOT NEW.status AND {_LIVE}
+BEGIN UPDATE applicants SET status_since = {_NOW} WHERE id = NEW.id; END;
+
+CREATE TRIGGER IF NOT EXISTS applicants_event_ins AFTER INSERT ON applicants WHEN {_LIVE}
+BEGIN
+    INSERT INTO applicant_events (applicant_id, at, kind, to_status, notes)
+    VALUES (NEW.id, coalesce(NEW.status_since, NEW.created_at), 'created', NEW.status, NEW.notes);
+END;
+CREATE TRIGGER IF NOT EXISTS applicants_event_status AFTER UPDATE OF status ON applicants
+WHEN OLD.status IS NOT NEW.status AND {_LIVE}
+BEGIN
+    INSERT INTO applicant_events (applicant_id, at, kind, from_status, to_status, entered_at)
+    VALUES (NEW.id, {_NOW}, 'status', OLD.status, NEW.status, OLD.status_since);
+END;
+CREATE TRIGGER IF NOT EXISTS applicants_event_notes AFTER UPDATE OF notes ON applicants
+WHEN OLD.notes IS NOT NEW.notes AND {_LIVE}
+BEGIN INSERT INTO applicant_events (applicant_id, kind, notes) VALUES (NEW.id, 'notes', NEW.notes); END;
+CREATE TRIGGER IF NOT EXISTS applicants_event_del AFTER DELETE ON applicants WHEN {_LIVE}
+BEGIN
+    INSERT INTO applicant_events (applicant_id, kind, from_status, entered_at)
+    VALUES (OLD.id, 'deleted', OLD.status, OLD.status_since);
+END;
+"""
+
+# Service areas from sql/025. Postgres answers coverage_fips @> '{fips}' from a GIN index;
+# here a side table holds one (fips, applicant) row per covered county, kept by triggers.
+COVERAGE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS applicant_coverage (
+    fips         TEXT    NOT NULL,
+    applicant_id INTEGER NOT NULL,
+    PRIMARY KEY (fips, applicant_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS applicant_coverage_applicant_idx ON applicant_coverage (applicant_id);
+CREATE TRIGGER IF NOT EXISTS applicants_coverage_ins AFTER INSERT ON applicants WHEN NEW.coverage_fips IS NOT NULL
+BEGIN INSERT OR IGNORE INTO applicant_coverage SELECT value, NEW.id FROM json_each(NEW.coverage_fips); END;
+CREATE TRIGGER IF NOT EXISTS applicants_coverage_upd AFTER UPDATE OF coverage_fips ON applicants
+BEGIN
+    DELETE FROM applicant_coverage WHERE applicant_id = OLD.id;
+    INSERT OR IGNORE INTO applicant_coverage SELECT value, NEW.id FROM json_each(coalesce(NEW.coverage_fips, '[]'));
+END;
+CREATE TRIGGER IF NOT EXISTS applicants_coverage_del AFTER DELETE ON applicants
+BEGIN DELETE FROM applicant_coverage WHERE applicant_id = OLD.id; END;
+"""
+
+# Columns added after a local file may have been created; ALTERed in on open.
+ADDED_COLUMNS = {"applicants": {"stages_reached": "INTEGER NOT NULL DEFAULT 0", "contacted_at": "TEXT",
+                                "status_since": "TEXT", "county_fips": "TEXT", "service_miles": "INTEGER",
+                                "coverage_fips": "TEXT"},
+                 "applicant_events": {"source_seq": "INTEGER"}}
+ROLLUPS = ("applicant_stages", "applicant_cohorts", "applicant_stage_counts")
+EVENTS = ("applicant_events", "applicant_snapshots")
+# Conflict key per table for load(); the event log is only ever appended to.
+KEYS = {"applicant_events": "source_seq", "applicant_snapshots": "applicant_id"}
+APPEND_ONLY = {"applicant_events"}
+
+TIMESTAMPS = {"created_at", "updated_at", "deleted_at", "last_updated", "contacted_at", "status_since",
+              "at", "entered_at", "taken_at"}
+ARRAYS = {"exp_list"}
+# text[] of FIPS codes from sql/025, filterable with ov()/contains().
+FIPS_ARRAYS = {"county_fips", "coverage_fips"}
+# Stored as JSON text; jsonb / text[] in Postgres.
+JSON = ARRAYS | FIPS_ARRAYS | {"snapshot"}
+# Inputs of the derived columns; a write touching any of them re-derives the row.
+DERIVED_FROM = {"phone", "email", "exp_types", "experience", "status"}
+
+# `_after` keyset cursors; a row-value comparison lets SQLite seek the (col, id) index.
+_KEYSET = re.compile(r'^(\w+)\.(lt|gt)\."([^"]+)",and\(\1\.eq\."\3",id\.\2\.(-?\d+)\)$')
+_OPS = {"eq": "=", "neq": "<>", "lt": "<", "lte": "<=", "gt": ">", "gte": ">="}
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _ts(v):
+    # One fixed-width UTC format, so TEXT comparison and ordering match timestamptz.
+    if not isinstance(v, str) or not v:
+        return v
+    try:
+        t = datetime.fromisoformat(v.strip('"'))
+    except ValueError:
+        return v
+    if t.tzinfo is None:
+        t = t.replace(tzinfo=timezone.utc)
+    return t.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _derive(r, now=None):
+    # Mirrors the generated columns in sql/008, sql/010 and sql/017, and track_stages() in sql/023;
+    # contacted_at is only stamped for live writes (`now`), never for rows loaded from Supabase.
+    r["stages_reached"] = (r.get("stages_reached") or 0) | STAGE_BITS.get(r.get("status"), 0)
+    if now and r["stages_reached"] & STAGE_BIT["CONTACTED"] and not r.get("contacted_at"):
+        r["contacted_at"] = now
+    et = r.get("exp_types") or ""
+    r["exp_list"] = json.dumps([] if et in ("", "None selected") else et.split(", "))
+    r["experience_rank"] = EXPERIENCE_RANK.get(r.get("experience"), -1)
+    r["phone_digits"] = digits(r.get("phone"))
+    r["identity_key"] = identity_key(r.get("phone"), r.get("email"))
+    return r
+
+
+def _split(s):
+    out, depth, cur = [], 0, ""
+    for ch in s:
+        depth += (ch == "(") - (ch == ")")
+        if ch == "," and depth == 0:
+            out.append(cur)
+            cur = ""
+        else:
+            cur += ch
+    return out + [cur]
+
+
+def _like(pat):
+    return pat.strip('"').replace("*", "%")
+
+
+def _glob(pat):
+    return re.sub(r"([\[\]?])", r"[\1]", pat.strip('"')).replace("%", "*")
+
+
+class LocalQuery:
+    """One PostgREST-style request against a LocalClient table, compiled to SQL on execute()."""
+
+    def __init__(self, db, name):
+        if name not in db.columns:
+            raise ValueError(f"relation {name!r} does not exist")
+        self.db, self.name, self.key = db, name, KEYS.get(name, "id")
+        self.where, self.params, self.orders = [], [], []
+        self.mode, self.payload, self.cols = "select", None, ["*"]
+        self.lim, self.off, self.count, self.head = None, 0, None, False
+        self.on_conflict, self.ignore_duplicates = None, False
+
+    def _col(self, c):
+        c = c.strip()
+        if c not in self.db.columns[self.name]:
+            raise ValueError(f"column {self.name}.{c} does not exist")
+        return c
+
+    def _val(self, c, v):
+        if isinstance(v, str):
+            v = v.strip('"')
+        return _ts(v) if c in TIMESTAMPS else v
+
+    # ── Verbs ──
+    def select(self, *cols, count=None, head=None):
+        cols = [c.strip() for c in ",".join(cols).split(",") if c.strip()] or ["*"]
+        self.cols = ["*"] if "*" in cols else [self._col(c) for c in cols]
+        self.count, self.head = count, bool(head)
+        return self
+
+    def insert(self, payload, **kw):
+        self.mode, self.payload = "insert", payload
+        return self
+
+    def upsert(self, payload, on_conflict="", ignore_duplicates=False, **kw):
+        self.mode, self.payload = "upsert", payload
+        self.on_conflict, self.ignore_duplicates = self._col(on_conflict or self.key), ignore_duplicates
+        return self
+
+    def update(self, payload, **kw):
+        self.mode, self.payload = "update", payload
+        return self
+
+    def delete(self, **kw):
+        self.mode = "delete"
+        return self
+
+    # ── Filters ──
+    def _w(self, sql, *params):
+        self.where.append(sql)
+        self.params.extend(params)
+        return self
+
+    def _cmp(self, op, c, v):
+        c = self._col(c)
+        return f'"{c}" {_OPS[op]} ?', [self._val(c, v)]
+
+    def _op(self, op, c, v):
+        sql, params = self._cmp(op, c, v)
+        return self._w(sql, *params)
+
+    def eq(self, c, v): return self._op("eq", c, v)
+    def neq(self, c, v): return self._op("neq", c, v)
+    def lt(self, c, v): return self._op("lt", c, v)
+    def lte(self, c, v): return self._op("lte", c, v)
+    def gt(self, c, v): return self._op("gt", c, v)
+    def gte(self, c, v): return self._op("gte", c, v)
+
+    def like(self, c, pat):
+        return self._w(f'"{self._col(c)}" GLOB ?', _glob(pat))
+
+    def ilike(self, c, pat):
+        # SQLite LIKE is case-insensitive for ASCII, which covers names, emails and counties.
+        return self._w(f'"{self._col(c)}" LIKE ?', _like(pat))
+
+    def in_(self, c, vs):
+        c, vs = self._col(c), [self._val(c, v) for v in vs]
+        if not vs:
+            return self._w("0")
+        return self._w(f'"{c}" IN ({",".join("?" * len(vs))})', *vs)
+
+    def is_(self, c, v):
+        c = self._col(c)
+        if v in (None, "null"):
+            return self._w(f'"{c}" IS NULL')
+        return self._w(f'"{c}" IS ?', {"true": 1, "false": 0}.get(v, v))
+
+    def ov(self, c, vs):
+        # exp_list's bitmask twin answers overlap without unpacking JSON; coverage_fips has its side table.
+        c = self._array(c)
+        if c == "exp_list":
+            return self._w("(exp_mask & ?) != 0", exp_mask(vs))
+        if not vs:
+            return self._w("0")
+        marks = ",".join("?" * len(vs))
+        if c == "coverage_fips":
+            return self._w(f"id IN (SELECT applicant_id FROM applicant_coverage WHERE fips IN ({marks}))", *vs)
+        return self._w(f'EXISTS (SELECT 1 FROM json_each("{c}") WHERE value IN ({marks}))', *vs)
+
+    def contains(self, c, vs):
+        c = self._array(c)
+        if c == "exp_list":
+            m = exp_mask(vs)
+            return self._w("(exp_mask & ?) = ?", m, m)
+        for v in vs:
+            if c == "coverage_fips":
+                self._w("id IN (SELECT applicant_id FROM applicant_coverage WHERE fips = ?)", v)
+            else:
+                self._w(f'EXISTS (SELECT 1 FROM json_each("{c}") WHERE value = ?)', v)
+        return self
+
+    def _array(self, c):
+        c = self._col(c)
+        if c not in ARRAYS | FIPS_ARRAYS:
+            raise ValueError(f"column {self.name}.{c} is not an array")
+        return c
+
+    def or_(self, expr):
+        m = _KEYSET.match(expr)
+        if m:
+            c, op, ts, aid = m.groups()
+            c = self._col(c)
+            return self._w(f'("{c}", id) {_OPS[op]} (?, ?)', self._val(c, ts), int(aid))
+        sql, params = self._parse(f"or({expr})")
+        return self._w(sql, *params)
+
+    def _parse(self, expr):
+        # PostgREST logic-tree syntax as used by or_(): col.op.value, and(...), or(...).
+        expr = expr.strip()
+        for kw in ("and", "or"):
+            if expr.startswith(kw + "("):
+                parts = [self._parse(p) for p in _split(expr[len(kw) + 1:-1])]
+                sql = f" {kw.upper()} ".join(s for s, _ in parts)
+                return f"({sql})", [v for _, ps in parts for v in ps]
+        c, op, val = expr.split(".", 2)
+        c = self._col(c)
+        if op == "in":
+            vals = [self._val(c, v) for v in _split(val.strip("()"))]
+            return f'"{c}" IN ({",".join("?" * len(vals))})', vals
+        if op == "ilike":
+            return f'"{c}" LIKE ?', [_like(val)]
+        if op == "like":
+            return f'"{c}" GLOB ?', [_glob(val)]
+        if op == "is":
+            return (f'"{c}" IS NULL', []) if val == "null" else (f'"{c}" IS ?', [val])
+        return self._cmp(op, c, val)
+
+    # ── Modifiers ──
+    def order(self, c, desc=False, nullsfirst=None):
+        # SQLite's default null placement is kept so the (col DESC) indexes still serve the sort.
+        nulls = "" if nullsfirst is None else (" NULLS FIRST" if nullsfirst else " NULLS LAST")
+        self.orders.append(f'"{self._col(c)}" {"DESC" if desc else "ASC"}{nulls}')
+        return self
+
+    def limit(self, n):
+        self.lim = n
+        return self
+
+    def range(self, a, b):
+        self.off, self.lim = a, b - a + 1
+        return self
+
+    def execute(self):
+        self.db.calls[(self.name, self.mode)] += 1
+        with self.db.lock, self.db.conn:
+            if self.mode == "select":
+                return self._read()
+            if self.mode == "delete":
+                return self._delete()
+            if self.mode == "update":
+                return self._update()
+            return self._write()
+
+    # ── Execution ──
+    def _clause(self):
+        return f" WHERE {' AND '.join(self.where)}" if self.where else ""
+
+    def _read(self):
+        n = None
+        if self.count:
+            n = self.db.conn.execute(f"SELECT count(*) FROM {self.name}{self._clause()}", self.params).fetchone()[0]
+        if self.head:
+            return _result([], n)
+        cols = "*" if self.cols == ["*"] else ", ".join(f'"{c}"' for c in self.cols)
+        sql = f"SELECT {cols} FROM {self.name}{self._clause()}"
+        if self.orders:
+            sql += " ORDER BY " + ", ".join(self.orders)
+        if self.lim is not None or self.off:
+            sql += f" LIMIT {-1 if self.lim is None else int(self.lim)} OFFSET {int(self.off)}"
+        return _result(self.db.rows(self.db.conn.execute(sql, self.params)), n)
+
+    def _ids(self):
+        return [r[0] for r in self.db.conn.execute(f"SELECT {self.key} FROM {self.name}{self._clause()}", self.params)]
+
+    def _update(self):
+        ids = self._ids()
+        fields = self.db.fields(self.name, self.payload)
+        if self.name == "applicants":
+            fields["updated_at"] = _now()
+        if ids and fields:
+            sets = ", ".join(f'"{c}" = ?' for c in fields)
+            self.db.conn.executemany(f"UPDATE {self.name} SET {sets} WHERE {self.key} = ?",
+                                     [(*fields.values(), i) for i in ids])
+            if self.name == "applicants" and DERIVED_FROM & set(fields):
+                self.db.rederive(ids)
+        return _result(self.db.by_ids(self.name, ids))
+
+    def _delete(self):
+        ids = self._ids()
+        rows = self.db.by_ids(self.name, ids)
+        self.db.forget(self.name, ids)
+        return _result(rows)
+
+    def _write(self):
+        items = self.payload if isinstance(self.payload, list) else [self.payload]
+        ids = []
+        now = _now()
+        for it in items:
+            row = self.db.fields(self.name, it)
+            if self.name == "applicants":
+                row.setdefault("created_at", now)
+                row.setdefault("updated_at", now)
+            cols = ", ".join(f'"{c}"' for c in row)
+            sql = f"INSERT INTO {self.name} ({cols}) VALUES ({', '.join('?' * len(row))})"
+            params = list(row.values())
+            if self.mode == "upsert":
+                key = self.on_conflict
+                sets = [f'"{c}" = excluded."{c}"' for c in row if c not in (key, self.key, "created_at", "updated_at")]
+                if self.ignore_duplicates or not sets:
+                    sql += f' ON CONFLICT ("{key}") DO NOTHING'
+                else:
+                    if self.name == "applicants":
+                        sets.append("updated_at = ?")
+                        params.append(now)
+                    sql += f' ON CONFLICT ("{key}") DO UPDATE SET {", ".join(sets)}'
+            got = self.db.conn.execute(sql + f" RETURNING {self.key}", params).fetchone()
+            if got:
+                ids.append(got[0])
+        if self.name == "applicants":
+            self.db.rederive(ids)
+        return _result(self.db.by_ids(self.name, ids))
+
+
+def _result(data, count=None):
+    return SimpleNamespace(data=data, count=count)
+
+
+class LocalBucket:
+    def __init__(self, root, name):
+        self.root = Path(root) / name
+
+    def upload(self, path, data, file_options=None):
+        dest = self.root / path
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(bytes(data))
+        return {"path": path}
+
+    def download(self, path):
+        return (self.root / path).read_bytes()
+
+    def remove(self, paths):
+        for p in paths:
+            (self.root / p).unlink(missing_ok=True)
+        return [{"name": p} for p in paths]
+
+    def get_public_url(self, path):
+        # st.image accepts a local path; there is no public URL without Storage.
+        return str((self.root / path).resolve())
+
+
+class LocalStorage:
+    def __init__(self, root):
+        self.root = root
+
+    def from_(self, bucket):
+        return LocalBucket(self.root, bucket)
+
+
+class LocalClient:
+    """supabase-py client stand-in backed by one SQLite file (or ":memory:").
+
+    Indexed for the registry's access paths: (created_at, id) keyset pages, status tabs,
+    updated_at deltas and phone_digits lookups. One connection serialised by a lock,
+    so it can be shared across sessions and threads like the pooled Supabase client.
+    """
+
+    def __init__(self, path=LOCAL_DB_PATH, storage_path=LOCAL_STORAGE_PATH):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        self.columns = {t: [r[1] for r in self.conn.execute(f"PRAGMA table_info({t})")]
+                        for t in ("applicants", "applicant_tombstones", "site_settings") + ROLLUPS + EVENTS}
+        self.storage = LocalStorage(storage_path)
+        self.calls = Counter()
+        self.rpcs = {"applicant_status_counts": _status_counts, "stage_transition_stats": _transition_stats}
+
+    def _migrate(self):
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            for t, cols in ADDED_COLUMNS.items():
+                have = {r[1] for r in self.conn.execute(f"PRAGMA table_info({t})")}
+                for c, decl in cols.items():
+                    # A table that doesn't exist yet is created with the column below.
+                    if have and c not in have:
+                        self.conn.execute(f"ALTER TABLE {t} ADD COLUMN {c} {decl}")
+            have = lambda t: self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (t,)).fetchone()
+            fresh_rollups, fresh_events = not have("applicant_cohorts"), not have("applicant_events")
+            fresh_coverage = not have("applicant_coverage")
+            self.conn.executescript(ROLLUP_SCHEMA.format(new=_roll("NEW", 1), old=_roll("OLD", -1)))
+            self.conn.executescript(EVENT_SCHEMA)
+            self.conn.executescript(COVERAGE_SCHEMA)
+            if fresh_coverage:
+                self.conn.execute("INSERT OR IGNORE INTO applicant_coverage SELECT j.value, a.id "
+                                  "FROM applicants a, json_each(a.coverage_fips) j WHERE a.coverage_fips IS NOT NULL")
+            if fresh_rollups:
+                self.rebuild_rollups()
+            if fresh_events:
+                # Same seeding as sql/024: one event per existing row carrying its current state.
+                self.conn.execute("UPDATE applicants SET status_since = CASE WHEN status = 'NEW' "
+                                  "THEN created_at ELSE updated_at END WHERE status_since IS NULL")
+                self.conn.execute("INSERT INTO applicant_events (applicant_id, at, kind, to_status, notes) "
+                                  "SELECT id, status_since, 'imported', status, notes FROM applicants ORDER BY id")
+
+    def rebuild_rollups(self):
+        # Same backfill as sql/023; the current status stands in for unknown history.
+        with self.lock, self.conn:
+            for st, bits in STAGE_BITS.items():
+                self.conn.execute("UPDATE applicants SET stages_reached = stages_reached | ? WHERE status = ?", (bits, st))
+            self.conn.execute("DELETE FROM applicant_cohorts")
+            self.conn.execute("DELETE FROM applicant_stage_counts")
+            self.conn.execute("INSERT INTO applicant_cohorts (day, state, status, n) "
+                              "SELECT substr(created_at, 1, 10), coalesce(state, ''), status, count(*) "
+                              "FROM applicants GROUP BY 1, 2, 3")
+            self.conn.execute(
+                "INSERT INTO applicant_stage_counts (day, state, stage, n, timed, hours) "
+                "SELECT substr(a.created_at, 1, 10), coalesce(a.state, ''), s.stage, count(*), "
+                "sum(s.stage = 'CONTACTED' AND a.contacted_at IS NOT NULL), "
+                "coalesce(sum(CASE WHEN s.stage = 'CONTACTED' THEN (julianday(a.contacted_at) - julianday(a.created_at)) * 24 END), 0) "
+                "FROM applicants a JOIN applicant_stages s ON a.stages_reached & s.bit <> 0 GROUP BY 1, 2, 3")
+
+    def table(self, name):
+        return LocalQuery(self, name)
+
+    def rpc(self, fn, params=None):
+        def execute():
+            self.calls[("rpc", fn)] += 1
+            with self.lock:
+                return _result(self.rpcs[fn](self, params or {}))
+        return SimpleNamespace(execute=execute)
+
+    def close(self):
+        self.conn.close()
+
+    # ── Row plumbing (callers hold the lock) ──
+    def fields(self, name, payload):
+        # PostgREST rejects unknown columns, and so do we; timestamps are normalised, arrays stored as JSON.
+        cols = self.columns[name]
+        out = {}
+        for c, v in payload.items():
+            if c not in cols:
+                raise ValueError(f"column {name}.{c} does not exist")
+            out[c] = _ts(v) if c in TIMESTAMPS else json.dumps(v) if c in JSON and v is not None else v
+        return out
+
+    def rows(self, cursor):
+        out = []
+        for r in cursor:
+            d = dict(r)
+            for c in JSON.intersection(d):
+                if d[c] is not None:
+                    d[c] = json.loads(d[c])
+            out.append(d)
+        return out
+
+    def by_ids(self, name, ids):
+        out = []
+        for i in range(0, len(ids), 500):
+            part = ids[i:i + 500]
+            out += self.rows(self.conn.execute(
+                f"SELECT * FROM {name} WHERE {KEYS.get(name, 'id')} IN ({','.join('?' * len(part))})", part))
+        return out
+
+    def rederive(self, ids):
+        now = _now()
+        rows = [_derive(r, now) for r in self.by_ids("applicants", ids)]
+        self.conn.executemany(
+            "UPDATE applicants SET exp_list = ?, experience_rank = ?, phone_digits = ?, identity_key = ?, "
+            "stages_reached = ?, contacted_at = ? WHERE id = ?",
+            [(r["exp_list"], r["experience_rank"], r["phone_digits"], r["identity_key"],
+              r["stages_reached"], r["contacted_at"], r["id"]) for r in rows])
+
+    def forget(self, name, ids, at=None):
+        # Delete plus what the Postgres triggers and FK do: tombstones, and duplicate_of ON DELETE SET NULL.
+        if not ids:
+            return
+        at = at or _now()
+        for i in range(0, len(ids), 500):
+            part = ids[i:i + 500]
+            marks = ",".join("?" * len(part))
+            self.conn.execute(f"DELETE FROM {name} WHERE {KEYS.get(name, 'id')} IN ({marks})", part)
+            if name == "applicants":
+                self.conn.executemany(
+                    "INSERT INTO applicant_tombstones (id, deleted_at) VALUES (?, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET deleted_at = excluded.deleted_at", [(a, at) for a in part])
+                self.conn.execute(f"UPDATE applicants SET duplicate_of = NULL, updated_at = ? "
+                                  f"WHERE duplicate_of IN ({marks})", [at, *part])
+
+    # ── Replica loading ──
+    def load(self, rows, name="applicants"):
+        """Insert or overwrite rows verbatim (ids and timestamps kept), e.g. pages pulled from Supabase.
+
+        Columns this schema doesn't know are dropped rather than rejected, and the
+        event triggers stay quiet: pulled rows bring their history with them.
+        """
+        cols = self.columns[name]
+        key = KEYS.get(name, "id")
+        n = 0
+        batch = []
+        def flush():
+            if not batch:
+                return
+            keys = sorted({k for r in batch for k in r})
+            names = ", ".join(f'"{k}"' for k in keys)
+            sets = ", ".join(f'"{k}" = excluded."{k}"' for k in keys if k != key)
+            action = "DO NOTHING" if name in APPEND_ONLY else f"DO UPDATE SET {sets}"
+            self.conn.executemany(
+                f"INSERT INTO {name} ({names}) VALUES ({', '.join('?' * len(keys))}) "
+                f"ON CONFLICT ({key}) {action}",
+                [tuple(r.get(k) for k in keys) for r in batch])
+            batch.clear()
+        with self.lock, self.conn, self.replicating():
+            for r in rows:
+                if name == "applicant_events":
+                    r = {**r, "source_seq": r.get("seq")}
+                    r.pop("seq", None)
+                r = {k: v for k, v in r.items() if k in cols and k not in ARRAYS}
+                r = self.fields(name, r)
+                if name == "applicants":
+                    r.setdefault("updated_at", r.get("created_at"))
+                    _derive(r)
+                batch.append(r)
+                n += 1
+                if len(batch) >= LOAD_BATCH:
+                    flush()
+            flush()
+        return n
+
+    @contextmanager
+    def replicating(self):
+        # Inside the caller's transaction, so other connections never see the flag.
+        self.conn.execute("INSERT INTO replica_load VALUES (1)")
+        try:
+            yield
+        finally:
+            self.conn.execute("DELETE FROM replica_load")
+
+    def high_water(self):
+        # Newest remote timestamp pulled so far; the next pull resumes from here (inclusive).
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM replica_meta WHERE key = 'pulled_through'").fetchone()
+            return row[0] if row else None
+
+    def set_high_water(self, at):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT INTO replica_meta VALUES ('pulled_through', ?) "
+                              "ON CONFLICT (key) DO UPDATE SET value = excluded.value", (at,))
+
+
+def _status_counts(db, params):
+    since = _ts(params.get("since")) or _ts((datetime.now(timezone.utc) - timedelta(days=7)).isoformat())
+    cur = db.conn.execute("SELECT status, count(*) AS total, sum(created_at > ?) AS recent "
+                          "FROM applicants GROUP BY status", (since,))
+    return [dict(r) for r in cur]
+
+
+def _percentile(ordered, p):
+    # Linear interpolation, as percentile_cont.
+    k = (len(ordered) - 1) * p
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def _transition_stats(db, params):
+    hours = sorted(r[0] for r in db.conn.execute(
+        "SELECT (julianday(at) - julianday(entered_at)) * 24 FROM applicant_events "
+        "WHERE kind = 'status' AND from_status = ? AND to_status = ? AND at >= ? AND at < ? AND entered_at IS NOT NULL",
+        (params["from_stage"], params["to_stage"], _ts(params.get("since")) or "", _ts(params.get("until")) or _now())))
+    if not hours:
+        return [{"n": 0, "mean_hours": None, "p50_hours": None, "p90_hours": None}]
+    return [{"n": len(hours), "mean_hours": sum(hours) / len(hours),
+             "p50_hours": _percentile(hours, 0.5), "p90_hours": _percentile(hours, 0.9)}]
+
+
+# ── Replication from Supabase ──
+def pull(src, dst, log=print):
+    """Bring `dst` (a LocalClient) up to date with `src` (a Supabase client).
+
+    The first pull copies every row; later ones fetch only rows changed and deleted
+    since the high-water mark, through the same delta queries the admin store uses.
+    The mark only ever comes from the source's timestamps, so edits made in the
+    replica can't move it past changes it hasn't pulled yet.
+    """
+    from applicants import fetch_tombstones, iter_changes, iter_pages
+
+    since = mark = dst.high_water()
+    pages = iter_pages(src, 1000, ("*",)) if since is None else iter_changes(src, since, 1000, ("*",))
+    n = 0
+    for rows in pages:
+        n += dst.load(rows)
+        mark = max([mark or "", *(_ts(r["updated_at"]) for r in rows if r.get("updated_at"))]) or None
+    gone = fetch_tombstones(src, since)
+    with dst.lock, dst.conn, dst.replicating():
+        for t in gone:
+            dst.forget("applicants", [t["id"]], _ts(t["deleted_at"]))
+    mark = max([mark or "", *(_ts(t["deleted_at"]) for t in gone)]) or None
+    if mark:
+        dst.set_high_water(mark)
+    settings = src.table("site_settings").select("*").execute().data or []
+    dst.load(settings, "site_settings")
+    events = 0
+    with dst.lock:
+        after = dst.conn.execute("SELECT coalesce(max(source_seq), 0) FROM applicant_events").fetchone()[0]
+    while True:
+        rows = (src.table("applicant_events").select("*").gt("seq", after).order("seq").limit(1000)
+                .execute().data or [])
+        events += dst.load(rows, "applicant_events")
+        if len(rows) < 1000:
+            break
+        after = rows[-1]["seq"]
+    log(f"{'delta' if since else 'full'} pull: {n} rows upserted, {len(gone)} deleted, "
+        f"{events} events into {dst.path}")
+    return n, len(gone)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    from db import make_client
+
+    if sys.argv[1:2] != ["pull"]:
+        sys.exit(__doc__)
+    local = LocalClient(sys.argv[2] if len(sys.argv) > 2 else LOCAL_DB_PATH)
+    pull(make_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_KEY"]), local)
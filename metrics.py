@@ -0,0 +1,198 @@
+import functools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Durations kept per span for the rolling percentiles.
+WINDOW = 1024
+QUANTILES = (0.5, 0.95, 0.99)
+PREFIX = "vergecom"
+# Loopback unless METRICS_HOST opens it up; the endpoint has no auth.
+HOST = "127.0.0.1"
+
+
+def _quantile(ordered, p):
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+class Tracer:
+    """Process-wide timed spans with rolling p50/p95/p99 per span name."""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.started = time.time()
+        self._spans = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds, error=False):
+        with self._lock:
+            s = self._spans.get(name)
+            if s is None:
+                s = self._spans[name] = {"recent": deque(maxlen=self.window), "count": 0, "sum": 0.0, "errors": 0}
+            s["recent"].append(seconds)
+            s["count"] += 1
+            s["sum"] += seconds
+            s["errors"] += error
+
+    @contextmanager
+    def span(self, name):
+        # st.rerun / st.stop raise BaseExceptions; those still count as completed spans.
+        t0 = time.perf_counter()
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.record(name, time.perf_counter() - t0, error)
+
+    def timed(self, name):
+        def wrap(fn):
+            @functools.wraps(fn)
+            def inner(*a, **k):
+                with self.span(name):
+                    return fn(*a, **k)
+            if hasattr(fn, "clear"):
+                inner.clear = fn.clear
+            return inner
+        return wrap
+
+    # ── Readout ──
+    def _items(self):
+        with self._lock:
+            items = [(n, sorted(s["recent"]), s["count"], s["sum"], s["errors"]) for n, s in self._spans.items()]
+        return sorted(items)
+
+    def snapshot(self):
+        # {span: {count, errors, mean_ms, p50, p95, p99}}, times in milliseconds.
+        return {
+            name: {"count": count, "errors": errors, "mean_ms": round(total / count * 1000, 3),
+                   **{f"p{round(p * 100)}": round(_quantile(recent, p) * 1000, 3) for p in QUANTILES}}
+            for name, recent, count, total, errors in self._items()
+        }
+
+    def to_json(self):
+        return json.dumps({"since": self.started, "spans": self.snapshot()}, indent=2)
+
+    def to_prometheus(self):
+        m = f"{PREFIX}_span_seconds"
+        lines = [f"# HELP {m} Duration of traced spans (rolling window of {self.window}).", f"# TYPE {m} summary"]
+        errs = [f"# HELP {PREFIX}_span_errors_total Spans that raised.", f"# TYPE {PREFIX}_span_errors_total counter"]
+        for name, recent, count, total, errors in self._items():
+            label = name.replace("\\", "\\\\").replace('"', '\\"')
+            for p in QUANTILES:
+                lines.append(f'{m}{{span="{label}",quantile="{p}"}} {_quantile(recent, p):.6f}')
+            lines.append(f'{m}_sum{{span="{label}"}} {total:.6f}')
+            lines.append(f'{m}_count{{span="{label}"}} {count}')
+            errs.append(f'{PREFIX}_span_errors_total{{span="{label}"}} {errors}')
+        return "\n".join(lines + errs) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self.started = time.time()
+
+
+TRACER = Tracer()
+span = TRACER.span
+timed = TRACER.timed
+
+
+# ── Supabase client instrumentation ──
+class _Traced:
+    # Forwards to a supabase-py builder; execute() is timed as supabase.<target>.<verb>.
+    _VERBS = ("select", "insert", "upsert", "update", "delete")
+
+    def __init__(self, target, name, tracer):
+        self._target, self._name, self._tracer = target, name, tracer
+
+    def __getattr__(self, attr):
+        val = getattr(self._target, attr)
+        if not callable(val):
+            return val
+        if attr == "execute":
+            return self._tracer.timed(self._name)(val)
+        name = f"{self._name}.{attr}" if attr in self._VERBS and self._name.count(".") < 2 else self._name
+        @functools.wraps(val)
+        def call(*a, **k):
+            out = val(*a, **k)
+            return _Traced(out, name, self._tracer) if hasattr(out, "execute") else out
+        return call
+
+
+class _TracedBucket:
+    def __init__(self, bucket, tracer):
+        self._bucket, self._tracer = bucket, tracer
+
+    def __getattr__(self, attr):
+        val = getattr(self._bucket, attr)
+        if attr in ("upload", "download", "remove", "list"):
+            return self._tracer.timed(f"supabase.storage.{attr}")(val)
+        return val
+
+
+class _TracedStorage:
+    def __init__(self, storage, tracer):
+        self._storage, self._tracer = storage, tracer
+
+    def from_(self, bucket):
+        return _TracedBucket(self._storage.from_(bucket), self._tracer)
+
+
+class TracedClient:
+    """Wraps a Supabase client so every PostgREST and Storage request becomes a span."""
+
+    def __init__(self, sb, tracer=TRACER):
+        self._sb, self._tracer = sb, tracer
+
+    def table(self, name):
+        return _Traced(self._sb.table(name), f"supabase.{name}", self._tracer)
+
+    def rpc(self, fn, params=None):
+        return _Traced(self._sb.rpc(fn, params or {}), f"supabase.rpc.{fn}", self._tracer)
+
+    @property
+    def storage(self):
+        return _TracedStorage(self._sb.storage, self._tracer)
+
+    def __getattr__(self, attr):
+        return getattr(self._sb, attr)
+
+
+# ── Scrape endpoint ──
+def serve(port, tracer=TRACER, host=HOST, log=print):
+    """Serve /metrics (Prometheus text) and /metrics.json from a daemon thread.
+
+    Returns None (after logging why) if the port cannot be bound, e.g. when a second
+    app process on the same host already holds it.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/metrics.json"):
+                body, ctype = tracer.to_json(), "application/json"
+            elif self.path.startswith("/metrics"):
+                body, ctype = tracer.to_prometheus(), "text/plain; version=0.0.4"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *a):
+            pass
+
+    try:
+        server = ThreadingHTTPServer((host, port), Handler)
+    except OSError as e:
+        log(f"metrics endpoint not started on {host}:{port}: {e}")
+        return None
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,154 @@
+import json
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from dedup import DEDUP_MODE, first_per_identity, resolve
+from metrics import span
+
+OUTBOX_PATH = ".outbox/submissions.db"
+FLUSH_BATCH = 50
+FLUSH_INTERVAL = 1.0
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 300.0
+# Recent flushes kept for the latency readout in the admin console.
+FLUSH_HISTORY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    created REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_try REAL NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE TABLE IF NOT EXISTS flushes (
+    at REAL NOT NULL,
+    rows INTEGER NOT NULL,
+    latency_ms REAL NOT NULL
+);
+"""
+
+
+def new_key():
+    return uuid.uuid4().hex
+
+
+def _pct(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+class Outbox:
+    """On-disk journal of applicant submissions waiting to reach Supabase.
+
+    A submission is durable once `enqueue` returns; `OutboxWorker` delivers it
+    later. Each row carries an idempotency key (applicants.submission_key), so
+    a batch that is retried after a partial failure never inserts twice.
+    """
+
+    def __init__(self, path=OUTBOX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.wake = threading.Event()
+
+    def enqueue(self, payload, key=None):
+        key = key or payload.get("submission_key") or new_key()
+        with self._lock, self._db:
+            self._db.execute("INSERT OR IGNORE INTO outbox (key, payload, created) VALUES (?, ?, ?)",
+                             (key, json.dumps({**payload, "submission_key": key}), time.time()))
+        self.wake.set()
+        return key
+
+    def due(self, limit=FLUSH_BATCH):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, payload, created, attempts FROM outbox WHERE next_try <= ? ORDER BY created LIMIT ?",
+                (time.time(), limit)).fetchall()
+        return [(k, json.loads(p), c, n) for k, p, c, n in rows]
+
+    def done(self, batch):
+        now = time.time()
+        with self._lock, self._db:
+            self._db.executemany("DELETE FROM outbox WHERE key = ?", [(k,) for k, *_ in batch])
+            self._db.execute("INSERT INTO flushes VALUES (?, ?, ?)",
+                             (now, len(batch), (now - min(c for _, _, c, _ in batch)) * 1000))
+            self._db.execute("DELETE FROM flushes WHERE rowid <= (SELECT max(rowid) FROM flushes) - ?", (FLUSH_HISTORY,))
+
+    def failed(self, batch, error):
+        now = time.time()
+        with self._lock, self._db:
+            self._db.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, next_try = ?, last_error = ? WHERE key = ?",
+                [(now + min(BACKOFF_MAX, BACKOFF_BASE * 2 ** n) * (0.5 + random.random()), str(error)[:500], k)
+                 for k, _, _, n in batch])
+
+    def stats(self):
+        with self._lock:
+            depth, oldest, retrying, err = self._db.execute(
+                "SELECT count(*), min(created), sum(attempts > 0), "
+                "(SELECT last_error FROM outbox WHERE last_error IS NOT NULL ORDER BY created DESC LIMIT 1) FROM outbox"
+            ).fetchone()
+            lat = [r[0] for r in self._db.execute("SELECT latency_ms FROM flushes")]
+        return {
+            "depth": depth,
+            "oldest_s": time.time() - oldest if oldest else 0.0,
+            "retrying": retrying or 0,
+            "last_error": err,
+            "flushes": len(lat),
+            "p50_ms": _pct(lat, 50),
+            "p95_ms": _pct(lat, 95),
+        }
+
+
+def flush_once(outbox, sb, limit=FLUSH_BATCH, dedup=DEDUP_MODE):
+    # One batched, idempotent insert; returns the number of rows delivered.
+    batch = outbox.due(limit)
+    if not batch:
+        return 0
+    if batch[0][3]:
+        # Retries go out in halving batches so one bad row ends up isolated.
+        batch = batch[:max(1, limit >> batch[0][3])]
+    payloads = [p for _, p, _, _ in batch]
+    try:
+        with span("outbox.flush"):
+            if dedup:
+                batch = first_per_identity(batch)
+                payloads = resolve(sb, [p for _, p, _, _ in batch], dedup)
+            if payloads:
+                sb.table("applicants").upsert(payloads, on_conflict="submission_key",
+                                              ignore_duplicates=True, returning="minimal").execute()
+    except Exception as e:
+        outbox.failed(batch, e)
+        return 0
+    outbox.done(batch)
+    return len(batch)
+
+
+class OutboxWorker(threading.Thread):
+    """Daemon thread that drains an Outbox into Supabase."""
+
+    def __init__(self, outbox, sb, batch=FLUSH_BATCH, interval=FLUSH_INTERVAL, dedup=DEDUP_MODE):
+        super().__init__(name="outbox-flush", daemon=True)
+        self.outbox, self.sb, self.batch, self.interval, self.dedup = outbox, sb, batch, interval, dedup
+
+    def run(self):
+        while True:
+            self.outbox.wake.clear()
+            try:
+                n = flush_once(self.outbox, self.sb, self.batch, self.dedup)
+            except Exception:
+                n = 0
+            if not n:
+                self.outbox.wake.wait(self.interval)
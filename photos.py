@@ -0,0 +1,125 @@
+import io
+import os
+import random
+import time
+import uuid
+from datetime import datetime
+
+from PIL import Image, ImageOps
+
+# Install photos only need to be legible on a phone or laptop screen.
+MAX_EDGE = 1600
+QUALITY = 80
+FORMAT, EXT, CONTENT_TYPE = "WEBP", "webp", "image/webp"
+BUCKET = "applicant-photos"
+UPLOAD_ATTEMPTS = 4
+BACKOFF_BASE = 0.5
+
+# Variants stored next to each original as <stem>.<variant>.webp, largest first.
+VARIANTS = [("medium", 800), ("thumb", 160)]
+PHOTO_SLOTS = ("photo1", "photo2")
+
+
+def _open(file, max_edge):
+    file.seek(0)
+    img = Image.open(file)
+    img.draft("RGB", (max_edge, max_edge))
+    img = ImageOps.exif_transpose(img)
+    img.thumbnail((max_edge, max_edge), Image.LANCZOS)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "P") else "RGB")
+    return img
+
+def _encode(img, quality):
+    out = io.BytesIO()
+    img.save(out, FORMAT, quality=quality, method=4)
+    return out.getvalue()
+
+def prepare_variants(file, max_edge=MAX_EDGE, quality=QUALITY):
+    """Downscale and re-encode an uploaded image into {"": original, "medium": ..., "thumb": ...}.
+
+    The upload is decoded straight from its buffer. JPEGs are decoded at reduced
+    scale when possible, orientation is applied, and EXIF/GPS metadata is dropped.
+    Each variant is shrunk from the previous one.
+    """
+    img = _open(file, max_edge)
+    out = {"": _encode(img, quality)}
+    for name, edge in VARIANTS:
+        img.thumbnail((edge, edge), Image.LANCZOS)
+        out[name] = _encode(img, quality)
+    return out
+
+
+# ── Upload ──
+def with_retry(fn, attempts=UPLOAD_ATTEMPTS, base=BACKOFF_BASE):
+    for i in range(attempts):
+        try:
+            return fn()
+        except Exception:
+            if i == attempts - 1:
+                raise
+            time.sleep(base * 2 ** i * (0.5 + random.random()))
+
+def _variant_path(path, name):
+    stem, ext = path.rsplit(".", 1)
+    return f"{stem}.{name}.{ext}" if name else path
+
+def upload_variants(sb, path, variants):
+    bucket = sb.storage.from_(BUCKET)
+    urls = {}
+    for name, body in variants.items():
+        p = _variant_path(path, name)
+        with_retry(lambda: bucket.upload(p, body, file_options={"content-type": CONTENT_TYPE, "upsert": "true"}))
+        urls[name] = bucket.get_public_url(p)
+    return urls
+
+def upload_photo(sb, file, filename):
+    """Prepare and upload one photo with its variants; safe to run off the script thread.
+
+    `file` is read in place (an UploadedFile or any seekable binary file), never copied.
+    Returns {"": original_url, "medium": url, "thumb": url}.
+    """
+    stem = filename.rsplit(".", 1)[0].replace(" ", "_").lower()
+    path = f"installs/{datetime.now():%Y%m%d%H%M%S}_{uuid.uuid4().hex[:8]}_{stem}.{EXT}"
+    return upload_variants(sb, path, prepare_variants(file))
+
+def photo_fields(slot, urls):
+    # Applicant row columns for one uploaded photo slot.
+    return {f"{slot}_url": urls[""], f"{slot}_medium_url": urls["medium"], f"{slot}_thumb_url": urls["thumb"]}
+
+
+# ── Backfill ──
+def _object_path(public_url):
+    marker = f"/{BUCKET}/"
+    return public_url.split("?", 1)[0].split(marker, 1)[1] if marker in public_url else None
+
+def backfill_variants(sb, log=print):
+    """Generate missing medium/thumb variants for photos uploaded before variants existed."""
+    from applicants import iter_pages
+    bucket = sb.storage.from_(BUCKET)
+    done = 0
+    for slot in PHOTO_SLOTS:
+        cols = ("id", "created_at", f"{slot}_url")
+        where = lambda q: q.neq(f"{slot}_url", "").is_(f"{slot}_thumb_url", "null")
+        for page in iter_pages(sb, 100, cols, where=where):
+            for r in page:
+                src = _object_path(r[f"{slot}_url"] or "")
+                if not src:
+                    continue
+                try:
+                    data = with_retry(lambda: bucket.download(src))
+                    variants = prepare_variants(io.BytesIO(data))
+                    del variants[""]  # keep the original object as-is
+                    urls = {"": r[f"{slot}_url"], **upload_variants(sb, src.rsplit(".", 1)[0] + f".{EXT}", variants)}
+                    sb.table("applicants").update(photo_fields(slot, urls)).eq("id", r["id"]).execute()
+                    done += 1
+                except Exception as e:
+                    log(f"applicant {r['id']} {slot}: {e}")
+    log(f"backfilled {done} photos")
+    return done
+
+
+if __name__ == "__main__":
+    # python photos.py  (reads SUPABASE_URL / SUPABASE_KEY from the environment)
+    from db import make_client
+    backfill_variants(make_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_KEY"]))
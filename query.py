@@ -0,0 +1,115 @@
+from datetime import datetime, time, timedelta, timezone
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from aggregates import filter_mask
+from records import EXPERIENCE_RANK
+from search import apply_search
+
+# Sort label -> PostgREST ordering; ties always fall back to newest first.
+SORTS = {
+    "Newest": [("created_at", True), ("id", True)],
+    "Oldest": [("created_at", False), ("id", False)],
+    "State": [("state", False), ("created_at", True), ("id", True)],
+    "Experience": [("experience_rank", True), ("created_at", True), ("id", True)],
+}
+# Sort keys that can be NULL; ordered nulls last on every backend so a cursor can step past them.
+NULLS_LAST = {"state"}
+
+
+def _day_start(d):
+    return datetime.combine(d, time.min, tzinfo=timezone.utc)
+
+def _lit(v):
+    return str(v) if isinstance(v, int) else f'"{v}"'
+
+def _past(order, key):
+    # PostgREST logic tree for "sorts after `key`" under `order`, one column at a time.
+    # On (created_at, id) this is the same filter applicants._after builds.
+    (col, desc), rest = order[0], order[1:]
+    v, op = key[0], "lt" if desc else "gt"
+    if not rest:
+        return f"{col}.{op}.{_lit(v)}"
+    tail = _past(rest, key[1:])
+    if v is None:
+        return f"and({col}.is.null,{tail})"
+    terms = [f"{col}.{op}.{_lit(v)}"] + ([f"{col}.is.null"] if col in NULLS_LAST else []) + [f"and({col}.eq.{_lit(v)},{tail})"]
+    return f"or({','.join(terms)})"
+
+def _after_key(q, order, cursor):
+    if not cursor:
+        return q
+    expr = _past(order, cursor)
+    return q.or_(expr[3:-1] if expr.startswith("or(") else expr)
+
+
+class RegistryQuery(NamedTuple):
+    """The registry's active filters and sort, evaluated locally or pushed down to PostgREST."""
+
+    search: str = ""
+    statuses: tuple = ()
+    exp: tuple = ()
+    equipment: tuple = ()
+    since: Optional[object] = None
+    until: Optional[object] = None
+    sort: str = "Newest"
+
+    # ── PostgREST ──
+    def apply(self, q, status=None):
+        if status:
+            q = q.eq("status", status)
+        if self.statuses:
+            q = q.in_("status", list(self.statuses))
+        if self.exp:
+            q = q.ov("exp_list", list(self.exp))
+        for k in self.equipment:
+            q = q.eq(k, "Yes")
+        if self.since:
+            q = q.gte("created_at", _day_start(self.since).isoformat())
+        if self.until:
+            q = q.lt("created_at", _day_start(self.until + timedelta(days=1)).isoformat())
+        if self.search:
+            q = apply_search(q, self.search)
+        return q
+
+    def fetch(self, sb, columns, status=None, cursor=None, limit=200):
+        """One page in this sort and the cursor for the next (None on the last page).
+
+        The cursor is the last row's sort key, so page N costs the same as page 1.
+        """
+        order = SORTS[self.sort]
+        cols = ",".join(dict.fromkeys(tuple(columns) + tuple(c for c, _ in order)))
+        q = self.apply(sb.table("applicants").select(cols), status)
+        for col, desc in order:
+            q = q.order(col, desc=desc, nullsfirst=False) if col in NULLS_LAST else q.order(col, desc=desc)
+        rows = _after_key(q, order, cursor).limit(limit).execute().data or []
+        nxt = tuple(rows[-1][c] for c, _ in order) if len(rows) == limit else None
+        return rows, nxt
+
+    def count(self, sb, status=None):
+        q = self.apply(sb.table("applicants").select("id", count="exact", head=True), status)
+        return q.execute().count or 0
+
+    # ── Local frame ──
+    def mask(self, df):
+        mask = filter_mask(df, self.statuses, self.exp, self.equipment)
+        if self.since:
+            mask &= (df["created"] >= _day_start(self.since)).to_numpy()
+        if self.until:
+            mask &= (df["created"] < _day_start(self.until + timedelta(days=1))).to_numpy()
+        return mask
+
+    def order(self, df):
+        # The frame is already newest first, so stable sorts keep that as the tie-break.
+        n = len(df)
+        if self.sort == "Oldest":
+            return np.arange(n)[::-1]
+        if self.sort == "State":
+            # Missing states ("" in the frame) go last, as NULLS LAST does in fetch().
+            state = df["state"].to_numpy()
+            return np.lexsort((state, state == ""))
+        if self.sort == "Experience":
+            rank = df["experience"].map(EXPERIENCE_RANK).fillna(-1).to_numpy()
+            return np.argsort(-rank, kind="stable")
+        return None
@@ -0,0 +1,130 @@
+import sys
+from datetime import datetime
+from enum import Enum
+
+
+class Status(str, Enum):
+    NEW = "NEW"
+    REVIEWED = "REVIEWED"
+    CONTACTED = "CONTACTED"
+    INTERVIEW = "INTERVIEW"
+    HIRED = "HIRED"
+    REJECTED = "REJECTED"
+
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+# Bit i of exp_mask is EXP_TYPES[i]; append new types at the end so stored masks stay valid.
+EXP_TYPES = ["Starlink", "DirecTV", "Dish Network", "HughesNet", "Low Voltage", "TV Mounting", "Cable Installation", "Other"]
+EXP_BITS = {t: 1 << i for i, t in enumerate(EXP_TYPES)}
+EXPERIENCE_LEVELS = ["Less than 1 year", "1–2 years", "3–5 years", "5+ years", "10+ years"]
+EXPERIENCE_RANK = {e: i for i, e in enumerate(EXPERIENCE_LEVELS)}
+EQUIPMENT = [("vehicle", "Vehicle"), ("ladder", "Ladder"), ("insurance", "Insurance")]
+EQUIP_BITS = {k: 1 << i for i, (k, _) in enumerate(EQUIPMENT)}
+
+
+def exp_mask(names):
+    m = 0
+    for n in names:
+        m |= EXP_BITS.get(n, 0)
+    return m
+
+def equip_mask(keys):
+    m = 0
+    for k in keys:
+        m |= EQUIP_BITS[k]
+    return m
+
+def parse_ts(iso):
+    try: return datetime.fromisoformat(iso.replace("Z", "+00:00"))
+    except: return None
+
+def split_exp(s):
+    if not s or s == "None selected": return ()
+    return tuple(sys.intern(t.strip()) for t in s.split(",") if t.strip())
+
+def _status(v):
+    return Status._value2member_map_.get(v, sys.intern(v) if isinstance(v, str) else v)
+
+def _text(v):
+    return sys.intern(v) if isinstance(v, str) and len(v) <= 32 else v
+
+
+class Applicant:
+    """One applicants row, parsed once when it enters the store."""
+
+    __slots__ = (
+        "id", "created", "updated_at", "name", "email", "phone", "state", "counties", "radius",
+        "experience", "exp", "exp_mask", "vehicle", "ladder", "insurance", "status",
+        "notes", "photo1_url", "photo2_url", "photo1_medium_url", "photo2_medium_url",
+        "photo1_thumb_url", "photo2_thumb_url", "duplicate_of", "submission_count", "_short", "_full",
+    )
+
+    @classmethod
+    def from_row(cls, r):
+        a = cls.__new__(cls)
+        a.id = r["id"]
+        a.created = parse_ts(r.get("created_at") or "")
+        a.updated_at = r.get("updated_at")
+        a.name = r.get("name") or "—"
+        a.email = r.get("email") or ""
+        a.phone = r.get("phone") or "—"
+        a.state = _text(r.get("state") or "")
+        a.counties = r.get("counties") or "—"
+        a.radius = _text(r.get("radius") or "")
+        a.experience = _text(r.get("experience") or "—")
+        a.exp = split_exp(r.get("exp_types"))
+        a.exp_mask = r.get("exp_mask") or exp_mask(a.exp)
+        a.vehicle = r.get("vehicle") == "Yes"
+        a.ladder = r.get("ladder") == "Yes"
+        a.insurance = r.get("insurance") == "Yes"
+        a.status = _status(r.get("status") or "NEW")
+        a.notes = r.get("notes") or ""
+        a.photo1_url = r.get("photo1_url") or ""
+        a.photo2_url = r.get("photo2_url") or ""
+        a.photo1_medium_url = r.get("photo1_medium_url") or ""
+        a.photo2_medium_url = r.get("photo2_medium_url") or ""
+        a.photo1_thumb_url = r.get("photo1_thumb_url") or ""
+        a.photo2_thumb_url = r.get("photo2_thumb_url") or ""
+        a.duplicate_of = r.get("duplicate_of")
+        a.submission_count = r.get("submission_count") or 1
+        a._short = a._full = None
+        return a
+
+    # ── Display strings, formatted on first use ──
+    @property
+    def date_short(self):
+        if self._short is None:
+            self._short = self.created.strftime("%b %d") if self.created else "—"
+        return self._short
+
+    @property
+    def date_full(self):
+        if self._full is None:
+            self._full = self.created.strftime("%b %d, %Y %I:%M %p") if self.created else "—"
+        return self._full
+
+    @property
+    def location(self):
+        return f"{self.counties}, {self.state}" if self.state else self.counties
+
+    @property
+    def equip_mask(self):
+        return equip_mask(k for k, _ in EQUIPMENT if getattr(self, k))
+
+    @property
+    def exp_types(self):
+        return ", ".join(self.exp) if self.exp else "None selected"
+
+    def __repr__(self):
+        return f"Applicant(id={self.id!r}, name={self.name!r}, status={self.status!s})"
+
+
+def to_columns(records):
+    # Column lists for a pandas frame, in the same order as `records`.
+    cols = {k: [] for k in ("id", "created", "status", "name", "phone", "email", "state", "counties", "experience", "exp_mask", "equip_mask")}
+    for a in records:
+        for k, col in cols.items():
+            col.append(getattr(a, k))
+    return cols
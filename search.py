@@ -0,0 +1,142 @@
+import bisect
+import re
+from collections import defaultdict
+
+_WORD = re.compile(r"[a-z0-9]+")
+_PHONEISH = re.compile(r"^[\d\s()+\-.]+$")
+# Ids per request when search runs server-side.
+SEARCH_PAGE = 1000
+
+
+def digits(s):
+    return "".join(ch for ch in s or "" if ch.isdigit())
+
+def tokens(s):
+    return _WORD.findall((s or "").lower())
+
+def grams(s):
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+def parse_query(q):
+    # "(407) 555" is a phone lookup on digits; anything else is matched word by word.
+    q = (q or "").strip()
+    if not q:
+        return None, []
+    if _PHONEISH.match(q) and digits(q):
+        return digits(q), []
+    return None, tokens(q)
+
+
+class SearchIndex:
+    """Trigram + prefix index over name, email, counties and digits-only phone."""
+
+    def __init__(self, records=()):
+        self.text = {}
+        self.phones = {}
+        self.text_grams = defaultdict(set)
+        self.phone_grams = defaultdict(set)
+        self.words = defaultdict(set)
+        self._vocab = None
+        for rec in records:
+            self.add(rec)
+
+    # ── Maintenance ──
+    def add(self, rec):
+        self.remove(rec.id)
+        words = tokens(rec.name) + tokens(rec.email) + tokens(rec.counties)
+        blob = " ".join(words)
+        phone = digits(rec.phone)
+        self.text[rec.id] = blob
+        self.phones[rec.id] = phone
+        for g in grams(blob):
+            self.text_grams[g].add(rec.id)
+        for g in grams(phone):
+            self.phone_grams[g].add(rec.id)
+        for w in words:
+            if w not in self.words:
+                self._vocab = None
+            self.words[w].add(rec.id)
+
+    def remove(self, aid):
+        blob = self.text.pop(aid, None)
+        if blob is None:
+            return
+        phone = self.phones.pop(aid)
+        for g in grams(blob):
+            self._discard(self.text_grams, g, aid)
+        for g in grams(phone):
+            self._discard(self.phone_grams, g, aid)
+        for w in set(blob.split()):
+            if self._discard(self.words, w, aid):
+                self._vocab = None
+
+    @staticmethod
+    def _discard(index, key, aid):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(aid)
+            if not ids:
+                del index[key]
+                return True
+        return False
+
+    # ── Queries ──
+    def _candidates(self, index, s):
+        posting = sorted((index.get(g, ()) for g in grams(s)), key=len)
+        if not posting or not posting[0]:
+            return set()
+        out = set(posting[0])
+        for p in posting[1:]:
+            out &= p
+            if not out:
+                break
+        return out
+
+    def _prefix(self, p):
+        if self._vocab is None:
+            self._vocab = sorted(self.words)
+        out = set()
+        i = bisect.bisect_left(self._vocab, p)
+        while i < len(self._vocab) and self._vocab[i].startswith(p):
+            out |= self.words[self._vocab[i]]
+            i += 1
+        return out
+
+    def _substring(self, s, index, docs):
+        return {aid for aid in self._candidates(index, s) if s in docs[aid]}
+
+    def search(self, q):
+        phone, words = parse_query(q)
+        if phone is not None:
+            if len(phone) < 3:
+                return {aid for aid, p in self.phones.items() if p.startswith(phone)}
+            return self._substring(phone, self.phone_grams, self.phones)
+        result = None
+        for w in words:
+            hits = self._prefix(w) if len(w) < 3 else self._substring(w, self.text_grams, self.text)
+            result = hits if result is None else result & hits
+            if not result:
+                break
+        return result or set()
+
+
+# ── Server-side search (pg_trgm indexes, sql/008_search.sql) ──
+def apply_search(query, q):
+    phone, words = parse_query(q)
+    if phone is not None:
+        query = query.like("phone_digits", f"*{phone}*")
+    for w in words:
+        query = query.or_(f"name.ilike.*{w}*,email.ilike.*{w}*,counties.ilike.*{w}*")
+    return query
+
+def search_ids(sb, q, page=SEARCH_PAGE):
+    # Every match, paged on id so a broad query ("gmail") is never cut short.
+    out, after = set(), 0
+    while True:
+        query = apply_search(sb.table("applicants").select("id").gt("id", after), q)
+        rows = query.order("id").limit(page).execute().data or []
+        out.update(r["id"] for r in rows)
+        if len(rows) < page:
+            return out
+        after = rows[-1]["id"]
@@ -0,0 +1,35 @@
+-- Delta sync for the admin console: row-level updated_at plus tombstones for deletes.
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now();
+CREATE INDEX IF NOT EXISTS applicants_updated_at_idx ON applicants (updated_at, id);
+
+CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS applicants_touch ON applicants;
+CREATE TRIGGER applicants_touch BEFORE UPDATE ON applicants
+FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TABLE IF NOT EXISTS applicant_tombstones (
+    id          BIGINT PRIMARY KEY,
+    deleted_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS applicant_tombstones_deleted_at_idx ON applicant_tombstones (deleted_at);
+
+CREATE OR REPLACE FUNCTION record_tombstone() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO applicant_tombstones (id) VALUES (OLD.id)
+    ON CONFLICT (id) DO UPDATE SET deleted_at = now();
+    RETURN OLD;
+END $$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS applicants_tombstone ON applicants;
+CREATE TRIGGER applicants_tombstone AFTER DELETE ON applicants
+FOR EACH ROW EXECUTE FUNCTION record_tombstone();
+
+ALTER TABLE applicant_tombstones ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "Anon tombstone read"
+ON applicant_tombstones FOR SELECT TO anon
+USING (true);
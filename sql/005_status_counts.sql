@@ -0,0 +1,12 @@
+-- Server-side KPI counts for the admin console (REGISTRY_AGGREGATES = "server").
+CREATE INDEX IF NOT EXISTS applicants_status_created_idx ON applicants (status, created_at);
+
+CREATE OR REPLACE FUNCTION applicant_status_counts(since TIMESTAMPTZ DEFAULT now() - interval '7 days')
+RETURNS TABLE (status TEXT, total BIGINT, recent BIGINT)
+LANGUAGE sql STABLE AS $$
+    SELECT status, count(*), count(*) FILTER (WHERE created_at > since)
+    FROM applicants
+    GROUP BY status;
+$$;
+
+GRANT EXECUTE ON FUNCTION applicant_status_counts(TIMESTAMPTZ) TO anon;
@@ -0,0 +1,10 @@
+-- Server-side registry search (REGISTRY_SEARCH = "server").
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS phone_digits TEXT
+    GENERATED ALWAYS AS (regexp_replace(coalesce(phone, ''), '\D', '', 'g')) STORED;
+
+CREATE INDEX IF NOT EXISTS applicants_name_trgm_idx     ON applicants USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS applicants_email_trgm_idx    ON applicants USING gin (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS applicants_counties_trgm_idx ON applicants USING gin (counties gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS applicants_phone_trgm_idx    ON applicants USING gin (phone_digits gin_trgm_ops);
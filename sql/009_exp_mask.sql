@@ -0,0 +1,14 @@
+-- Experience types as a bitmask; bit order matches records.EXP_TYPES.
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS exp_mask INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill rows submitted before the column existed.
+UPDATE applicants SET exp_mask =
+      (CASE WHEN 'Starlink'           = ANY (string_to_array(exp_types, ', ')) THEN 1   ELSE 0 END)
+    | (CASE WHEN 'DirecTV'            = ANY (string_to_array(exp_types, ', ')) THEN 2   ELSE 0 END)
+    | (CASE WHEN 'Dish Network'       = ANY (string_to_array(exp_types, ', ')) THEN 4   ELSE 0 END)
+    | (CASE WHEN 'HughesNet'          = ANY (string_to_array(exp_types, ', ')) THEN 8   ELSE 0 END)
+    | (CASE WHEN 'Low Voltage'        = ANY (string_to_array(exp_types, ', ')) THEN 16  ELSE 0 END)
+    | (CASE WHEN 'TV Mounting'        = ANY (string_to_array(exp_types, ', ')) THEN 32  ELSE 0 END)
+    | (CASE WHEN 'Cable Installation' = ANY (string_to_array(exp_types, ', ')) THEN 64  ELSE 0 END)
+    | (CASE WHEN 'Other'              = ANY (string_to_array(exp_types, ', ')) THEN 128 ELSE 0 END)
+WHERE exp_mask = 0 AND exp_types IS NOT NULL AND exp_types <> 'None selected';
@@ -0,0 +1,18 @@
+-- Filter and sort pushdown for the registry (REGISTRY_SOURCE = "server").
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS exp_list TEXT[]
+    GENERATED ALWAYS AS (string_to_array(nullif(exp_types, 'None selected'), ', ')) STORED;
+
+-- Rank matches records.EXPERIENCE_LEVELS.
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS experience_rank SMALLINT
+    GENERATED ALWAYS AS (CASE experience
+        WHEN 'Less than 1 year' THEN 0
+        WHEN '1–2 years'        THEN 1
+        WHEN '3–5 years'        THEN 2
+        WHEN '5+ years'         THEN 3
+        WHEN '10+ years'        THEN 4
+        ELSE -1 END) STORED;
+
+CREATE INDEX IF NOT EXISTS applicants_exp_list_idx        ON applicants USING gin (exp_list);
+CREATE INDEX IF NOT EXISTS applicants_created_id_idx      ON applicants (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS applicants_state_created_idx   ON applicants (state, created_at DESC);
+CREATE INDEX IF NOT EXISTS applicants_exp_rank_created_idx ON applicants (experience_rank DESC, created_at DESC);
@@ -0,0 +1,6 @@
+-- Downscaled copies of each install photo, stored next to the original in the
+-- applicant-photos bucket. Older rows are filled in by `python photos.py`.
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS photo1_medium_url TEXT;
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS photo1_thumb_url TEXT;
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS photo2_medium_url TEXT;
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS photo2_thumb_url TEXT;
@@ -0,0 +1,3 @@
+-- Idempotency key for submissions delivered through the outbox (outbox.py).
+-- Retried batches upsert with ON CONFLICT (submission_key) DO NOTHING.
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS submission_key TEXT UNIQUE;
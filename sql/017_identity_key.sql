@@ -0,0 +1,15 @@
+-- Duplicate detection (dedup.py). identity_key = last 10 phone digits | lower-cased email,
+-- matching dedup.identity_key(); NULL when either part is missing.
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS identity_key TEXT
+    GENERATED ALWAYS AS (
+        nullif(right(regexp_replace(coalesce(phone, ''), '\D', '', 'g'), 10), '')
+        || '|' || nullif(lower(btrim(coalesce(email, ''))), '')
+    ) STORED;
+
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS duplicate_of BIGINT REFERENCES applicants (id) ON DELETE SET NULL;
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS submission_count INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS last_submission_key TEXT;
+
+-- Submit-time lookup of the canonical (oldest, unflagged) row per identity.
+CREATE INDEX IF NOT EXISTS applicants_identity_key_idx
+    ON applicants (identity_key, created_at) WHERE duplicate_of IS NULL;
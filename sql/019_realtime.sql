@@ -0,0 +1,3 @@
+-- Live registry updates (REGISTRY_FEED = "realtime"): stream applicants row changes
+-- to Supabase Realtime. Deletes carry the primary key under the default replica identity.
+ALTER PUBLICATION supabase_realtime ADD TABLE applicants;
@@ -0,0 +1,107 @@
+-- Recruiting funnel rollups for the Analytics tab (analytics.py).
+-- Triggers keep them current on insert, status/state change and delete, so every
+-- chart reads a few rollup rows per day instead of scanning applicants.
+
+-- Stages an applicant has ever reached, one bit per applicants.STATUS_LIST entry.
+-- Reaching a pipeline stage implies the ones before it; REJECTED only adds its own bit.
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS stages_reached SMALLINT NOT NULL DEFAULT 0;
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS contacted_at TIMESTAMPTZ;
+
+CREATE TABLE IF NOT EXISTS applicant_stages (
+    stage TEXT PRIMARY KEY,
+    bit   SMALLINT NOT NULL
+);
+INSERT INTO applicant_stages VALUES
+    ('NEW', 1), ('REVIEWED', 2), ('CONTACTED', 4), ('INTERVIEW', 8), ('HIRED', 16), ('REJECTED', 32)
+ON CONFLICT (stage) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION stage_bits(s TEXT) RETURNS SMALLINT
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT (CASE s WHEN 'NEW' THEN 1 WHEN 'REVIEWED' THEN 3 WHEN 'CONTACTED' THEN 7
+                   WHEN 'INTERVIEW' THEN 15 WHEN 'HIRED' THEN 31 WHEN 'REJECTED' THEN 33 ELSE 0 END)::smallint;
+$$;
+
+-- Applicants by intake day (UTC), state and current status.
+CREATE TABLE IF NOT EXISTS applicant_cohorts (
+    day    DATE    NOT NULL,
+    state  TEXT    NOT NULL,
+    status TEXT    NOT NULL,
+    n      INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, state, status)
+);
+
+-- Applicants by intake day and state that ever reached each stage. `timed` / `hours`
+-- cover rows with a known contacted_at, for CONTACTED only: mean time to contact.
+CREATE TABLE IF NOT EXISTS applicant_stage_counts (
+    day   DATE    NOT NULL,
+    state TEXT    NOT NULL,
+    stage TEXT    NOT NULL,
+    n     INTEGER NOT NULL DEFAULT 0,
+    timed INTEGER NOT NULL DEFAULT 0,
+    hours DOUBLE PRECISION NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, state, stage)
+);
+
+-- Backfill before the triggers exist: history is unknown, so the current status stands in for it.
+UPDATE applicants SET stages_reached = stage_bits(status) WHERE stages_reached = 0;
+
+TRUNCATE applicant_cohorts, applicant_stage_counts;
+INSERT INTO applicant_cohorts (day, state, status, n)
+SELECT (created_at AT TIME ZONE 'UTC')::date, coalesce(state, ''), status, count(*)
+FROM applicants GROUP BY 1, 2, 3;
+INSERT INTO applicant_stage_counts (day, state, stage, n)
+SELECT (a.created_at AT TIME ZONE 'UTC')::date, coalesce(a.state, ''), s.stage, count(*)
+FROM applicants a JOIN applicant_stages s ON a.stages_reached & s.bit <> 0
+GROUP BY 1, 2, 3;
+
+-- ── Maintenance ──
+CREATE OR REPLACE FUNCTION track_stages() RETURNS trigger AS $$
+BEGIN
+    NEW.stages_reached = NEW.stages_reached | stage_bits(NEW.status);
+    IF NEW.stages_reached & 4 <> 0 AND NEW.contacted_at IS NULL
+       AND (TG_OP = 'INSERT' OR OLD.stages_reached & 4 = 0) THEN
+        NEW.contacted_at = now();
+    END IF;
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS applicants_stages ON applicants;
+CREATE TRIGGER applicants_stages BEFORE INSERT OR UPDATE OF status ON applicants
+FOR EACH ROW EXECUTE FUNCTION track_stages();
+
+CREATE OR REPLACE FUNCTION roll_applicant(r applicants, sign INTEGER) RETURNS void AS $$
+DECLARE
+    d  DATE := (r.created_at AT TIME ZONE 'UTC')::date;
+    st TEXT := coalesce(r.state, '');
+BEGIN
+    INSERT INTO applicant_cohorts AS c (day, state, status, n) VALUES (d, st, r.status, sign)
+    ON CONFLICT (day, state, status) DO UPDATE SET n = c.n + excluded.n;
+
+    INSERT INTO applicant_stage_counts AS c (day, state, stage, n, timed, hours)
+    SELECT d, st, s.stage, sign,
+           CASE WHEN s.stage = 'CONTACTED' AND r.contacted_at IS NOT NULL THEN sign ELSE 0 END,
+           CASE WHEN s.stage = 'CONTACTED' AND r.contacted_at IS NOT NULL
+                THEN sign * extract(epoch FROM r.contacted_at - r.created_at) / 3600 ELSE 0 END
+    FROM applicant_stages s WHERE r.stages_reached & s.bit <> 0
+    ON CONFLICT (day, state, stage) DO UPDATE
+        SET n = c.n + excluded.n, timed = c.timed + excluded.timed, hours = c.hours + excluded.hours;
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION roll_applicants() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN PERFORM roll_applicant(OLD, -1); END IF;
+    IF TG_OP <> 'DELETE' THEN PERFORM roll_applicant(NEW, 1); END IF;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS applicants_rollups ON applicants;
+CREATE TRIGGER applicants_rollups
+AFTER INSERT OR DELETE OR UPDATE OF status, state, created_at, stages_reached, contacted_at ON applicants
+FOR EACH ROW EXECUTE FUNCTION roll_applicants();
+
+ALTER TABLE applicant_stages ENABLE ROW LEVEL SECURITY;
+ALTER TABLE applicant_cohorts ENABLE ROW LEVEL SECURITY;
+ALTER TABLE applicant_stage_counts ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "Anon stage read" ON applicant_stages FOR SELECT TO anon USING (true);
+CREATE POLICY "Anon cohort read" ON applicant_cohorts FOR SELECT TO anon USING (true);
+CREATE POLICY "Anon stage count read" ON applicant_stage_counts FOR SELECT TO anon USING (true);
@@ -0,0 +1,110 @@
+-- Append-only history of status and notes changes (events.py).
+-- Rows are written by triggers on applicants, so every write path is covered; the
+-- current state per applicant is a compacted snapshot plus the events after it.
+
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS status_since TIMESTAMPTZ;
+-- Best guess for rows that predate the log: their last update.
+UPDATE applicants SET status_since = CASE WHEN status = 'NEW' THEN created_at ELSE updated_at END
+WHERE status_since IS NULL;
+
+CREATE TABLE IF NOT EXISTS applicant_events (
+    seq          BIGSERIAL PRIMARY KEY,
+    applicant_id BIGINT      NOT NULL,
+    at           TIMESTAMPTZ NOT NULL DEFAULT now(),
+    kind         TEXT        NOT NULL CHECK (kind IN ('imported', 'created', 'status', 'notes', 'deleted')),
+    from_status  TEXT,
+    to_status    TEXT,
+    -- For status events: when from_status was entered, so time in stage is at - entered_at.
+    entered_at   TIMESTAMPTZ,
+    notes        TEXT
+);
+-- Per-applicant replay from a snapshot's seq onward.
+CREATE INDEX IF NOT EXISTS applicant_events_applicant_seq_idx ON applicant_events (applicant_id, seq);
+-- "How long did INTERVIEW -> HIRED take last month": one range scan per transition.
+CREATE INDEX IF NOT EXISTS applicant_events_transition_idx
+    ON applicant_events (from_status, to_status, at) WHERE kind = 'status';
+
+CREATE TABLE IF NOT EXISTS applicant_snapshots (
+    applicant_id BIGINT      PRIMARY KEY,
+    seq          BIGINT      NOT NULL,   -- last event folded in
+    snapshot     JSONB       NOT NULL,
+    taken_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS applicant_snapshots_seq_idx ON applicant_snapshots (seq);
+
+-- Existing rows start their history with one event carrying their current state.
+INSERT INTO applicant_events (applicant_id, at, kind, to_status, notes)
+SELECT id, status_since, 'imported', status, notes FROM applicants
+WHERE NOT EXISTS (SELECT 1 FROM applicant_events);
+
+-- ── Writers ──
+CREATE OR REPLACE FUNCTION stamp_status_since() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        NEW.status_since = coalesce(NEW.status_since, NEW.created_at, now());
+    ELSIF NEW.status IS DISTINCT FROM OLD.status THEN
+        NEW.status_since = now();
+    END IF;
+    RETURN NEW;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS applicants_status_since ON applicants;
+CREATE TRIGGER applicants_status_since BEFORE INSERT OR UPDATE OF status ON applicants
+FOR EACH ROW EXECUTE FUNCTION stamp_status_since();
+
+CREATE OR REPLACE FUNCTION log_applicant_event() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO applicant_events (applicant_id, at, kind, to_status, notes)
+        VALUES (NEW.id, NEW.status_since, 'created', NEW.status, NEW.notes);
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO applicant_events (applicant_id, kind, from_status, entered_at)
+        VALUES (OLD.id, 'deleted', OLD.status, OLD.status_since);
+    ELSE
+        IF NEW.status IS DISTINCT FROM OLD.status THEN
+            INSERT INTO applicant_events (applicant_id, at, kind, from_status, to_status, entered_at)
+            VALUES (NEW.id, NEW.status_since, 'status', OLD.status, NEW.status, OLD.status_since);
+        END IF;
+        IF NEW.notes IS DISTINCT FROM OLD.notes THEN
+            INSERT INTO applicant_events (applicant_id, kind, notes) VALUES (NEW.id, 'notes', NEW.notes);
+        END IF;
+    END IF;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS applicants_events ON applicants;
+CREATE TRIGGER applicants_events AFTER INSERT OR DELETE OR UPDATE OF status, notes ON applicants
+FOR EACH ROW EXECUTE FUNCTION log_applicant_event();
+
+CREATE OR REPLACE FUNCTION forbid_event_changes() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'applicant_events is append-only';
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS applicant_events_append_only ON applicant_events;
+CREATE TRIGGER applicant_events_append_only BEFORE UPDATE OR DELETE OR TRUNCATE ON applicant_events
+FOR EACH STATEMENT EXECUTE FUNCTION forbid_event_changes();
+
+-- ── Readers ──
+-- Durations of direct from_stage -> to_stage moves made in [since, until), in hours.
+CREATE OR REPLACE FUNCTION stage_transition_stats(from_stage TEXT, to_stage TEXT,
+                                                  since TIMESTAMPTZ DEFAULT '-infinity',
+                                                  until TIMESTAMPTZ DEFAULT now())
+RETURNS TABLE (n BIGINT, mean_hours DOUBLE PRECISION, p50_hours DOUBLE PRECISION, p90_hours DOUBLE PRECISION)
+LANGUAGE sql STABLE AS $$
+    SELECT count(*), avg(h),
+           percentile_cont(0.5) WITHIN GROUP (ORDER BY h),
+           percentile_cont(0.9) WITHIN GROUP (ORDER BY h)
+    FROM (SELECT extract(epoch FROM e.at - e.entered_at) / 3600 AS h
+          FROM applicant_events e
+          WHERE e.kind = 'status' AND e.from_status = from_stage AND e.to_status = to_stage
+            AND e.at >= since AND e.at < until AND e.entered_at IS NOT NULL) t;
+$$;
+
+GRANT EXECUTE ON FUNCTION stage_transition_stats(TEXT, TEXT, TIMESTAMPTZ, TIMESTAMPTZ) TO anon;
+
+ALTER TABLE applicant_events ENABLE ROW LEVEL SECURITY;
+ALTER TABLE applicant_snapshots ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "Anon event read" ON applicant_events FOR SELECT TO anon USING (true);
+-- Snapshots are rebuilt by `python events.py compact` with the same key the apps use.
+CREATE POLICY "Anon snapshot access" ON applicant_snapshots FOR ALL TO anon USING (true) WITH CHECK (true);
@@ -0,0 +1,14 @@
+-- Normalized service areas for dispatch (geo.py).
+-- county_fips: the counties an applicant listed, resolved to 5-digit FIPS codes.
+-- coverage_fips: those plus every county within service_miles of them, so "who covers
+-- this county" is a single GIN lookup. Filled at submit time, and by `python geo.py index`
+-- for older rows; NULL means not indexed yet.
+
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS county_fips   TEXT[];
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS service_miles SMALLINT;
+ALTER TABLE applicants ADD COLUMN IF NOT EXISTS coverage_fips TEXT[];
+
+-- .contains("coverage_fips", ["12127"]) is `coverage_fips @> '{12127}'`.
+CREATE INDEX IF NOT EXISTS applicants_coverage_fips_idx ON applicants USING GIN (coverage_fips);
+-- Keyset for the backfill: rows still waiting to be indexed.
+CREATE INDEX IF NOT EXISTS applicants_unindexed_idx ON applicants (id) WHERE coverage_fips IS NULL;
@@ -0,0 +1,240 @@
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from metrics import span
+from records import Applicant
+from search import SearchIndex
+from applicants import (
+    LIST_COLUMNS, iter_pages, iter_changes, fetch_tombstones, fetch_applicant, count_total,
+    update_applicant, delete_applicant, update_many, delete_many,
+)
+
+# Rows committed slightly out of timestamp order are picked up by re-reading
+# a short window behind the high-water mark; merges are idempotent.
+SYNC_OVERLAP = timedelta(seconds=5)
+# Memoized derived values across all sessions (one per key and tag, e.g. per registry query).
+DERIVED_SLOTS = 64
+
+
+def _rewind(iso):
+    return (datetime.fromisoformat(iso.replace("Z", "+00:00")) - SYNC_OVERLAP).isoformat()
+
+
+def row_key(aid):
+    # Ids arrive as ints from Supabase but as strings from query params and widget keys.
+    if isinstance(aid, str) and aid.lstrip("-").isdigit():
+        return int(aid)
+    return aid
+
+
+_OLDEST = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class ApplicantStore:
+    """Process-local replica of the applicants table kept current by delta sync.
+
+    Rows are held as `Applicant` records keyed by id; `details` caches full
+    records (notes, photos) for the detail view.
+    """
+
+    def __init__(self, sb, columns=LIST_COLUMNS):
+        self.sb = sb
+        self.columns = tuple(dict.fromkeys(columns + ("updated_at",)))
+        self.rows = {}
+        self.details = {}
+        self.search_index = SearchIndex()
+        self.hwm = None
+        self.tomb_hwm = None
+        self.version = 0
+        self.synced_at = 0.0
+        self.stats = {"full": 0, "delta": 0, "rows": 0, "tombstones": 0, "hits": 0, "misses": 0, "writes": 0, "pushed": 0}
+        # With a live change feed attached, refresh() skips polling until the feed drops.
+        self.live = False
+        self.stale = False
+        self._lock = threading.RLock()
+        self._derived = {}
+
+    # ── Sync ──
+    def resync(self):
+        with self._lock, span("store.resync"):
+            rows, hwm = {}, None
+            for page in iter_pages(self.sb, columns=self.columns):
+                for r in page:
+                    rows[r["id"]] = Applicant.from_row(r)
+                    if r.get("updated_at") and r["updated_at"] > (hwm or ""):
+                        hwm = r["updated_at"]
+            tombs = fetch_tombstones(self.sb)
+            self.rows = rows
+            self.details.clear()
+            self.search_index = SearchIndex(rows.values())
+            self.hwm = hwm
+            self.tomb_hwm = tombs[-1]["deleted_at"] if tombs else None
+            self.stats["full"] += 1
+            self._touched()
+
+    def refresh(self, max_age=0):
+        with self._lock:
+            if self.hwm is None and not self.rows:
+                return self.resync()
+            if self.live and not self.stale:
+                return
+            if time.monotonic() - self.synced_at < max_age and not self.stale:
+                return
+            self.stale = False
+            changed = 0
+            since = _rewind(self.hwm) if self.hwm else "epoch"
+            for page in iter_changes(self.sb, since, columns=self.columns):
+                for r in page:
+                    old = self.rows.get(r["id"])
+                    if old is None or old.updated_at != r["updated_at"]:
+                        rec = self.rows[r["id"]] = Applicant.from_row(r)
+                        self.search_index.add(rec)
+                        self.details.pop(r["id"], None)
+                        changed += 1
+                    if r["updated_at"] > (self.hwm or ""):
+                        self.hwm = r["updated_at"]
+            for t in fetch_tombstones(self.sb, _rewind(self.tomb_hwm) if self.tomb_hwm else None):
+                self.details.pop(t["id"], None)
+                self.search_index.remove(t["id"])
+                if self.rows.pop(t["id"], None) is not None:
+                    changed += 1
+                    self.stats["tombstones"] += 1
+                self.tomb_hwm = t["deleted_at"]
+            self.stats["delta"] += 1
+            self.stats["rows"] += changed
+            if count_total(self.sb) != len(self.rows):
+                return self.resync()
+            self.synced_at = time.monotonic()
+            if changed:
+                self.version += 1
+
+    # ── Push ──
+    def attach(self, feed):
+        feed.subscribe(self.apply_change, self._feed_state)
+
+    def _feed_state(self, live):
+        with self._lock:
+            # Anything committed while the feed was down or (re)joining is caught by one delta sync.
+            self.live = live
+            self.stale = True
+
+    def apply_change(self, change):
+        with self._lock:
+            if self.hwm is None and not self.rows:
+                return
+            self.stats["pushed"] += 1
+            if change.kind == "DELETE":
+                return self._drop(row_key(change.id))
+            r = change.record
+            rec = self.rows[r["id"]] = Applicant.from_row({k: r.get(k) for k in self.columns})
+            self.search_index.add(rec)
+            self.details.pop(r["id"], None)
+            self.version += 1
+
+    def _touched(self):
+        self.version += 1
+        self.synced_at = time.monotonic()
+
+    # ── Write-through ──
+    # Edits patch or drop the one affected entry instead of invalidating the replica.
+    def update(self, aid, fields):
+        aid = row_key(aid)
+        row = update_applicant(self.sb, aid, fields)
+        with self._lock:
+            self.stats["writes"] += 1
+            if row is None:
+                return self._drop(aid)
+            rec = self.details[aid] = Applicant.from_row(row)
+            if aid in self.rows:
+                self.rows[aid] = Applicant.from_row({k: row.get(k) for k in self.columns})
+                self.search_index.add(self.rows[aid])
+                self.version += 1
+        return rec
+
+    def delete(self, aid):
+        aid = row_key(aid)
+        delete_applicant(self.sb, aid)
+        with self._lock:
+            self.stats["writes"] += 1
+            self._drop(aid)
+
+    def update_many(self, ids, fields):
+        # Bulk edits patch each affected entry but bump the version once per batch.
+        ids = [row_key(a) for a in ids]
+        rows = update_many(self.sb, ids, fields)
+        with self._lock:
+            self.stats["writes"] += 1
+            for row in rows:
+                aid = row["id"]
+                self.details.pop(aid, None)
+                if aid in self.rows:
+                    self.rows[aid] = Applicant.from_row({k: row.get(k) for k in self.columns})
+                    self.search_index.add(self.rows[aid])
+            self.version += 1
+        return len(rows)
+
+    def delete_many(self, ids):
+        ids = [row_key(a) for a in ids]
+        delete_many(self.sb, ids)
+        with self._lock:
+            self.stats["writes"] += 1
+            for aid in ids:
+                self.details.pop(aid, None)
+                self.search_index.remove(aid)
+                self.rows.pop(aid, None)
+            self.version += 1
+
+    def _drop(self, aid):
+        self.details.pop(aid, None)
+        self.search_index.remove(aid)
+        if self.rows.pop(aid, None) is not None:
+            self.version += 1
+
+    # ── Reads ──
+    def get(self, aid):
+        aid = row_key(aid)
+        if not isinstance(aid, int):
+            return None  # ids are bigints; anything else would be a query error, not a miss
+        with self._lock:
+            if aid in self.details:
+                self.stats["hits"] += 1
+                return self.details[aid]
+            self.stats["misses"] += 1
+        row = fetch_applicant(self.sb, aid)
+        if row is None:
+            return None
+        rec = Applicant.from_row(row)
+        with self._lock:
+            self.details[aid] = rec
+        return rec
+
+    def derived(self, key, build, tag=None):
+        # Memoize a value computed from the replica per (key, tag) until the data version changes.
+        with self._lock:
+            slot = (key, tag)
+            hit = self._derived.get(slot)
+            if hit and hit[0] == self.version:
+                return hit[1]
+            with span(f"store.build.{key}"):
+                val = build()
+            # Older versions are never read again; past that, the least recently built slot goes.
+            self._derived = {k: v for k, v in self._derived.items() if v[0] == self.version and k != slot}
+            self._derived[slot] = (self.version, val)
+            while len(self._derived) > DERIVED_SLOTS:
+                del self._derived[next(iter(self._derived))]
+            return val
+
+    @contextmanager
+    def pinned(self):
+        # Holds off syncs and feed pushes, so several reads inside see one version.
+        with self._lock:
+            yield self
+
+    def ordered(self):
+        return self.derived("ordered", lambda: sorted(
+            self.rows.values(), key=lambda a: (a.created or _OLDEST, a.id), reverse=True))
+
+    def __len__(self):
+        return len(self.rows)
@@ -0,0 +1,23 @@
+import pytest
+
+from applicants import fetch_site_settings, save_site_settings
+from bench.fake_supabase import FakeSupabase
+from localdb import LocalClient
+
+
+@pytest.fixture(params=["fake", "sqlite"])
+def sb(request, tmp_path):
+    return FakeSupabase() if request.param == "fake" else LocalClient(str(tmp_path / "settings.db"))
+
+
+def test_site_settings_missing():
+    assert fetch_site_settings(FakeSupabase()) is None
+
+
+def test_site_settings_round_trip(sb):
+    save_site_settings(sb, {"hero_title": "Starlink Installer", "earning_min": "$1,200"})
+    save_site_settings(sb, {"hero_title": "Satellite Installer"})
+    rows = sb.table("site_settings").select("*").execute().data
+    assert len(rows) == 1
+    got = fetch_site_settings(sb)
+    assert got["id"] == 1 and got["hero_title"] == "Satellite Installer" and got["last_updated"]
@@ -0,0 +1,99 @@
+import pytest
+
+import events
+from bench.data import applicant_rows
+from localdb import LocalClient, pull
+
+STEPS = ["REVIEWED", "CONTACTED", "INTERVIEW", "REJECTED", "INTERVIEW", "HIRED"]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # Nothing is too young to fold in a test.
+    monkeypatch.setattr(events, "COMPACT_LAG", events.timedelta(0))
+    db = LocalClient(str(tmp_path / "events.db"))
+    rows = applicant_rows(12, seed=3)
+    for r in rows:
+        r.pop("id")
+    db.table("applicants").insert(rows).execute()
+    return db
+
+
+def _ids(db):
+    return [r["id"] for r in db.table("applicants").select("id").order("id").execute().data]
+
+
+def _row(db, aid):
+    return db.table("applicants").select("status,notes,status_since").eq("id", aid).execute().data[0]
+
+
+def _churn(db, ids, steps):
+    for k, s in enumerate(steps):
+        for aid in ids[k % 3::3]:
+            db.table("applicants").update({"status": s}).eq("id", aid).execute()
+        db.table("applicants").update({"notes": f"round {k}"}).eq("id", ids[k % len(ids)]).execute()
+
+
+def test_replay_matches_row_across_compactions(db):
+    ids = _ids(db)
+    _churn(db, ids, STEPS[:3])
+    assert events.compact(db, log=lambda m: None) > 0
+    _churn(db, ids, STEPS[3:])
+    for aid in ids:
+        state, row = events.current_state(db, aid), _row(db, aid)
+        assert state["status"] == row["status"]
+        assert state["notes"] == (row["notes"] or "")
+        assert events.parse_ts(state["status_since"]) == events.parse_ts(row["status_since"])
+
+
+def test_overlapping_compaction_does_not_refold(db, monkeypatch):
+    ids = _ids(db)
+    _churn(db, ids, STEPS[:3])
+    events.compact(db, log=lambda m: None)
+    stale = events._watermark(db)
+    _churn(db, ids, STEPS[3:])
+    events.compact(db, log=lambda m: None)
+    before = {aid: events.current_state(db, aid) for aid in ids}
+    assert max(s["moves"] for s in before.values()) > 1
+    # A second worker that read the watermark before the first one finished.
+    monkeypatch.setattr(events, "_watermark", lambda sb: stale)
+    events.compact(db, log=lambda m: None)
+    assert {aid: events.current_state(db, aid) for aid in ids} == before
+
+
+def test_compactor_thread_folds_the_log(db):
+    _churn(db, _ids(db), STEPS[:2])
+    worker = events.Compactor(db, every=0.05)
+    worker.start()
+    deadline = events.time.monotonic() + 5
+    while not events._watermark(db) and events.time.monotonic() < deadline:
+        events.time.sleep(0.01)
+    assert events._watermark(db) == db.conn.execute("SELECT max(seq) FROM applicant_events").fetchone()[0]
+
+
+def test_compactor_survives_a_missing_log(tmp_path):
+    class Broken:
+        def table(self, name):
+            raise RuntimeError("relation applicant_events does not exist")
+    worker = events.Compactor(Broken(), every=60)
+    assert worker.run_once() == 0
+    assert worker.next_run > events.time.monotonic() + 30
+
+
+def test_pull_keeps_remote_events_when_local_log_runs_ahead(db, tmp_path):
+    replica = LocalClient(str(tmp_path / "replica.db"))
+    pull(db, replica, log=lambda m: None)
+    remote = lambda: db.conn.execute("SELECT count(*) FROM applicant_events").fetchone()[0]
+    pulled = lambda: replica.conn.execute("SELECT count(*) FROM applicant_events WHERE source_seq IS NOT NULL").fetchone()[0]
+    assert pulled() == remote()
+
+    # Local writes take the seqs the remote log will use next.
+    aid = _ids(replica)[0]
+    replica.table("applicants").update({"notes": "local"}).eq("id", aid).execute()
+    _churn(db, _ids(db), STEPS[:2])
+    pull(db, replica, log=lambda m: None)
+    assert pulled() == remote()
+    assert replica.conn.execute("SELECT count(*) FROM applicant_events WHERE source_seq IS NULL AND notes = 'local'").fetchone()[0] == 1
+    # Nothing new upstream: nothing fetched twice.
+    pull(db, replica, log=lambda m: None)
+    assert pulled() == remote()
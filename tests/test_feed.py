@@ -0,0 +1,62 @@
+from bench.data import applicant_rows
+from bench.fake_supabase import FakeSupabase
+from feed import LocalFeed
+from store import ApplicantStore
+
+
+def _store(n=20):
+    rows = applicant_rows(n, seed=7)
+    store = ApplicantStore(FakeSupabase([dict(r) for r in rows]))
+    store.resync()
+    return store, rows
+
+
+def test_attach_marks_store_stale_on_each_state_change():
+    store, _ = _store()
+    feed = LocalFeed()
+    store.attach(feed)
+    assert store.stale and not store.live
+    store.stale = False
+    feed.start()
+    assert store.stale and store.live
+    store.refresh()
+    assert not store.stale
+
+
+def test_insert_update_delete_reach_the_store():
+    store, rows = _store()
+    feed = LocalFeed().start()
+    store.attach(feed)
+    v = store.version
+
+    new = {**rows[0], "id": 1000, "name": "Pushed Row", "updated_at": rows[-1]["updated_at"]}
+    feed.insert(new)
+    assert store.version == v + 1
+    assert store.rows[1000].name == "Pushed Row"
+    assert 1000 in store.search_index.text
+
+    feed.update({**new, "name": "Renamed", "status": "HIRED"})
+    assert store.version == v + 2
+    assert store.rows[1000].name == "Renamed" and store.rows[1000].status == "HIRED"
+
+    feed.delete(1000)
+    assert store.version == v + 3
+    assert 1000 not in store.rows and 1000 not in store.search_index.text
+    assert feed.events == 3 and store.stats["pushed"] == 3
+
+
+def test_delete_of_unknown_row_leaves_version():
+    store, _ = _store()
+    feed = LocalFeed().start()
+    store.attach(feed)
+    v = store.version
+    feed.delete(424242)
+    assert store.version == v
+
+
+def test_changes_before_first_sync_are_ignored():
+    store = ApplicantStore(FakeSupabase())
+    feed = LocalFeed().start()
+    store.attach(feed)
+    feed.insert({"id": 1, "name": "Early"})
+    assert not store.rows and store.version == 0
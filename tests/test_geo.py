@@ -0,0 +1,118 @@
+import pytest
+
+import geo
+from bench.fake_supabase import FakeSupabase
+from geo import County, CountyIndex
+from localdb import LocalClient
+
+# Rows copied from data/counties.txt.
+COUNTIES = [
+    County("06059", "CA", "Orange County", 33.702974, -117.761079),
+    County("12069", "FL", "Lake County", 28.761544, -81.711253),
+    County("12086", "FL", "Miami-Dade County", 25.615876, -80.563712),
+    County("12095", "FL", "Orange County", 28.514427, -81.323517),
+    County("12109", "FL", "St. Johns County", 29.901643, -81.440668),
+    County("12117", "FL", "Seminole County", 28.716974, -81.236298),
+    County("12127", "FL", "Volusia County", 29.058419, -81.181923),
+    County("30049", "MT", "Lewis and Clark County", 47.122448, -112.390454),
+    County("36047", "NY", "Kings County", 40.639538, -73.938528),
+    County("36061", "NY", "New York County", 40.779615, -73.966565),
+    County("51159", "VA", "Richmond County", 37.943384, -76.726865),
+    County("51760", "VA", "Richmond city", 37.529439, -77.475537),
+]
+ORANGE, SEMINOLE, VOLUSIA, LAKE, ST_JOHNS, DADE = "12095", "12117", "12127", "12069", "12109", "12086"
+
+
+@pytest.fixture
+def idx(monkeypatch):
+    idx = CountyIndex(COUNTIES)
+    monkeypatch.setattr(geo, "county_index", lambda path=geo.COUNTY_DATA: idx)
+    return idx
+
+
+@pytest.mark.parametrize("state, text, fips", [
+    ("Florida", "Orange, Seminole", [ORANGE, SEMINOLE]),
+    ("Florida", "Orange and Seminole counties", [ORANGE, SEMINOLE]),
+    ("FL", "St. Johns Co / saint johns county; Volusia FL", [ST_JOHNS, VOLUSIA]),
+    ("Montana", "Lewis and Clark", ["30049"]),
+    ("Virginia", "Richmond", ["51159"]),
+    ("Virginia", "Richmond city", ["51760"]),
+    ("", "Volusia", [VOLUSIA]),
+    ("California", "Orange County", ["06059"]),
+    ("Florida", "Florida, Orange", [ORANGE]),
+    ("New York", "New York", ["36061"]),
+    ("NY", "Kings, New York", ["36047", "36061"]),
+])
+def test_resolve(idx, state, text, fips):
+    assert idx.resolve(state, text) == (fips, [])
+
+
+def test_resolve_reports_misses_and_statewide(idx):
+    assert idx.resolve("Florida", "Orange, Narnia") == ([ORANGE], ["Narnia"])
+    # Without a state a name only resolves if it is unique.
+    assert idx.resolve("", "Orange") == ([], ["Orange"])
+    assert sorted(idx.resolve("Florida", "Anywhere")[0]) == sorted(c.fips for c in COUNTIES if c.state == "FL")
+
+
+def test_coverage_adds_counties_within_reach(idx):
+    assert idx.coverage([ORANGE], 0) == [ORANGE]
+    assert idx.coverage([ORANGE], 25) == sorted([ORANGE, SEMINOLE])
+    assert idx.coverage([ORANGE], 50) == sorted([ORANGE, SEMINOLE, LAKE, VOLUSIA])
+    assert DADE not in idx.coverage([ORANGE, ST_JOHNS], 150)
+
+
+def test_service_area_columns(idx):
+    area, missed = idx.service_area("Florida", "Volusia counties, Atlantis", "Up to 25 miles")
+    assert area == {"county_fips": [VOLUSIA], "service_miles": 25, "coverage_fips": [SEMINOLE, VOLUSIA]}
+    assert missed == ["Atlantis"]
+
+
+def _applicant(i, counties, radius, status="NEW"):
+    return {"id": i, "created_at": f"2025-01-01T00:00:{i:02d}+00:00", "name": f"Tech {i}", "phone": "", "email": "",
+            "state": "Florida", "counties": counties, "radius": radius, "status": status,
+            "experience": "", "exp_types": "", "vehicle": "", "ladder": "", "insurance": ""}
+
+
+@pytest.fixture(params=["fake", "sqlite"])
+def sb(request, tmp_path):
+    rows = [
+        _applicant(1, "St. Johns", "100+ miles"),
+        _applicant(2, "Seminole", "Up to 25 miles"),
+        _applicant(3, "Volusia", "Up to 50 miles"),
+        _applicant(4, "Orange", "", status="REJECTED"),
+        _applicant(5, "Miami-Dade", "Up to 50 miles"),
+        _applicant(6, "Orange", ""),
+    ]
+    if request.param == "fake":
+        return FakeSupabase(rows)
+    db = LocalClient(str(tmp_path / "geo.db"))
+    db.table("applicants").insert(rows).execute()
+    return db
+
+
+def test_covering_returns_nearest_first(idx, sb):
+    assert geo.index_applicants(sb, log=lambda m: None)[0] == 6
+    # Indexed rows are skipped on the next pass.
+    assert geo.index_applicants(sb, log=lambda m: None)[0] == 0
+
+    rows = geo.covering(sb, ORANGE)
+    assert {r["id"] for r in rows[:2]} == {4, 6} and [r["id"] for r in rows[2:]] == [2, 3, 1]
+    assert rows[0]["miles"] == 0 and rows[-1]["miles"] == pytest.approx(96.1, abs=0.1)
+    assert [r["id"] for r in geo.covering(sb, ORANGE, statuses=["NEW"])] == [6, 2, 3, 1]
+    assert {r["id"] for r in geo.covering(sb, ORANGE, limit=2)} == {4, 6}
+
+
+def test_bundled_county_file_loads():
+    idx = CountyIndex.load(geo.COUNTY_DATA)
+    assert len(idx.by_fips) > 3000
+    assert idx.by_fips[ORANGE].label == "Orange County, FL"
+    assert {c.state for c in idx.by_fips.values()} == set(geo.STATE_NAMES)
+
+
+def test_local_replica_loads_unindexed_rows(idx, tmp_path):
+    # Rows pulled from Supabase before `geo.py index` carry NULL service-area columns.
+    db = LocalClient(str(tmp_path / "replica.db"))
+    db.load([{**_applicant(1, "Orange", ""), "county_fips": None, "service_miles": None, "coverage_fips": None}])
+    assert db.table("applicants").select("id").is_("coverage_fips", "null").execute().data == [{"id": 1}]
+    assert geo.index_applicants(db, log=lambda m: None)[0] == 1
+    assert [r["id"] for r in geo.covering(db, ORANGE)] == [1]
@@ -0,0 +1,27 @@
+from bench.data import applicant_rows
+from localdb import LocalClient, pull
+
+
+def _status(db, aid):
+    rows = db.table("applicants").select("status").eq("id", aid).execute().data
+    return rows[0]["status"] if rows else None
+
+
+def test_pull_resumes_from_remote_mark_after_local_edits(tmp_path):
+    remote = LocalClient(str(tmp_path / "remote.db"))
+    remote.load(applicant_rows(30, seed=4))
+    replica = LocalClient(str(tmp_path / "replica.db"))
+    pull(remote, replica, log=lambda m: None)
+    assert replica.high_water() == remote.conn.execute("SELECT max(updated_at) FROM applicants").fetchone()[0]
+
+    remote.table("applicants").update({"status": "HIRED"}).eq("id", 3).execute()
+    remote.table("applicants").delete().eq("id", 4).execute()
+    # A later local edit stamps the replica's clock, ahead of both remote changes.
+    replica.table("applicants").update({"notes": "called back"}).eq("id", 5).execute()
+    mark = replica.high_water()
+    pull(remote, replica, log=lambda m: None)
+
+    assert _status(replica, 3) == "HIRED"
+    assert _status(replica, 4) is None
+    assert replica.table("applicants").select("notes").eq("id", 5).execute().data[0]["notes"] == "called back"
+    assert replica.high_water() > mark
@@ -0,0 +1,34 @@
+import urllib.request
+
+import pytest
+from streamlit.runtime.scriptrunner_utils.exceptions import StopException
+
+from metrics import Tracer, serve
+
+
+def test_span_records_reruns_cut_short():
+    tracer = Tracer()
+    with pytest.raises(StopException):
+        with tracer.span("rerun"):
+            raise StopException()
+    with pytest.raises(ValueError):
+        with tracer.span("rerun"):
+            raise ValueError
+    assert tracer.snapshot()["rerun"]["count"] == 2 and tracer.snapshot()["rerun"]["errors"] == 1
+
+
+def test_serve_binds_loopback_and_survives_a_taken_port():
+    tracer = Tracer()
+    with tracer.span("x"):
+        pass
+    server = serve(0, tracer)
+    try:
+        host, port = server.server_address
+        assert host == "127.0.0.1"
+        assert b'span="x"' in urllib.request.urlopen(f"http://{host}:{port}/metrics").read()
+        logged = []
+        assert serve(port, tracer, log=logged.append) is None
+        assert "metrics endpoint not started" in logged[0]
+    finally:
+        server.shutdown()
+        server.server_close()
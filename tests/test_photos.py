@@ -0,0 +1,20 @@
+import io
+
+from PIL import Image
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+
+from bench.fake_supabase import FakeSupabase
+from photos import VARIANTS, upload_photo
+
+
+def test_upload_photo_reads_the_uploaded_file_in_place():
+    buf = io.BytesIO()
+    Image.effect_noise((1200, 900), 64).convert("RGB").save(buf, "JPEG")
+    file = UploadedFile(UploadedFileRec("f1", "Roof Pic.jpg", "image/jpeg", buf.getvalue()), None)
+    file.read()  # a widget may have left the position at the end
+    sb = FakeSupabase()
+    urls = upload_photo(sb, file, file.name)
+    assert set(urls) == {""} | {name for name, _ in VARIANTS}
+    assert all(p.endswith(".webp") and "roof_pic" in p for p in sb.files)
+    # A retry after a failed upload starts from the same object.
+    assert upload_photo(sb, file, file.name).keys() == urls.keys()
@@ -0,0 +1,25 @@
+import pytest
+
+from bench.data import applicant_rows
+from bench.fake_supabase import FakeSupabase
+from localdb import LocalClient
+from records import Applicant
+from search import SearchIndex, search_ids
+
+ROWS = applicant_rows(2500, seed=11)
+
+
+@pytest.fixture(params=["fake", "sqlite"])
+def sb(request, tmp_path):
+    if request.param == "fake":
+        return FakeSupabase([dict(r) for r in ROWS])
+    db = LocalClient(str(tmp_path / "search.db"))
+    db.load([dict(r) for r in ROWS])
+    return db
+
+
+@pytest.mark.parametrize("q, least", [("gmail", 300), ("com", 2000), ("407", 1), ("orange co", 1)])
+def test_server_search_pages_through_every_match(sb, q, least):
+    want = SearchIndex(Applicant.from_row(r) for r in ROWS).search(q)
+    assert len(want) >= least
+    assert search_ids(sb, q, page=300) == want
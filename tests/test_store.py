@@ -0,0 +1,60 @@
+import threading
+
+from bench.data import applicant_rows
+from bench.fake_supabase import FakeSupabase
+from feed import LocalFeed
+from store import DERIVED_SLOTS, ApplicantStore
+
+
+def _store(n=30):
+    rows = applicant_rows(n, seed=11)
+    store = ApplicantStore(FakeSupabase([dict(r) for r in rows]))
+    store.resync()
+    return store, rows
+
+
+def test_derived_keeps_one_slot_per_tag():
+    store, _ = _store()
+    builds = []
+    def build(tag):
+        return lambda: builds.append(tag) or tag
+    for tag in ("a", "b", "a", "b"):
+        assert store.derived("members", build(tag), tag=tag) == tag
+    assert builds == ["a", "b"]
+
+
+def test_derived_rebuilds_after_version_change_and_stays_bounded():
+    store, _ = _store()
+    builds = []
+    store.derived("members", lambda: builds.append(1), tag="a")
+    store.version += 1
+    store.derived("members", lambda: builds.append(2), tag="a")
+    assert builds == [1, 2]
+    for i in range(DERIVED_SLOTS * 2):
+        store.derived("members", lambda: i, tag=i)
+    assert len(store._derived) <= DERIVED_SLOTS
+
+
+def test_pinned_holds_off_feed_changes():
+    store, rows = _store()
+    feed = LocalFeed().start()
+    store.attach(feed)
+    new = {**rows[0], "id": 5000, "updated_at": rows[-1]["updated_at"]}
+    with store.pinned():
+        v, ordered = store.version, store.ordered()
+        t = threading.Thread(target=feed.insert, args=(new,))
+        t.start()
+        t.join(0.2)
+        assert store.version == v and store.ordered() is ordered
+    t.join()
+    assert store.version == v + 1 and 5000 in store.rows
+
+
+def test_get_treats_bad_ids_as_missing():
+    store, rows = _store()
+    aid = rows[0]["id"]
+    assert store.get(str(aid)).id == aid
+    assert store.get(999999) is None
+    # Never reaches the bigint id column.
+    store.sb = None
+    assert store.get("abc") is None and store.get("") is None